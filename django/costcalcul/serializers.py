@@ -9,6 +9,7 @@ import logging
 from django.db import transaction
 from rest_framework import serializers
 from .recipe_item_serializers import RecipeItemSerializer
+from inventory.utils import record_movements
 
 
 
@@ -113,6 +114,8 @@ class RecipeSerializer(serializers.ModelSerializer):
                 ingredient=ingredient,
                 defaults={"remaining_stock": ingredient.purchase_quantity}
             )
+            if created:
+                record_movements("restock", [(inventory.id, ingredient.purchase_quantity)])  # ✅ 최초 입고 기록
 
             RecipeItem.objects.create(
                 recipe=recipe,
@@ -165,12 +168,10 @@ class RecipeSerializer(serializers.ModelSerializer):
 
         recipe_items = RecipeItem.objects.filter(recipe=instance)
         # print(f"📌 [to_representation] 연결된 RecipeItem 개수: {recipe_items.count()}")
-        for item in recipe_items:
-            print(f"🔗 {item.ingredient.name} - {item.quantity_used}")
 
         data["ingredients"] = [
             {
-                "ingredient_id": str(item.ingredient.id),
+                "ingredient_id": str(item.ingredient_id),
                 "required_amount": item.quantity_used
             }
             for item in recipe_items
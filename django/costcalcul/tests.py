@@ -1,3 +1,14 @@
-from django.test import TestCase
+from costcalcul.models import Recipe
+from livflow.testing import QueryBudgetTestCase
 
-# Create your tests here.
+
+class RecipeQueryBudgetTests(QueryBudgetTestCase):
+    def test_recipe_list(self):
+        self.assertQueryBudget(1, lambda client, store: client.get(f"/api/costcalcul/{store.id}/"))
+
+    def test_recipe_detail(self):
+        def request(client, store):
+            recipe = Recipe.objects.get(store=store, name="레시피 0")  # 모든 재료를 사용하는 레시피
+            return client.get(f"/api/costcalcul/{store.id}/{recipe.id}/")
+
+        self.assertQueryBudget(3, request)
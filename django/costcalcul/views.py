@@ -12,8 +12,11 @@ from drf_yasg.utils import swagger_auto_schema
 from decimal import Decimal
 import json
 from .utils import get_total_used_quantity
+from inventory.utils import record_movements
 from copy import deepcopy
-from pprint import pprint
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 # ✅ 특정 상점의 모든 레시피 조회
@@ -48,9 +51,7 @@ class StoreRecipeListView(APIView):
     def post(self, request, store_id):
         """✅ 새로운 레시피 추가"""
         raw_ingredients = request.data.get("ingredients")
-        print("\n🧪 [1단계] 원본 ingredients 타입:", type(raw_ingredients))
-        print("🧪 [1단계] 원본 ingredients 내용:")
-        pprint(raw_ingredients)
+        logger.debug("🧪 원본 ingredients (%s): %r", type(raw_ingredients).__name__, raw_ingredients)
 
         # ✅ 문자열로 오면 파싱
         try:
@@ -96,8 +97,7 @@ class StoreRecipeListView(APIView):
             "recipe_img": request.FILES.get("recipe_img")
         }
 
-        print("\n🧪 [최종 serializer_input]:")
-        pprint(serializer_input)
+        logger.debug("🧪 serializer_input: %r", serializer_input)
 
         serializer = RecipeSerializer(data=serializer_input)
         if serializer.is_valid():
@@ -121,7 +121,7 @@ class StoreRecipeListView(APIView):
                     "ingredients": cleaned_ingredients,
                 }, status=201)
 
-        print("🚨 serializer.errors:", serializer.errors)
+        logger.info("🚨 레시피 생성 유효성 검사 실패: %s", serializer.errors)
         return Response(serializer.errors, status=400)
 
 
@@ -137,34 +137,33 @@ class StoreRecipeDetailView(APIView):
     )
 
     def get(self, request, store_id, recipe_id):
-        print("🚀 [레시피 GET] 요청 들어옴:", store_id, recipe_id)
         """ 특정 레시피 상세 조회 """
         recipe = get_object_or_404(Recipe, id=recipe_id, store_id=store_id)
-        ingredients = RecipeItem.objects.filter(recipe=recipe)
-        print(f"📦 연결된 재료 개수: {ingredients.count()}")
+        ingredients = RecipeItem.objects.filter(recipe=recipe).select_related("ingredient__inventory")
 
         ingredients_data = []
         for item in ingredients:
             ingredient = item.ingredient
             required_amount = item.quantity_used
 
-            # ✅ 여기에 있어야 함!
-            print(f"🧾 재료: {ingredient.name}, 저장된 사용량: {required_amount}")
-            print(f"🔍 구매량: {ingredient.purchase_quantity}, 기존 구매량: {ingredient.original_stock_before_edit}")
+            logger.debug(
+                "🧾 재료: %s, 저장된 사용량: %s, 구매량: %s, 기존 구매량: %s",
+                ingredient.name, required_amount, ingredient.purchase_quantity, ingredient.original_stock_before_edit,
+            )
 
-            inventory = Inventory.objects.filter(ingredient=ingredient).first()
+            inventory = getattr(ingredient, "inventory", None)  # ✅ select_related 로 함께 조회됨
             if inventory:
                 original_stock = Decimal(str(ingredient.purchase_quantity))
                 remaining_stock = Decimal(str(inventory.remaining_stock))
                 used_stock = original_stock - remaining_stock
 
-                print(f"📉 used_stock: {used_stock}")
+                logger.debug("📉 used_stock: %s", used_stock)
                 
                 #used_stock 프론트값 일치시키기
                 #required_amount = used_stock
                 
                 if ingredient.purchase_quantity < ingredient.original_stock_before_edit:
-                    print("🌀 구매량 감소 감지 → required_amount = 0 처리")
+                    logger.debug("🌀 구매량 감소 감지 → required_amount = 0 처리 (%s)", ingredient.name)
                     required_amount = Decimal("0.0")
 
             ingredients_data.append({
@@ -206,27 +205,20 @@ class StoreRecipeDetailView(APIView):
         request_data = request.data.copy()
         partial = True
 
-        # ✅ 이미지 디버깅
-        print(f"📂 request.FILES: {request.FILES}")
         image_file = request.FILES.get('recipe_img')
-        print(f"📸 image_file: {image_file}")
 
         # ✅ 이미지 필드 강제 삽입
         if image_file:
             request_data['recipe_img'] = image_file
-            print("✅ 이미지가 request_data에 추가됨.")
+            logger.debug("✅ 새 이미지 업로드: %s", image_file)
         elif "recipe_img" not in request_data:
             request_data["recipe_img"] = recipe.recipe_img if recipe.recipe_img and recipe.recipe_img.name else None
-            print("📎 기존 이미지 유지")
         elif request_data.get("recipe_img") in [None, "null", "", "None"]:
             if recipe.recipe_img and recipe.recipe_img.name:
                 img_name = recipe.recipe_img.name
                 recipe.recipe_img.delete(save=False)
-                print(f"🧹 이미지 삭제 완료: {img_name}")
+                logger.debug("🧹 이미지 삭제 완료: %s", img_name)
             request_data["recipe_img"] = None
-            print("❌ 이미지 삭제 요청 처리됨.")
-
-        print(f"📦 request_data['recipe_img']: {request_data.get('recipe_img')}")
 
         # ✅ ingredients 처리
         ingredients = request_data.get("ingredients", [])
@@ -251,19 +243,20 @@ class StoreRecipeDetailView(APIView):
 
                 estimated_old_capacity = current_capacity + total_used
 
-                print(f"\n🧾 [디버깅] Ingredient: {ingredient.name}")
-                print(f"📦 이전 구매량 추정: {estimated_old_capacity}, 현재 구매량: {current_capacity}")
-                print(f"📏 기존 required_amount: {required_amount}, 총 사용량: {total_used}")
+                logger.debug(
+                    "🧾 %s: 이전 구매량 추정 %s, 현재 구매량 %s, required_amount %s, 총 사용량 %s",
+                    ingredient.name, estimated_old_capacity, current_capacity, required_amount, total_used,
+                )
 
                 # ✅ 백업이 안 되어 있다면 현재 값을 백업
                 if ingredient.original_stock_before_edit == 0 and ingredient.purchase_quantity > 0:
-                    print(f"📝 original_stock_before_edit 백업: {ingredient.purchase_quantity}")
+                    logger.debug("📝 original_stock_before_edit 백업: %s", ingredient.purchase_quantity)
                     ingredient.original_stock_before_edit = ingredient.purchase_quantity
                     ingredient.save()
 
                 # ✅ 초기화 조건
                 if current_capacity < estimated_old_capacity and required_amount != 0 and total_used == 0:
-                    print("⚠️ 조건 충족 → required_amount 초기화")
+                    logger.debug("⚠️ 조건 충족 → required_amount 초기화 (%s)", ingredient.name)
                     required_amount = Decimal("0.0")
 
             ing["required_amount"] = float(required_amount)
@@ -276,7 +269,7 @@ class StoreRecipeDetailView(APIView):
         serializer = RecipeSerializer(instance=recipe, data=request_data, partial=partial)
 
         if not serializer.is_valid():
-            print(f"🚨 serializer.errors: {serializer.errors}")
+            logger.info("🚨 레시피 수정 유효성 검사 실패: %s", serializer.errors)
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         
         recipe = serializer.save()
@@ -297,8 +290,7 @@ class StoreRecipeDetailView(APIView):
                     quantity_used=required_amount,
                 )
 
-        print(f"✅ 최종 저장된 이미지: {recipe.recipe_img}")
-        print(f"✅ 최종 저장된 이미지 URL: {recipe.recipe_img.url if recipe.recipe_img else 'None'}")
+        logger.debug("✅ 최종 저장된 이미지: %s", recipe.recipe_img)
 
         return Response(RecipeSerializer(recipe).data, status=status.HTTP_200_OK)
 
@@ -317,6 +309,7 @@ class StoreRecipeDetailView(APIView):
 
         with transaction.atomic():  # ✅ 트랜잭션 적용
             recipe_items = RecipeItem.objects.filter(recipe=recipe)
+            restored = []
 
             for item in recipe_items:
                 inventory = Inventory.objects.filter(ingredient=item.ingredient).first()  # ✅ 존재 여부 체크
@@ -324,6 +317,9 @@ class StoreRecipeDetailView(APIView):
                     inventory.remaining_stock = Decimal(str(inventory.remaining_stock))  # float → Decimal 변환
                     inventory.remaining_stock += item.quantity_used  # ✅ Decimal + Decimal 연산 가능
                     inventory.save()
+                    restored.append((inventory.id, item.quantity_used))
+
+            record_movements("recipe_restore", restored)  # ✅ 변동 이력 기록
 
             recipe_items.delete()  # ✅ 사용한 RecipeItem 삭제
             recipe.delete()  # ✅ 레시피 삭제
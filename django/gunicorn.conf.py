@@ -0,0 +1,22 @@
+"""
+gunicorn 설정 (작업 디렉터리의 gunicorn.conf.py 를 자동으로 읽음)
+
+Prometheus 지표를 워커 간에 합산하기 위해 워커들이 공유하는 디렉터리를 지정하고,
+시작 시 이전 실행의 파일을 지우며, 종료된 워커의 파일은 정리한다.
+"""
+import os
+import shutil
+
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus_multiproc")
+
+
+def on_starting(server):
+    path = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -1,6 +1,7 @@
 from django.contrib import admin
 from .models import Ingredient
 from inventory.models import Inventory  # ✅ Inventory 모델 추가
+from inventory.utils import record_movements
 
 @admin.register(Ingredient)
 class IngredientAdmin(admin.ModelAdmin):
@@ -21,7 +22,12 @@ class IngredientAdmin(admin.ModelAdmin):
             }
         )
 
+        if created:
+            record_movements("restock", [(inventory.id, obj.purchase_quantity)])  # ✅ 최초 입고 기록
+
         # ✅ 이미 존재하는 경우 (수정된 경우), 남은 재고 업데이트
         if not created:
+            before_stock = inventory.remaining_stock
             inventory.remaining_stock = obj.purchase_quantity
             inventory.save()
+            record_movements("adjust", [(inventory.id, float(obj.purchase_quantity) - before_stock)])  # ✅ 재고 조정 기록
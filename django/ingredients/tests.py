@@ -1,3 +1,24 @@
-from django.test import TestCase
+from ingredients.models import Ingredient
+from livflow.testing import QueryBudgetTestCase
 
-# Create your tests here.
+
+class IngredientQueryBudgetTests(QueryBudgetTestCase):
+    def test_ingredient_list(self):
+        self.assertQueryBudget(1, lambda client, store: client.get(f"/api/ingredients/{store.id}/"))
+
+    def test_ingredient_usage_counts(self):
+        self.assertQueryBudget(1, lambda client, store: client.get(f"/api/ingredients/{store.id}/usages/"))
+
+    def test_ingredient_detail(self):
+        def request(client, store):
+            ingredient = Ingredient.objects.get(store=store, name="재료 0")
+            return client.get(f"/api/ingredients/{store.id}/{ingredient.id}/")
+
+        self.assertQueryBudget(3, request)
+
+    def test_ingredient_usages(self):
+        def request(client, store):
+            ingredient = Ingredient.objects.get(store=store, name="재료 0")
+            return client.get(f"/api/ingredients/{store.id}/{ingredient.id}/usages/")
+
+        self.assertQueryBudget(2, request)
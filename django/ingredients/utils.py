@@ -1,4 +1,7 @@
 # ingredients/utils.py
+from django.db.models import Count
+from costcalcul.models import RecipeItem
+
 
 def calculate_unit_price(purchase_price, purchase_quantity):
     """
@@ -7,3 +10,17 @@ def calculate_unit_price(purchase_price, purchase_quantity):
     if purchase_quantity == 0:
         return 0  # 용량이 0인 경우를 대비해 0을 반환
     return round(purchase_price / purchase_quantity, 2)  # 소수점 둘째 자리까지 반올림
+
+
+def get_ingredient_usage_counts(store_id):
+    """
+    상점의 재료별 사용 레시피 수를 GROUP BY 한 번으로 집계하는 함수.
+    사용되지 않는 재료는 결과에 포함되지 않는다.
+    """
+    rows = (
+        RecipeItem.objects.filter(recipe__store_id=store_id)
+        .values("ingredient_id")
+        .annotate(usage_count=Count("recipe_id", distinct=True))
+        .order_by()
+    )
+    return {str(row["ingredient_id"]): row["usage_count"] for row in rows}
@@ -10,6 +10,12 @@ from store.models import Store
 from drf_yasg.utils import swagger_auto_schema
 from decimal import Decimal
 from costcalcul.models import RecipeItem
+from django.db.models import Count
+from .utils import get_ingredient_usage_counts
+from inventory.utils import record_movements, remove_stock_ratio
+import logging
+
+logger = logging.getLogger(__name__)
 
 class StoreIngredientView(APIView):
     """
@@ -23,7 +29,10 @@ class StoreIngredientView(APIView):
 
     def get(self, request, store_id):
         """ 특정 상점의 모든 재료 조회 (Ingredient 기준) """
-        ingredients = Ingredient.objects.filter(store_id=store_id).order_by("created_at")
+        # ✅ 사용 중인 레시피 수를 GROUP BY 한 번으로 함께 조회
+        ingredients = Ingredient.objects.filter(store_id=store_id).annotate(
+            usage_count=Count("recipeitem__recipe", distinct=True)
+        ).order_by("created_at")
         ingredient_data = [
             {
                 "ingredient_id": str(ingredient.id),
@@ -34,6 +43,7 @@ class StoreIngredientView(APIView):
                 "unit_cost": ingredient.unit_cost,
                 "shop": ingredient.vendor if ingredient.vendor else None,
                 "ingredient_detail": ingredient.notes if ingredient.notes else None,
+                "usage_count": ingredient.usage_count,  # ✅ 사용 중인 레시피 수
             }
             for ingredient in ingredients
         ]
@@ -57,10 +67,11 @@ class StoreIngredientView(APIView):
                 ingredient = serializer.save(store=store)  # ✅ store_id 저장
 
                 # ✅ Inventory 자동 추가
-                Inventory.objects.create(
+                inventory = Inventory.objects.create(
                     ingredient=ingredient,
                     remaining_stock=ingredient.purchase_quantity,
                 )
+                record_movements("restock", [(inventory.id, ingredient.purchase_quantity)])  # ✅ 최초 입고 기록
 
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
             
@@ -114,43 +125,42 @@ class IngredientDetailView(APIView):
                 new_original_stock = old_original_stock  # 값이 없으면 기존 값 유지
 
             difference = new_original_stock - old_original_stock  # 용량 변화량 계산
-            print(f"📌 기존 original_stock: {old_original_stock}, 새로운 original_stock: {new_original_stock}, 차이: {difference}")
-
-            inventory = Inventory.objects.filter(ingredient=ingredient).first()
+            logger.debug("📌 original_stock %s → %s (차이 %s)", old_original_stock, new_original_stock, difference)
 
-            if inventory:
-                print(f"🔄 기존 remaining_stock: {inventory.remaining_stock}, 변동 차이: {difference}")
+            with transaction.atomic():  # ✅ 재고 변경과 이력 기록을 같은 트랜잭션으로
+                inventory = Inventory.objects.filter(ingredient=ingredient).first()
 
-                inventory.remaining_stock = Decimal(str(inventory.remaining_stock))
+                if inventory:
+                    inventory.remaining_stock = Decimal(str(inventory.remaining_stock))
+                    before_stock = inventory.remaining_stock
 
-                # 🔥 **original_stock 증가 → remaining_stock 증가**
-                if difference > 0:
-                    inventory.remaining_stock += difference
-                    print(f"✅ 증가 적용 - 새로운 remaining_stock: {inventory.remaining_stock}")
+                    # 🔥 **original_stock 증가 → remaining_stock 증가**
+                    if difference > 0:
+                        inventory.remaining_stock += difference
 
-                # 🔥 **original_stock 감소 → used_stock을 0으로 설정 & remaining_stock 재조정**
-                elif difference < 0:
-                    print(f"⚠️ original_stock 감소 감지! used_stock 초기화 적용")
+                    # 🔥 **original_stock 감소 → used_stock을 0으로 설정 & remaining_stock 재조정**
+                    elif difference < 0:
+                        # ✅ 백업 로직 추가
+                        if ingredient.original_stock_before_edit == 0:
+                            ingredient.original_stock_before_edit = old_original_stock
+                            ingredient.save()
 
-                    # ✅ 백업 로직 추가
-                    if ingredient.original_stock_before_edit == 0:
-                        ingredient.original_stock_before_edit = old_original_stock
-                        print(f"📝 original_stock_before_edit 백업: {old_original_stock}")
-                        ingredient.save()
+                        # ✅ used_stock 초기화
+                        used_stock = old_original_stock - inventory.remaining_stock
+                        logger.debug("⚠️ original_stock 감소 → 기존 사용량 %s 초기화", used_stock)
 
-                    # ✅ used_stock 초기화
-                    used_stock = old_original_stock - inventory.remaining_stock
-                    print(f"🔍 기존 사용량(used_stock): {used_stock} → 초기화 (0)")
+                        # ✅ remaining_stock을 new_original_stock으로 재설정
+                        inventory.remaining_stock = new_original_stock
 
-                    # ✅ remaining_stock을 new_original_stock으로 재설정
-                    inventory.remaining_stock = new_original_stock
-                    print(f"✅ remaining_stock을 new_original_stock({new_original_stock})으로 변경")
 
+                    inventory.save()
 
-                inventory.save()
+                    # ✅ 재고 변동 이력 기록 (증가 → restock, 감소 → adjust)
+                    movement_type = "restock" if difference > 0 else "adjust"
+                    record_movements(movement_type, [(inventory.id, inventory.remaining_stock - before_stock)])
 
-            # ✅ `original_stock` 반영 후 재료 업데이트
-            serializer.save(purchase_quantity=new_original_stock)
+                # ✅ `original_stock` 반영 후 재료 업데이트
+                serializer.save(purchase_quantity=new_original_stock)
             return Response(serializer.data, status=status.HTTP_200_OK)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -165,6 +175,7 @@ class IngredientDetailView(APIView):
         """ 특정 재료 삭제 """
         ingredient = get_object_or_404(Ingredient, id=ingredient_id, store_id=store_id)
         ingredient.delete()
+        remove_stock_ratio(store_id, ingredient_id)  # ✅ 재고 비율 Sorted Set 정리
         return Response({"message": "재료가 삭제되었습니다."}, status=status.HTTP_204_NO_CONTENT)
     
 class IngredientUsagesView(APIView):
@@ -174,10 +185,26 @@ class IngredientUsagesView(APIView):
 
     def get(self, request, store_id, ingredient_id):
         """특정 재료를 사용 중인 레시피 리스트 반환"""
-        # ✅ 해당 재료를 사용하는 RecipeItem 조회
-        recipe_items = RecipeItem.objects.filter(ingredient_id=ingredient_id, recipe__store_id=store_id)
+        # ✅ 레시피 이름만 JOIN 한 번으로 조회 (item.recipe 지연 로딩 방지)
+        recipe_names = list(
+            RecipeItem.objects.filter(ingredient_id=ingredient_id, recipe__store_id=store_id)
+            .values_list("recipe__name", flat=True)
+        )
+
+        return Response(recipe_names, status=status.HTTP_200_OK)
+
+
+class IngredientUsageCountView(APIView):
+    """
+    특정 상점의 모든 재료별 사용 레시피 수 조회 API
+    """
 
-        # ✅ 레시피 이름 목록 반환
-        recipe_names = [item.recipe.name for item in recipe_items]
+    @swagger_auto_schema(
+        operation_summary="특정 상점의 재료별 사용 레시피 수 조회",
+        responses={200: "재료 ID별 사용 레시피 수 반환"}
+    )
 
-        return Response(recipe_names, status=status.HTTP_200_OK)
\ No newline at end of file
+    def get(self, request, store_id):
+        """ 재료 ID → 사용 중인 레시피 수 (GROUP BY 한 번) """
+        usage_counts = get_ingredient_usage_counts(store_id)
+        return Response(usage_counts, status=status.HTTP_200_OK)
@@ -1,5 +1,7 @@
 from django.contrib import admin
-from .models import Inventory
+from django.db import transaction
+from .models import Inventory, InventoryMovement, InventorySnapshot
+from .utils import sync_stock_ratios
 
 @admin.register(Inventory)
 class InventoryAdmin(admin.ModelAdmin):
@@ -9,11 +11,16 @@ class InventoryAdmin(admin.ModelAdmin):
     ordering = ("id",)
 
     # ✅ 수정 가능 필드 지정
-    fields = ("ingredient", "remaining_stock")
+    fields = ("ingredient", "remaining_stock", "reorder_threshold")
 
     # ✅ 읽기 전용 필드
     readonly_fields = ("remaining_stock",)
 
+    def save_model(self, request, obj, form, change):
+        """ ✅ 재주문 기준 변경을 Redis 재고 비율에도 반영 (커밋 후) """
+        super().save_model(request, obj, form, change)
+        transaction.on_commit(lambda: sync_stock_ratios([obj.pk]))
+
     def get_store(self, obj):
         """ ✅ Ingredient 모델에서 store 가져오기 """
         return obj.ingredient.store.name if obj.ingredient.store else "No Store"
@@ -28,3 +35,27 @@ class InventoryAdmin(admin.ModelAdmin):
         """ ✅ Ingredient 모델에서 unit_cost 가져오기 """
         return f"{obj.get_unit_cost:.2f} 원"
     get_unit_cost.short_description = "단가 (unit cost)"
+
+
+@admin.register(InventoryMovement)
+class InventoryMovementAdmin(admin.ModelAdmin):
+    list_display = ("id", "inventory", "movement_type", "quantity", "request_id", "created_at")
+    list_filter = ("movement_type", "inventory__ingredient__store")
+    search_fields = ("inventory__ingredient__name", "request_id")
+    ordering = ("-id",)
+    raw_id_fields = ("inventory",)
+
+    # ✅ 이력은 append-only → 수정/삭제 불가
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(InventorySnapshot)
+class InventorySnapshotAdmin(admin.ModelAdmin):
+    list_display = ("id", "inventory", "stock", "last_movement_id", "taken_at")
+    list_filter = ("inventory__ingredient__store",)
+    ordering = ("-id",)
+    raw_id_fields = ("inventory",)
@@ -0,0 +1,155 @@
+# inventory/depletion.py
+import json
+import logging
+from datetime import datetime, time, timedelta
+
+import numpy as np
+import redis
+from django.db.models import Sum
+from django.db.models.functions import TruncDate
+from django.utils.timezone import localdate, localtime, make_aware
+
+from livflow.redis_client import get_redis
+from .models import Inventory, InventoryMovement
+
+logger = logging.getLogger(__name__)
+
+EWMA_ALPHA = 0.3  # 최근 사용량 가중치
+LOOKBACK_DAYS = 60  # 최초 계산 시 조회 구간 (0.7^60 ≈ 0 이라 이전 이력은 영향 없음)
+STATE_TTL = 60 * 60 * 24 * 14  # 2주 동안 조회가 없으면 상태 폐기
+
+
+def depletion_state_key(store_id):
+    """ 상점별 소진 예측 상태 키 (v2: 편향 보정 전 EWMA 저장) """
+    return f"depletion:v2:{store_id}"
+
+
+def _load_state(store_id):
+    try:
+        raw = get_redis().get(depletion_state_key(store_id))
+    except redis.RedisError as e:
+        logger.warning("소진 예측 상태 조회 실패: %s", e)
+        return None
+    return json.loads(raw) if raw else None
+
+
+def _save_state(store_id, through, inventory_ids, rates):
+    state = {
+        "through": through.isoformat(),
+        "rates": {str(pk): float(rate) for pk, rate in zip(inventory_ids, rates)},
+    }
+    try:
+        get_redis().setex(depletion_state_key(store_id), STATE_TTL, json.dumps(state))
+    except redis.RedisError as e:
+        logger.warning("소진 예측 상태 저장 실패: %s", e)
+
+
+def _daily_consumption(store_id, inventory_ids, start, end):
+    """
+    [재료 수 × 일수] 일별 사용량 행렬 (DB에서 일 단위로 집계).
+    start ~ end (포함) 구간의 consume 변동만 합산한다.
+    """
+    n_days = (end - start).days + 1
+    matrix = np.zeros((len(inventory_ids), n_days))
+    index = {pk: i for i, pk in enumerate(inventory_ids)}
+
+    rows = (
+        InventoryMovement.objects.filter(
+            inventory_id__in=inventory_ids,
+            movement_type="consume",
+            created_at__gte=make_aware(datetime.combine(start, time.min)),
+            created_at__lt=make_aware(datetime.combine(end + timedelta(days=1), time.min)),
+        )
+        .annotate(day=TruncDate("created_at"))
+        .values("inventory_id", "day")
+        .annotate(total=Sum("quantity"))
+        .order_by()
+    )
+    for row in rows:
+        matrix[index[row["inventory_id"]], (row["day"] - start).days] = -row["total"]  # 사용량은 음수로 기록됨
+
+    return matrix
+
+
+def _ewma(prev_rates, daily, alpha=EWMA_ALPHA):
+    """
+    이전 EWMA 값에 새 일별 사용량 열들을 한 번에 반영 (모든 재료 동시 계산).
+    r_n = (1-α)^n · r_0 + Σ α(1-α)^(n-1-j) · c_j
+    """
+    n_days = daily.shape[1]
+    weights = alpha * (1 - alpha) ** np.arange(n_days - 1, -1, -1)
+    return (1 - alpha) ** n_days * prev_rates + daily @ weights
+
+
+def _bias_correction(inventories, through):
+    """
+    EWMA 는 0에서 시작하므로 이력이 짧은 재료는 사용량이 작게 나온다.
+    재고 생성일부터 through 까지 완료된 일수 n 으로 1 - (1-α)^n 을 나눠 보정한다 (이력이 길면 1에 수렴).
+    """
+    ages = np.array([(through - localtime(inv.created_at).date()).days + 1 for inv in inventories])
+    ages = np.clip(ages, 0, LOOKBACK_DAYS)
+    return 1 - (1 - EWMA_ALPHA) ** ages
+
+
+def get_depletion_forecast(store_id):
+    """
+    상점의 모든 재료에 대해 소진까지 남은 일수를 추정하는 함수.
+    일별 사용량의 지수가중평균(EWMA)을 어제까지 완료된 날 기준으로 Redis에 보관하고,
+    이후 새로 완료된 날의 사용량만 조회해 갱신한다.
+
+    - 이력이 짧은 재료는 생성일 기준으로 편향 보정한 EWMA 를 쓴다.
+    - 오늘 사용량은 아직 끝나지 않은 날이라 EWMA 에 넣지 않고, 오늘 지금까지 쓴 양이
+      평균보다 크면 그 값을 하루 사용량으로 본다 (오늘 처음 쓰기 시작한 재료도 소진 예상이 나옴).
+    """
+    inventories = list(
+        Inventory.objects.filter(ingredient__store_id=store_id)
+        .select_related("ingredient")
+        .order_by("created_at")
+    )
+    if not inventories:
+        return []
+
+    inventory_ids = [inv.pk for inv in inventories]
+    today = localdate()
+    through = today - timedelta(days=1)  # 마지막으로 완료된 날
+    state = _load_state(store_id)
+
+    if state:
+        state_through = datetime.strptime(state["through"], "%Y-%m-%d").date()
+        prev_rates = np.array([state["rates"].get(str(pk), 0.0) for pk in inventory_ids])
+    else:
+        state_through = through - timedelta(days=LOOKBACK_DAYS)
+        prev_rates = np.zeros(len(inventory_ids))
+
+    if state_through < through:
+        # ✅ 오래 비어 있던 구간은 가중치가 0에 수렴하므로 LOOKBACK_DAYS 만큼만 조회 (오늘 열까지 한 번에)
+        start = max(state_through + timedelta(days=1), through - timedelta(days=LOOKBACK_DAYS - 1))
+        daily = _daily_consumption(store_id, inventory_ids, start, today)
+        today_used = daily[:, -1]
+        rates = _ewma(prev_rates, daily[:, :-1])
+        _save_state(store_id, through, inventory_ids, rates)
+    else:
+        today_used = _daily_consumption(store_id, inventory_ids, today, today)[:, 0]
+        rates = prev_rates
+
+    correction = _bias_correction(inventories, through)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rates = np.where(correction > 0, rates / correction, 0.0)
+    rates = np.maximum(rates, today_used)
+
+    remaining = np.array([inv.remaining_stock for inv in inventories])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        days_left = np.where(rates > 0, np.maximum(remaining, 0) / rates, np.inf)
+
+    return [
+        {
+            "ingredient_id": str(inv.ingredient_id),
+            "ingredient_name": inv.ingredient.name,
+            "remaining_stock": inv.remaining_stock,
+            "unit": inv.ingredient.unit,
+            "daily_consumption": round(float(rate), 4),
+            "days_until_empty": None if np.isinf(days) else round(float(days), 1),
+            "expected_empty_date": None if np.isinf(days) else (today + timedelta(days=int(days))).isoformat(),
+        }
+        for inv, rate, days in zip(inventories, rates, days_left)
+    ]
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from inventory.utils import rebuild_stock_ratios
+from store.models import Store
+
+
+class Command(BaseCommand):
+    help = "모든 상점(또는 지정한 상점)의 Redis 재고 비율 Sorted Set을 DB 기준으로 다시 만듭니다. (배포 후 백필 / Redis 초기화 후 복구)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--store", action="append", dest="stores", help="대상 상점 ID (여러 번 지정 가능, 기본 전체)")
+
+    def handle(self, *args, **options):
+        store_ids = options["stores"] or Store.objects.values_list("id", flat=True)
+        total = 0
+        for store_id in store_ids:
+            rebuild_stock_ratios(store_id)
+            total += 1
+        self.stdout.write(self.style.SUCCESS(f"✅ 재고 비율 {total}개 상점 재구성 완료"))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from inventory.utils import take_inventory_snapshots
+
+
+class Command(BaseCommand):
+    help = "모든 재고의 현재 값을 스냅샷으로 저장합니다. (cron 등으로 주기 실행)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500, help="한 트랜잭션에서 잠글 재고 행 수")
+
+    def handle(self, *args, **options):
+        created = take_inventory_snapshots(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"✅ 재고 스냅샷 {created}건 저장 완료"))
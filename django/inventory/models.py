@@ -1,13 +1,25 @@
 from django.db import models
+from django.db.models import F, Q, Sum
 from ingredients.models import Ingredient
 from django.utils.timezone import now
 
 class Inventory(models.Model):
     ingredient = models.OneToOneField(Ingredient, on_delete=models.CASCADE, related_name="inventory")
     remaining_stock = models.FloatField(default=0)  
+    reorder_threshold = models.FloatField(default=0)  # ✅ 재주문 기준 재고 (0이면 알림 없음)
     created_at = models.DateTimeField(default=now, editable=False)
     updated_at = models.DateTimeField(auto_now=True)  
 
+    class Meta:
+        indexes = [
+            # ✅ 재고 부족 조회용 부분 인덱스 (기준 미만 행만 포함)
+            models.Index(
+                fields=["ingredient"],
+                name="inventory_low_stock_idx",
+                condition=Q(remaining_stock__lt=F("reorder_threshold")),
+            ),
+        ]
+
     def __str__(self):
         return f"{self.ingredient.name} - {self.remaining_stock} {self.ingredient.unit}"
 
@@ -20,3 +32,60 @@ class Inventory(models.Model):
     def get_unit_cost(self):
         """ ✅ Ingredient 모델에서 unit_cost 가져오기 """
         return self.ingredient.unit_cost  # ✅ Ingredient에서 계산된 unit_cost 가져오기
+
+    def stock_as_of(self, at):
+        """
+        ✅ 특정 시점(at)의 재고 계산
+        가장 최근 스냅샷 + 스냅샷 이후 변동량 합계 (전체 이력 재생 X)
+        스냅샷이 없으면 현재 재고 - at 이후 변동량 합계 (변동 이력 도입 전 재고도 포함)
+        """
+        snapshot = self.snapshots.filter(taken_at__lte=at).order_by("-taken_at").first()
+        if snapshot is None:
+            later = self.movements.filter(created_at__gt=at).aggregate(total=Sum("quantity"))["total"] or 0
+            return self.remaining_stock - later
+
+        movements = self.movements.filter(created_at__lte=at, id__gt=snapshot.last_movement_id)
+        delta = movements.aggregate(total=Sum("quantity"))["total"] or 0
+        return snapshot.stock + delta
+
+
+# ✅ 재고 변동 이력 (append-only)
+class InventoryMovement(models.Model):
+    MOVEMENT_TYPES = [
+        ("consume", "Consume"),
+        ("restock", "Restock"),
+        ("adjust", "Adjust"),
+        ("recipe_restore", "Recipe Restore"),
+    ]
+
+    inventory = models.ForeignKey(Inventory, on_delete=models.CASCADE, related_name="movements")
+    movement_type = models.CharField(max_length=20, choices=MOVEMENT_TYPES)
+    quantity = models.FloatField()  # 변동량 (+ 입고/복구, - 사용)
+    request_id = models.CharField(max_length=64, blank=True, default="")  # X-Request-ID
+    created_at = models.DateTimeField(default=now, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["inventory", "created_at"], name="inv_movement_inv_created_idx"),
+            # ✅ X-Request-ID 멱등성 조회용 (빈 값 제외 부분 인덱스)
+            models.Index(fields=["request_id"], name="inv_movement_request_idx", condition=~Q(request_id="")),
+        ]
+
+    def __str__(self):
+        return f"{self.inventory_id} {self.movement_type} {self.quantity}"
+
+
+# ✅ 재고 스냅샷 (특정 시점 재고 조회 시 재생 구간을 제한)
+class InventorySnapshot(models.Model):
+    inventory = models.ForeignKey(Inventory, on_delete=models.CASCADE, related_name="snapshots")
+    stock = models.FloatField()  # 스냅샷 시점의 재고
+    last_movement_id = models.BigIntegerField(default=0)  # 스냅샷에 반영된 마지막 변동 ID
+    taken_at = models.DateTimeField(default=now, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["inventory", "taken_at"], name="inv_snapshot_inv_taken_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.inventory_id} @ {self.taken_at}: {self.stock}"
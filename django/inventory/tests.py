@@ -1,3 +1,125 @@
+from datetime import datetime, time, timedelta
+from decimal import Decimal
 from django.test import TestCase
+from django.utils.timezone import localdate, make_aware, now
+from rest_framework.test import APIClient
+from ingredients.models import Ingredient
+from inventory.depletion import get_depletion_forecast
+from inventory.models import Inventory, InventoryMovement
+from livflow.testing import QueryBudgetTestCase
+from store.models import Store
+from users.models import CustomUser
 
-# Create your tests here.
+
+class InventoryQueryBudgetTests(QueryBudgetTestCase):
+    def test_store_inventory(self):
+        self.assertQueryBudget(1, lambda client, store: client.get(f"/api/inventory/{store.id}/"))
+
+    def test_store_low_stock(self):
+        self.assertQueryBudget(1, lambda client, store: client.get(f"/api/inventory/{store.id}/low-stock/"))
+
+    def test_user_low_stock(self):
+        self.assertQueryBudget(1, lambda client, store: client.get("/api/inventory/low-stock/"))
+
+    def test_low_stock_count(self):
+        # 테스트 설정에서는 Redis 가 없으므로 DB 대체 경로
+        self.assertQueryBudget(1, lambda client, store: client.get(f"/api/inventory/{store.id}/low-stock/count/"))
+
+    def test_stock_depletion(self):
+        self.assertQueryBudget(2, lambda client, store: client.get(f"/api/inventory/{store.id}/depletion/"))
+
+    def test_batch_use(self):
+        def request(client, store):
+            items = [
+                {"ingredient_id": str(pk), "used_stock": 1}
+                for pk in Ingredient.objects.filter(store=store).values_list("id", flat=True)
+            ]
+            return client.post(f"/api/inventory/{store.id}/use/", {"items": items}, format="json")
+
+        self.assertQueryBudget(6, request)
+
+
+class DepletionForecastTests(TestCase):
+    def setUp(self):
+        user = CustomUser.objects.create_user(email="depletion@example.com")
+        self.store = Store.objects.create(user=user, name="상점")
+
+    def add_inventory(self, created_at, remaining_stock=100):
+        ingredient = Ingredient.objects.create(
+            store=self.store, name="원두", purchase_price=Decimal("1000"), purchase_quantity=Decimal("100"), unit="g"
+        )
+        return Inventory.objects.create(ingredient=ingredient, remaining_stock=remaining_stock, created_at=created_at)
+
+    def consume(self, inventory, day, quantity):
+        InventoryMovement.objects.create(
+            inventory=inventory, movement_type="consume", quantity=-quantity,
+            created_at=make_aware(datetime.combine(day, time(12))),
+        )
+
+    def test_young_series_is_bias_corrected(self):
+        today = localdate()
+        inventory = self.add_inventory(make_aware(datetime.combine(today - timedelta(days=3), time(9))))
+        for days_ago in (3, 2, 1):
+            self.consume(inventory, today - timedelta(days=days_ago), 10)
+
+        forecast = get_depletion_forecast(self.store.id)[0]
+        self.assertAlmostEqual(forecast["daily_consumption"], 10, places=2)
+        self.assertAlmostEqual(forecast["days_until_empty"], 10, places=1)
+
+    def test_today_consumption_counts_for_new_ingredient(self):
+        inventory = self.add_inventory(now(), remaining_stock=50)
+        self.consume(inventory, localdate(), 5)
+
+        forecast = get_depletion_forecast(self.store.id)[0]
+        self.assertEqual(forecast["daily_consumption"], 5)
+        self.assertEqual(forecast["days_until_empty"], 10)
+
+
+class StockInputValidationTests(TestCase):
+    def setUp(self):
+        user = CustomUser.objects.create_user(email="validation@example.com")
+        self.store = Store.objects.create(user=user, name="상점")
+        self.ingredient = Ingredient.objects.create(
+            store=self.store, name="우유", purchase_price=Decimal("1000"), purchase_quantity=Decimal("100"), unit="ml"
+        )
+        self.inventory = Inventory.objects.create(ingredient=self.ingredient, remaining_stock=100)
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+
+    def test_batch_use_rejects_non_finite(self):
+        for value in ("NaN", "Infinity", "-Infinity", "sNaN"):
+            items = [{"ingredient_id": str(self.ingredient.id), "used_stock": value}]
+            response = self.client.post(f"/api/inventory/{self.store.id}/use/", {"items": items}, format="json")
+            self.assertEqual(response.status_code, 400, value)
+
+        self.inventory.refresh_from_db()
+        self.assertEqual(self.inventory.remaining_stock, 100)
+
+    def test_threshold_rejects_non_finite(self):
+        url = f"/api/inventory/{self.store.id}/{self.ingredient.id}/threshold/"
+        for value in ("nan", "inf", "-inf", -1):
+            response = self.client.put(url, {"reorder_threshold": value}, format="json")
+            self.assertEqual(response.status_code, 400, value)
+
+        response = self.client.put(url, {"reorder_threshold": 30}, format="json")
+        self.assertEqual(response.status_code, 200)
+
+
+class StockAsOfTests(TestCase):
+    def setUp(self):
+        user = CustomUser.objects.create_user(email="stock-as-of@example.com")
+        store = Store.objects.create(user=user, name="상점")
+        ingredient = Ingredient.objects.create(
+            store=store, name="원두", purchase_price=Decimal("1000"), purchase_quantity=Decimal("100"), unit="g"
+        )
+        # 변동 이력 도입 전에 만든 재고 (80 은 변동으로 기록된 적 없음)
+        self.inventory = Inventory.objects.create(ingredient=ingredient, remaining_stock=80)
+
+    def test_without_snapshot_works_back_from_current_stock(self):
+        yesterday = now() - timedelta(days=1)
+        InventoryMovement.objects.create(inventory=self.inventory, movement_type="consume", quantity=-30, created_at=now())
+        self.inventory.remaining_stock = 50
+        self.inventory.save()
+
+        self.assertEqual(self.inventory.stock_as_of(yesterday), 80)
+        self.assertEqual(self.inventory.stock_as_of(now()), 50)
@@ -1,7 +1,16 @@
 from django.urls import path
-from .views import StoreInventoryView, UseIngredientStockView
+from .views import (
+    StoreInventoryView, UseIngredientStockView, BatchUseIngredientStockView,
+    StoreLowStockView, UserLowStockView, StoreLowStockCountView, InventoryThresholdView, StockDepletionView
+)
 
 urlpatterns = [
+    path('low-stock/', UserLowStockView.as_view(), name='user-low-stock'),
     path('<uuid:store_id>/', StoreInventoryView.as_view(), name='store-inventory'),
+    path('<uuid:store_id>/low-stock/', StoreLowStockView.as_view(), name='store-low-stock'),
+    path('<uuid:store_id>/low-stock/count/', StoreLowStockCountView.as_view(), name='store-low-stock-count'),
+    path('<uuid:store_id>/depletion/', StockDepletionView.as_view(), name='stock-depletion'),
+    path('<uuid:store_id>/use/', BatchUseIngredientStockView.as_view(), name='batch-use-ingredient-stock'),
     path('<uuid:store_id>/<uuid:ingredient_id>/use/', UseIngredientStockView.as_view(), name='use-ingredient-stock'),
+    path('<uuid:store_id>/<uuid:ingredient_id>/threshold/', InventoryThresholdView.as_view(), name='inventory-threshold'),
 ]
@@ -0,0 +1,159 @@
+# inventory/utils.py
+import logging
+import redis
+from django.db import transaction
+from django.db.models import F, Max
+from django.utils.timezone import now
+from livflow.redis_client import get_redis, pipeline
+from .models import Inventory, InventoryMovement, InventorySnapshot
+
+logger = logging.getLogger(__name__)
+
+
+def record_movements(movement_type, changes, request_id=""):
+    """
+    재고 변동 이력을 INSERT 한 번으로 기록하는 함수.
+    changes: [(inventory_id, 변동량), ...]
+    반드시 재고 UPDATE와 같은 transaction.atomic 블록 안에서, UPDATE 이후에 호출한다.
+    """
+    movements = [
+        InventoryMovement(
+            inventory_id=inventory_id,
+            movement_type=movement_type,
+            quantity=float(quantity),
+            request_id=request_id or "",
+        )
+        for inventory_id, quantity in changes
+        if quantity
+    ]
+    if movements:
+        InventoryMovement.objects.bulk_create(movements)
+
+        # ✅ 커밋 이후 재고 비율(Redis) 갱신
+        inventory_ids = [movement.inventory_id for movement in movements]
+        transaction.on_commit(lambda: sync_stock_ratios(inventory_ids))
+    return movements
+
+
+def take_inventory_snapshots(chunk_size=500):
+    """
+    모든 재고의 현재 값을 스냅샷으로 저장하는 함수 (주기 실행용).
+    chunk 단위로 재고 행을 잠가 진행 중인 변동과 스냅샷이 어긋나지 않게 한다.
+    """
+    created = 0
+    last_pk = 0
+
+    while True:
+        with transaction.atomic():
+            rows = list(
+                Inventory.objects.select_for_update()
+                .filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", "remaining_stock")[:chunk_size]
+            )
+            if not rows:
+                break
+
+            # ✅ 잠금 이후 조회하므로 잠긴 재고의 커밋된 변동은 모두 이 ID 이하
+            last_movement_id = InventoryMovement.objects.aggregate(last=Max("id"))["last"] or 0
+            taken_at = now()
+
+            InventorySnapshot.objects.bulk_create([
+                InventorySnapshot(
+                    inventory_id=pk,
+                    stock=remaining_stock,
+                    last_movement_id=last_movement_id,
+                    taken_at=taken_at,
+                )
+                for pk, remaining_stock in rows
+            ])
+
+        created += len(rows)
+        last_pk = rows[-1][0]
+
+    return created
+
+
+def stock_ratio_key(store_id):
+    """ 상점별 재고 비율 Sorted Set 키 """
+    return f"stock_ratio:{store_id}"
+
+
+def stock_ratio_loaded_key(store_id):
+    """ 상점 재고 비율을 DB에서 한 번 채웠는지 표시하는 키 (비어 있는 Sorted Set은 Redis에 남지 않으므로 따로 둔다) """
+    return f"stock_ratio_loaded:{store_id}"
+
+
+def sync_stock_ratios(inventory_ids):
+    """
+    재고 비율(remaining_stock / reorder_threshold)을 상점별 Redis Sorted Set에 반영하는 함수.
+    기준이 없는(0) 재료는 Sorted Set에서 제거한다. Redis 장애 시 경고만 남긴다.
+    """
+    rows = Inventory.objects.filter(pk__in=inventory_ids).values_list(
+        "ingredient_id", "ingredient__store_id", "remaining_stock", "reorder_threshold"
+    )
+
+    try:
+        with pipeline() as pipe:
+            for ingredient_id, store_id, remaining_stock, reorder_threshold in rows:
+                key = stock_ratio_key(store_id)
+                if reorder_threshold > 0:
+                    pipe.zadd(key, {str(ingredient_id): remaining_stock / reorder_threshold})
+                else:
+                    pipe.zrem(key, str(ingredient_id))
+    except redis.RedisError as e:
+        logger.warning("재고 비율 Redis 갱신 실패: %s", e)
+
+
+def remove_stock_ratio(store_id, ingredient_id):
+    """ 삭제된 재료를 재고 비율 Sorted Set에서 제거 """
+    try:
+        get_redis().zrem(stock_ratio_key(store_id), str(ingredient_id))
+    except redis.RedisError as e:
+        logger.warning("재고 비율 Redis 삭제 실패: %s", e)
+
+
+def get_low_stock_queryset(**filters):
+    """ 재주문 기준 미만 재고 조회 (부분 인덱스 inventory_low_stock_idx 사용) """
+    return (
+        Inventory.objects.filter(remaining_stock__lt=F("reorder_threshold"), **filters)
+        .select_related("ingredient", "ingredient__store")
+        .order_by("ingredient__store_id", "remaining_stock")
+    )
+
+
+def rebuild_stock_ratios(store_id):
+    """
+    상점의 재고 비율 Sorted Set을 DB 기준으로 다시 만드는 함수 (기존 재고 백필 / Redis 초기화 후 복구용).
+    반환값: 재고 부족 재료 수 (비율 < 1)
+    """
+    rows = Inventory.objects.filter(ingredient__store_id=store_id, reorder_threshold__gt=0).values_list(
+        "ingredient_id", "remaining_stock", "reorder_threshold"
+    )
+    ratios = {str(ingredient_id): remaining_stock / reorder_threshold for ingredient_id, remaining_stock, reorder_threshold in rows}
+
+    key = stock_ratio_key(store_id)
+    with pipeline(transaction=True) as pipe:  # ✅ 삭제 → 채우기를 한 번에 (조회 중 빈 Set 노출 방지)
+        pipe.delete(key)
+        if ratios:
+            pipe.zadd(key, ratios)
+        pipe.set(stock_ratio_loaded_key(store_id), 1)
+    return sum(1 for ratio in ratios.values() if ratio < 1)
+
+
+def get_low_stock_count(store_id):
+    """
+    상점의 재고 부족 재료 수 (비율 < 1) — Redis만 조회.
+    아직 DB에서 채운 적이 없는 상점이면 한 번 다시 만든다. Redis 장애 시 DB에서 직접 센다.
+    """
+    try:
+        with pipeline() as pipe:
+            pipe.exists(stock_ratio_loaded_key(store_id))
+            pipe.zcount(stock_ratio_key(store_id), "-inf", "(1")
+            loaded, count = pipe.execute()
+        if not loaded:
+            count = rebuild_stock_ratios(store_id)
+        return count
+    except redis.RedisError as e:
+        logger.warning("재고 비율 Redis 조회 실패, DB로 대체: %s", e)
+        return get_low_stock_queryset(ingredient__store_id=store_id).count()
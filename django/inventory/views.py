@@ -3,16 +3,21 @@ from rest_framework.response import Response
 from rest_framework import status
 from django.shortcuts import get_object_or_404
 from django.db import transaction  # ✅ 트랜잭션 적용
-from .models import Inventory
+from .models import Inventory, InventoryMovement
 from ingredients.models import Ingredient
 from costcalcul.models import Recipe, RecipeItem  # ✅ 레시피 모델 추가
 from .serializers import InventorySerializer
+from .utils import record_movements, sync_stock_ratios, get_low_stock_queryset, get_low_stock_count
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from django.db import transaction
-from django.db.models import F
+from django.db.models import F, Case, When, Value, FloatField
 from django.utils.timezone import now
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
+import logging
+import math
+import uuid
+
+logger = logging.getLogger(__name__)
 
 # ✅ 특정 상점의 재고 조회
 class StoreInventoryView(APIView):
@@ -24,7 +29,7 @@ class StoreInventoryView(APIView):
     
     def get(self, request, store_id):
         """ 특정 상점의 재고 목록 조회 """
-        inventories = Inventory.objects.filter(ingredient__store_id=store_id).order_by("created_at")
+        inventories = Inventory.objects.filter(ingredient__store_id=store_id).select_related("ingredient").order_by("created_at")
         inventory_data = [
             {
                 "ingredient_id": str(inv.ingredient.id),
@@ -33,15 +38,114 @@ class StoreInventoryView(APIView):
                 "remaining_stock": inv.remaining_stock,
                 "unit": inv.ingredient.unit,
                 "unit_cost": inv.ingredient.unit_cost,  # ✅ unit_cost 추가
+                "reorder_threshold": inv.reorder_threshold,  # ✅ 재주문 기준 추가
             }
             for inv in inventories
         ]
         return Response(inventory_data, status=status.HTTP_200_OK)
 
+
+def serialize_low_stock(inventories):
+    """ 재고 부족 응답 데이터 구성 """
+    return [
+        {
+            "store_id": str(inv.ingredient.store_id),
+            "store_name": inv.ingredient.store.name,
+            "ingredient_id": str(inv.ingredient_id),
+            "ingredient_name": inv.ingredient.name,
+            "remaining_stock": inv.remaining_stock,
+            "reorder_threshold": inv.reorder_threshold,
+            "unit": inv.ingredient.unit,
+        }
+        for inv in inventories
+    ]
+
+
+# ✅ 특정 상점의 재고 부족 재료 조회
+class StoreLowStockView(APIView):
+
+    @swagger_auto_schema(
+        operation_summary="특정 상점의 재고 부족 재료 조회",
+        responses={200: "재주문 기준 미만 재료 목록 반환"}
+    )
+
+    def get(self, request, store_id):
+        """ 재주문 기준 미만 재료 목록 (쿼리 한 번) """
+        inventories = get_low_stock_queryset(ingredient__store_id=store_id)
+        return Response(serialize_low_stock(inventories), status=status.HTTP_200_OK)
+
+
+# ✅ 로그인한 사용자의 모든 상점 재고 부족 재료 조회
+class UserLowStockView(APIView):
+
+    @swagger_auto_schema(
+        operation_summary="내 모든 상점의 재고 부족 재료 조회",
+        responses={200: "재주문 기준 미만 재료 목록 반환"}
+    )
+
+    def get(self, request):
+        """ 사용자 소유 전체 상점의 재주문 기준 미만 재료 목록 (쿼리 한 번) """
+        inventories = get_low_stock_queryset(ingredient__store__user=request.user)
+        return Response(serialize_low_stock(inventories), status=status.HTTP_200_OK)
+
+
+# ✅ 대시보드 배지용 재고 부족 개수 (Redis)
+class StoreLowStockCountView(APIView):
+
+    @swagger_auto_schema(
+        operation_summary="특정 상점의 재고 부족 재료 개수",
+        responses={200: "재고 부족 재료 개수 반환"}
+    )
+
+    def get(self, request, store_id):
+        """ Redis Sorted Set에서 비율 1 미만 개수 조회 """
+        return Response({"low_stock_count": get_low_stock_count(store_id)}, status=status.HTTP_200_OK)
+
+
+# ✅ 재주문 기준 설정
+class InventoryThresholdView(APIView):
+    throttle_scope = "inventory_write"
+
+    @swagger_auto_schema(
+        operation_summary="재료 재주문 기준 설정",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "reorder_threshold": openapi.Schema(type=openapi.TYPE_NUMBER, description="재주문 기준 재고량 (0이면 알림 해제)")
+            },
+            required=["reorder_threshold"]
+        ),
+        responses={200: "설정 성공", 400: "유효성 검사 실패", 404: "재고를 찾을 수 없음"}
+    )
+
+    def put(self, request, store_id, ingredient_id):
+        """ 재료별 재주문 기준 수정 """
+        try:
+            reorder_threshold = float(request.data.get("reorder_threshold"))
+        except (TypeError, ValueError):
+            return Response({"error": "reorder_threshold는 숫자여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not (math.isfinite(reorder_threshold) and reorder_threshold >= 0):  # nan / inf 거부
+            return Response({"error": "reorder_threshold는 0 이상의 유한한 숫자여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        inventory = get_object_or_404(Inventory, ingredient__id=ingredient_id, ingredient__store_id=store_id)
+        Inventory.objects.filter(id=inventory.id).update(reorder_threshold=reorder_threshold)
+        sync_stock_ratios([inventory.id])  # ✅ Redis 재고 비율 갱신
+
+        return Response(
+            {
+                "ingredient_id": str(ingredient_id),
+                "remaining_stock": inventory.remaining_stock,
+                "reorder_threshold": reorder_threshold,
+            },
+            status=status.HTTP_200_OK,
+        )
+
  
 
 
 class UseIngredientStockView(APIView):
+    throttle_scope = "inventory_write"
     
     @swagger_auto_schema(
         operation_summary="특정 재료 재고 사용",
@@ -74,15 +178,16 @@ class UseIngredientStockView(APIView):
             total_usage = used_stock_so_far + used_stock  # 기존 사용량 + 새로 요청된 사용량
 
             if total_usage > original_stock:
-                print(f"❌ [오류] REQUEST_ID: {request_id}, 총 사용량({total_usage})이 original_stock({original_stock})보다 큼")
+                logger.info("❌ 재고 초과 사용 요청 %s: 총 사용량(%s) > original_stock(%s)", request_id, total_usage, original_stock)
                 return Response({"error": f"최대 사용 가능한 재고는 {original_stock - used_stock_so_far}입니다."}, status=status.HTTP_400_BAD_REQUEST)
 
             # ✅ 재고 차감 로직
             Inventory.objects.filter(id=inventory.id).update(remaining_stock=F('remaining_stock') - used_stock)
+            record_movements("consume", [(inventory.id, -used_stock)], request_id=request_id)  # ✅ 변동 이력 기록
             inventory.refresh_from_db()  # ✅ 최신 상태 반영
             after_stock = inventory.remaining_stock
 
-            print(f"✅ [재고 차감 완료] REQUEST_ID: {request_id}, 차감 전: {before_stock}, 차감할 수량: {used_stock}, 차감 후: {after_stock}")
+            logger.debug("✅ 재고 차감 완료 %s: 차감 전 %s, 차감 %s, 차감 후 %s", request_id, before_stock, used_stock, after_stock)
 
         return Response(
             {
@@ -97,9 +202,148 @@ class UseIngredientStockView(APIView):
 
 
 
+# ✅ 재료 소진 예측
+class StockDepletionView(APIView):
+
+    @swagger_auto_schema(
+        operation_summary="특정 상점의 재료 소진 예상일 조회",
+        responses={200: "재료별 일 평균 사용량 및 소진까지 남은 일수 반환"}
+    )
+
+    def get(self, request, store_id):
+        """ 지수가중 일 평균 사용량 기준 소진까지 남은 일수 """
+        from .depletion import get_depletion_forecast  # 🔥 numpy는 예측 요청 시에만 로드 (지연 임포트)
+
+        return Response(get_depletion_forecast(store_id), status=status.HTTP_200_OK)
+
+
+# ✅ 여러 재료 재고 한 번에 사용
+class BatchUseIngredientStockView(APIView):
+    throttle_scope = "inventory_write"
+
+    @swagger_auto_schema(
+        operation_summary="여러 재료 재고 일괄 사용",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "items": openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(
+                        type=openapi.TYPE_OBJECT,
+                        properties={
+                            "ingredient_id": openapi.Schema(type=openapi.TYPE_STRING, description="재료 ID"),
+                            "used_stock": openapi.Schema(type=openapi.TYPE_NUMBER, description="사용할 재고량"),
+                        },
+                        required=["ingredient_id", "used_stock"]
+                    )
+                )
+            },
+            required=["items"]
+        ),
+        responses={200: "재고 사용 성공", 400: "유효성 검사 실패", 404: "재료를 찾을 수 없음"}
+    )
+
+    def post(self, request, store_id):
+        """ 여러 재료의 재고를 한 트랜잭션에서 사용 처리 (X-Request-ID 기준 멱등) """
+        header_request_id = request.META.get("HTTP_X_REQUEST_ID")
+        request_id = header_request_id or f"REQ-{now().strftime('%H%M%S%f')}"
+        items = request.data.get("items")
+
+        if not isinstance(items, list) or not items:
+            return Response({"error": "items는 비어 있지 않은 리스트여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # ✅ 재료별 사용량 합산 (같은 재료가 여러 번 와도 한 번만 잠금)
+        usages = {}
+        for item in items:
+            try:
+                ingredient_id = uuid.UUID(str(item["ingredient_id"]))
+                used_stock = Decimal(str(item["used_stock"]))
+                if not used_stock.is_finite():  # "NaN" / "Infinity" 거부
+                    raise ValueError
+            except (KeyError, TypeError, ValueError, InvalidOperation):
+                return Response({"error": "각 항목에는 올바른 ingredient_id와 used_stock이 필요합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+            if used_stock <= 0:
+                return Response({"error": f"used_stock은 0보다 커야 합니다. ({ingredient_id})"}, status=status.HTTP_400_BAD_REQUEST)
+
+            usages[ingredient_id] = usages.get(ingredient_id, Decimal("0")) + used_stock
+
+        with transaction.atomic():
+            # ✅ PK 순서대로 필요한 행만 잠금 → 동시 요청 간 교착 상태 방지
+            inventories = list(
+                Inventory.objects.select_for_update(of=("self",))
+                .select_related("ingredient")
+                .filter(ingredient_id__in=usages.keys(), ingredient__store_id=store_id)
+                .order_by("pk")
+            )
+
+            found_ids = {inv.ingredient_id for inv in inventories}
+            missing_ids = [str(ingredient_id) for ingredient_id in usages if ingredient_id not in found_ids]
+            if missing_ids:
+                return Response({"error": "재고를 찾을 수 없는 재료가 있습니다.", "ingredient_ids": missing_ids}, status=status.HTTP_404_NOT_FOUND)
+
+            # ✅ 같은 X-Request-ID로 이미 처리된 요청이면 재적용하지 않고 현재 상태 반환
+            if header_request_id and InventoryMovement.objects.filter(
+                request_id=header_request_id, inventory__in=inventories
+            ).exists():
+                return Response(
+                    {"request_id": header_request_id, "replayed": True, "items": self._serialize(inventories)},
+                    status=status.HTTP_200_OK,
+                )
+
+            # ✅ 전체 검증 후 하나라도 실패하면 아무것도 차감하지 않음
+            errors = []
+            for inv in inventories:
+                before_stock = Decimal(str(inv.remaining_stock))
+                if usages[inv.ingredient_id] > before_stock:
+                    errors.append({
+                        "ingredient_id": str(inv.ingredient_id),
+                        "error": f"최대 사용 가능한 재고는 {before_stock}입니다.",
+                    })
+            if errors:
+                return Response({"error": "재고가 부족한 재료가 있습니다.", "items": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+            # ✅ CASE WHEN 한 번의 UPDATE로 모든 재료 차감
+            Inventory.objects.filter(pk__in=[inv.pk for inv in inventories]).update(
+                remaining_stock=Case(
+                    *[
+                        When(pk=inv.pk, then=F("remaining_stock") - Value(float(usages[inv.ingredient_id])))
+                        for inv in inventories
+                    ],
+                    output_field=FloatField(),
+                )
+            )
+            record_movements(
+                "consume",
+                [(inv.pk, -usages[inv.ingredient_id]) for inv in inventories],
+                request_id=request_id,
+            )
+
+            # ✅ 행을 잠근 상태에서 계산했으므로 다시 조회하지 않음
+            for inv in inventories:
+                inv.remaining_stock = float(Decimal(str(inv.remaining_stock)) - usages[inv.ingredient_id])
+
+        return Response(
+            {"request_id": request_id, "replayed": False, "items": self._serialize(inventories)},
+            status=status.HTTP_200_OK,
+        )
+
+    def _serialize(self, inventories):
+        return [
+            {
+                "ingredient_id": str(inv.ingredient_id),
+                "ingredient_name": inv.ingredient.name,
+                "original_stock": inv.ingredient.purchase_quantity,
+                "remaining_stock": inv.remaining_stock,
+                "unit": inv.ingredient.unit,
+            }
+            for inv in inventories
+        ]
+
 
 # ✅ 레시피 삭제 시 재료 재고 복구
 class DeleteRecipeView(APIView):
+    throttle_scope = "inventory_write"
     
     @swagger_auto_schema(
         operation_summary="레시피 삭제 및 재료 재고 복구",
@@ -111,11 +355,13 @@ class DeleteRecipeView(APIView):
         recipe_items = RecipeItem.objects.filter(recipe=recipe)
 
         with transaction.atomic():  # ✅ 트랜잭션 적용
+            restored = []
             for item in recipe_items:
                 inventory_item = Inventory.objects.filter(ingredient=item.ingredient).first()
                 if inventory_item:
                     max_stock = inventory_item.ingredient.purchase_quantity  # ✅ 최신 original_stock
-                    new_remaining_stock = inventory_item.remaining_stock + item.quantity_used
+                    before_stock = Decimal(str(inventory_item.remaining_stock))
+                    new_remaining_stock = before_stock + item.quantity_used
 
                     # 🔥 만약 original_stock보다 남은 재고가 더 크다면 조정
                     if new_remaining_stock > max_stock:
@@ -123,6 +369,9 @@ class DeleteRecipeView(APIView):
 
                     inventory_item.remaining_stock = new_remaining_stock
                     inventory_item.save()
+                    restored.append((inventory_item.id, new_remaining_stock - before_stock))
+
+            record_movements("recipe_restore", restored)  # ✅ 변동 이력 기록
 
             # ✅ 레시피 및 연결된 RecipeItem 삭제
             recipe_items.delete()
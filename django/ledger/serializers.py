@@ -4,6 +4,9 @@ from store.models import Store
 from ledger.models import Transaction, Category
 from datetime import datetime
 from rest_framework.exceptions import ValidationError
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class CategorySerializer(serializers.ModelSerializer):
@@ -47,9 +50,6 @@ class TransactionSerializer(serializers.ModelSerializer):
 
         date_data = self.context["request"].data.get("date", {})
         
-        # ✅ 날짜 디버깅 추가
-        print(f"📌 [DEBUG] 받은 date 데이터: {date_data}")
-        
         try:
             transaction_date = datetime(
                 year=date_data["year"], month=date_data["month"], day=date_data["day"]
@@ -57,8 +57,6 @@ class TransactionSerializer(serializers.ModelSerializer):
         except KeyError:
             raise ValidationError({"date": "year, month, day 값을 포함해야 합니다."})
         
-        print(f"📌 [DEBUG] 변환된 transaction_date: {transaction_date}")
-
         # ✅ `request.user`를 사용해 현재 로그인한 사용자 자동 저장
         transaction = Transaction.objects.create(
             user=self.context["request"].user,
@@ -70,7 +68,7 @@ class TransactionSerializer(serializers.ModelSerializer):
             description=validated_data.get("description", ""),
         )
 
-        print(f"📌 [DEBUG] 저장된 Transaction ID: {transaction.id}, 날짜: {transaction.date}")
+        logger.debug("📌 거래 저장: %s (날짜 %s, 요청 date %s)", transaction.id, transaction.date, date_data)
 
         return transaction
 
@@ -1,3 +1,25 @@
-from django.test import TestCase
+from datetime import date
+from livflow.testing import QueryBudgetTestCase
 
-# Create your tests here.
+
+class LedgerQueryBudgetTests(QueryBudgetTestCase):
+    def setUp(self):
+        today = date.today()
+        self.params = {"year": today.year, "month": today.month}
+
+    def test_transaction_list(self):
+        self.assertQueryBudget(2, lambda client, store: client.get(f"/api/ledger/{store.id}/transactions/", self.params))
+
+    def test_transaction_list_day(self):
+        params = {**self.params, "day": date.today().day}
+        self.assertQueryBudget(2, lambda client, store: client.get(f"/api/ledger/{store.id}/transactions/", params))
+
+    def test_calendar_month(self):
+        self.assertQueryBudget(6, lambda client, store: client.get(f"/api/ledger/{store.id}/calendar/", self.params))
+
+    def test_calendar_day(self):
+        params = {**self.params, "day": date.today().day}
+        self.assertQueryBudget(2, lambda client, store: client.get(f"/api/ledger/{store.id}/calendar/", params))
+
+    def test_category_list(self):
+        self.assertQueryBudget(1, lambda client, store: client.get("/api/ledger/categories/"))
@@ -13,11 +13,15 @@ from datetime import date
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from django.db import transaction
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 # ✅ 1️⃣ 거래 내역 목록 조회 & 생성
 class LedgerTransactionListCreateView(APIView):  
     permission_classes = [IsAuthenticated]
+    throttle_scope = "ledger_write"
     
     @swagger_auto_schema(
         operation_summary="특정 상점의 모든 거래 내역 조회",
@@ -31,8 +35,6 @@ class LedgerTransactionListCreateView(APIView):
         month = request.GET.get("month")
         day = request.GET.get("day")
 
-        print(f"📌 [DEBUG] 요청된 파라미터 - year: {year}, month: {month}, day: {day}")
-
         try:
             year = int(year)
             month = int(month)
@@ -41,12 +43,11 @@ class LedgerTransactionListCreateView(APIView):
             return Response({"error": "year, month, day는 숫자여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
 
         # ✅ ledger.models.Transaction을 조회하도록 변경
-        transactions = Transaction.objects.filter(store=store, date__year=year, date__month=month).order_by("created_at")
+        transactions = Transaction.objects.filter(store=store, date__year=year, date__month=month).select_related("category").order_by("created_at")
         if day:
             transactions = transactions.filter(date__day=day)
 
-        print(f"📌 [DEBUG] SQL Query: {transactions.query}")  
-        print(f"📌 [DEBUG] 필터링된 거래 개수: {transactions.count()}")  
+        logger.debug("📌 거래 내역 조회 - year: %s, month: %s, day: %s", year, month, day)
 
         serializer = TransactionSerializer(transactions, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -75,17 +76,11 @@ class LedgerTransactionListCreateView(APIView):
 
                     # ✅ DB에 즉시 반영 확인
                     transaction_obj.refresh_from_db()
-                    print(f"📌 [DEBUG] 저장된 Transaction - ID: {transaction_obj.id}, 날짜: {transaction_obj.date}")
-
-                    # ✅ 저장 후 즉시 DB에서 다시 조회
-                    db_check = Transaction.objects.filter(id=transaction_obj.id).exists()
-                    if not db_check:
-                        print(f"⚠️ [ERROR] `ledger_transaction` 테이블이 아니라 다른 테이블에 저장되었을 가능성 있음!")
 
                 return Response(TransactionSerializer(transaction_obj).data, status=status.HTTP_201_CREATED)
 
             except Exception as e:
-                print(f"⚠️ [ERROR] 트랜잭션 저장 실패: {e}")
+                logger.exception("⚠️ 거래 저장 실패: %s", e)
                 return Response({"error": "트랜잭션 저장 중 오류 발생"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -97,6 +92,7 @@ class LedgerTransactionListCreateView(APIView):
 # ✅ 2️⃣ 특정 거래 내역 조회, 수정, 삭제
 class LedgerTransactionDetailView(APIView):  
     permission_classes = [IsAuthenticated]
+    throttle_scope = "ledger_write"
     
     @swagger_auto_schema(
         operation_summary="특정 거래 내역 조회",
@@ -163,6 +159,7 @@ class LedgerTransactionDetailView(APIView):
 # ✅ 3️⃣ 카테고리 목록 조회 & 생성
 class CategoryListCreateView(APIView):
     permission_classes = [IsAuthenticated]
+    throttle_scope = "ledger_write"
 
     @swagger_auto_schema(
         operation_summary="특정 월의 거래 내역 조회",
@@ -198,6 +195,7 @@ class CategoryListCreateView(APIView):
 # ✅ 4️⃣ 특정 카테고리 조회, 수정, 삭제 (`category_id`를 UUID로 변경)
 class CategoryDetailView(APIView):
     permission_classes = [IsAuthenticated]
+    throttle_scope = "ledger_write"
 
     @swagger_auto_schema(
         operation_summary="특정 카테고리 조회",
@@ -252,14 +250,10 @@ class LedgerCalendarView(APIView):
     )
 
     def get(self, request, store_id):
-        print("🚀🚀🚀 GET 요청이 들어왔습니다!") 
-        
         year = request.GET.get("year")
         month = request.GET.get("month")
         day = request.GET.get("day")  # ✅ day 추가
 
-        print(f"📌 [DEBUG] 요청된 파라미터 - year: {year}, month: {month}, day: {day}")  # ✅ 입력값 확인
-
         if not year or not month:
             return Response({"error": "year와 month 쿼리 파라미터가 필요합니다."}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -280,9 +274,7 @@ class LedgerCalendarView(APIView):
 
         transactions = Transaction.objects.filter(**filters)
 
-        print(f"📌 [DEBUG] SQL Query: {transactions.query}")  # ✅ 실제 SQL 확인
-        print(f"📌 [DEBUG] 필터링된 거래 개수: {transactions.count()}")  # ✅ 데이터 개수 확인
-        print(f"📌 [DEBUG] 필터링된 거래 목록: {list(transactions.values('date', 'amount', 'transaction_type'))}")  # ✅ 실제 데이터 확인
+        logger.debug("📌 캘린더 조회 - store: %s, year: %s, month: %s, day: %s", store_id, year, month, day)
 
         if day:
             # ✅ 특정 날짜의 거래 내역 응답
@@ -294,7 +286,7 @@ class LedgerCalendarView(APIView):
                     "detail": t.description or "",
                     "cost": float(t.amount)
                 }
-                for t in transactions
+                for t in transactions.select_related("category")
             ]
         else:
             # ✅ 특정 월의 달력 & 차트 데이터 응답
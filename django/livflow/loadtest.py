@@ -0,0 +1,214 @@
+"""
+부하 테스트 (manage.py loadtest)
+
+- 가상 사용자(VU)마다 시드된 상점 하나를 맡아, 카페 사용 패턴을 본뜬 시나리오를 가중치대로 골라 반복 실행한다.
+    dashboard      앱 첫 화면: 상점 목록 + 재고 부족 목록 + 부족 개수 배지 (동시 요청)
+    calendar       가계부 달력 (월) → 절반은 특정 날짜 상세까지
+    stock_consume  재고 목록 → 재료 1~3개 일괄 사용
+    ledger_entry   거래 내역 등록 → 이번 달 목록
+    recipe_edit    레시피 목록 → 상세 → 수정 (같은 재료 구성으로 PUT)
+- 워밍업 구간의 요청은 집계하지 않는다.
+- 결과: 엔드포인트(라우트 패턴)별 요청 수 / 초당 처리량 / 상태 코드 / 지연시간(ms) mean·p50·p95·p99·max
+- 속도 제한(429) 응답은 throttled 로 따로 세고 요청 수 / 처리량 / 지연시간 / 오류에서 뺀다.
+  쓰기 시나리오는 RATE_LIMIT_LEDGER_WRITE / RATE_LIMIT_INVENTORY_WRITE (기본 120/min) 에 금방 걸리므로
+  대상 서버는 이 값을 크게 올려서 띄운다. (예: RATE_LIMIT_LEDGER_WRITE=1000000/min)
+"""
+import asyncio
+import math
+import random
+import time
+from collections import Counter, defaultdict
+from datetime import date
+import httpx
+
+DEFAULT_MIX = {
+    "dashboard": 35,
+    "calendar": 25,
+    "stock_consume": 20,
+    "ledger_entry": 15,
+    "recipe_edit": 5,
+}
+
+THROTTLED = 429
+
+LEDGER_CATEGORIES = {
+    "income": ["매출", "배달 매출", "단체 주문"],
+    "expense": ["원두", "우유", "포장재", "공과금"],
+}
+
+
+def percentile(sorted_values, q):
+    """ 최근접 순위(nearest-rank) 백분위수 """
+    if not sorted_values:
+        return None
+    return sorted_values[max(0, math.ceil(q / 100 * len(sorted_values)) - 1)]
+
+
+class Stats:
+    """ 엔드포인트별 지연시간 / 상태 코드 집계 (recording 이 True 일 때만 기록, 429 는 throttled 로 따로) """
+
+    def __init__(self):
+        self.recording = False
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.throttled = Counter()
+        self.scenarios = Counter()
+
+    def record(self, endpoint, status, seconds):
+        if not self.recording:
+            return
+        if status == THROTTLED:
+            self.throttled[endpoint] += 1
+            return
+        self.latencies[endpoint].append(seconds * 1000)
+        self.statuses[endpoint][status] += 1
+
+    def _summary(self, latencies, statuses, throttled, elapsed):
+        latencies = sorted(latencies)
+        errors = sum(count for status, count in statuses.items() if not str(status).startswith("2"))
+        return {
+            "requests": len(latencies),
+            "throughput_rps": round(len(latencies) / elapsed, 2),
+            "errors": errors,
+            "error_rate": round(errors / len(latencies), 4) if latencies else 0,
+            "throttled": throttled,
+            "status": {str(status): count for status, count in sorted(statuses.items(), key=lambda item: str(item[0]))},
+            "latency_ms": {
+                "mean": round(sum(latencies) / len(latencies), 2) if latencies else None,
+                "p50": _round(percentile(latencies, 50)),
+                "p95": _round(percentile(latencies, 95)),
+                "p99": _round(percentile(latencies, 99)),
+                "max": _round(latencies[-1] if latencies else None),
+            },
+        }
+
+    def report(self, elapsed):
+        total_statuses = Counter()
+        for statuses in self.statuses.values():
+            total_statuses.update(statuses)
+        all_latencies = [ms for latencies in self.latencies.values() for ms in latencies]
+
+        return {
+            "duration_s": round(elapsed, 2),
+            "total": self._summary(all_latencies, total_statuses, sum(self.throttled.values()), elapsed),
+            "scenarios": dict(self.scenarios.most_common()),
+            "endpoints": {
+                endpoint: self._summary(self.latencies[endpoint], self.statuses[endpoint], self.throttled[endpoint], elapsed)
+                for endpoint in sorted(set(self.latencies) | set(self.throttled))
+            },
+        }
+
+
+def _round(value):
+    return round(value, 2) if value is not None else None
+
+
+class VirtualUser:
+    """ 상점 하나를 맡은 가상 사용자 """
+
+    def __init__(self, client, stats, target, rng):
+        self.client = client
+        self.stats = stats
+        self.rng = rng
+        self.store_id = target["store_id"]
+        self.recipe_ids = target["recipe_ids"]
+        self.ingredient_ids = target["ingredient_ids"]
+        self.headers = {"Authorization": f"Bearer {target['token']}"}
+
+    async def request(self, method, route, **kwargs):
+        """ route 는 집계용 URL 패턴 ("/api/ledger/{store_id}/calendar/"), 실제 경로는 store_id 등을 채워 만든다 """
+        path_params = kwargs.pop("path_params", {})
+        url = route.format(store_id=self.store_id, **path_params)
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=self.headers, **kwargs)
+        except httpx.HTTPError as e:
+            self.stats.record(f"{method} {route}", type(e).__name__, time.perf_counter() - started)
+            return None
+        self.stats.record(f"{method} {route}", response.status_code, time.perf_counter() - started)
+        return response
+
+    async def dashboard(self):
+        await asyncio.gather(
+            self.request("GET", "/api/stores/"),
+            self.request("GET", "/api/inventory/low-stock/"),
+            self.request("GET", "/api/inventory/{store_id}/low-stock/count/"),
+        )
+
+    async def calendar(self):
+        today = date.today()
+        params = {"year": today.year, "month": today.month}
+        await self.request("GET", "/api/ledger/{store_id}/calendar/", params=params)
+        if self.rng.random() < 0.5:
+            params["day"] = self.rng.randint(1, today.day)
+            await self.request("GET", "/api/ledger/{store_id}/calendar/", params=params)
+
+    async def stock_consume(self):
+        await self.request("GET", "/api/inventory/{store_id}/")
+        items = [
+            {"ingredient_id": ingredient_id, "used_stock": round(self.rng.uniform(0.1, 2), 2)}
+            for ingredient_id in self.rng.sample(self.ingredient_ids, min(len(self.ingredient_ids), self.rng.randint(1, 3)))
+        ]
+        await self.request("POST", "/api/inventory/{store_id}/use/", json={"items": items})
+
+    async def ledger_entry(self):
+        today = date.today()
+        transaction_type = "income" if self.rng.random() < 0.6 else "expense"
+        await self.request("POST", "/api/ledger/{store_id}/transactions/", json={
+            "type": transaction_type,
+            "category": self.rng.choice(LEDGER_CATEGORIES[transaction_type]),
+            "cost": round(self.rng.uniform(3000, 150000), -2),
+            "detail": "부하 테스트",
+            "date": {"year": today.year, "month": today.month, "day": today.day},
+        })
+        await self.request("GET", "/api/ledger/{store_id}/transactions/", params={"year": today.year, "month": today.month})
+
+    async def recipe_edit(self):
+        await self.request("GET", "/api/costcalcul/{store_id}/")
+        recipe_id = self.rng.choice(self.recipe_ids)
+        route = "/api/costcalcul/{store_id}/{recipe_id}/"
+        response = await self.request("GET", route, path_params={"recipe_id": recipe_id})
+        if response is None or response.status_code != 200:
+            return
+
+        recipe = response.json()
+        await self.request("PUT", route, path_params={"recipe_id": recipe_id}, json={
+            "recipe_name": recipe["recipe_name"],
+            "recipe_cost": round(self.rng.uniform(3000, 7000), -2),
+            "ingredients": recipe["ingredients"],
+        })
+
+    async def run(self, mix, deadline, think_time):
+        names = list(mix)
+        weights = [mix[name] for name in names]
+        while time.monotonic() < deadline:
+            name = self.rng.choices(names, weights)[0]
+            await getattr(self, name)()
+            if self.stats.recording:
+                self.stats.scenarios[name] += 1
+            if think_time:
+                await asyncio.sleep(self.rng.expovariate(1 / think_time))
+
+
+async def run_load(base_url, targets, concurrency, duration, warmup=5, think_time=0.0, mix=None, seed=42, timeout=10.0):
+    """
+    targets: [{"token", "store_id", "recipe_ids", "ingredient_ids"}, ...] — VU i 는 targets[i % len] 사용
+    think_time: 시나리오 사이 평균 대기 초 (지수분포, 0이면 쉬지 않고 요청 → 최대 처리량 측정)
+    """
+    stats = Stats()
+    limits = httpx.Limits(max_connections=concurrency * 3, max_keepalive_connections=concurrency * 3)
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        started = time.monotonic()
+        deadline = started + warmup + duration
+        users = [
+            VirtualUser(client, stats, targets[i % len(targets)], random.Random(seed + i))
+            for i in range(concurrency)
+        ]
+        tasks = [asyncio.create_task(user.run(mix or DEFAULT_MIX, deadline, think_time)) for user in users]
+
+        await asyncio.sleep(warmup)
+        stats.recording = True
+        measured_from = time.monotonic()
+        await asyncio.gather(*tasks)
+
+    return stats.report(time.monotonic() - measured_from)
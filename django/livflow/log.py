@@ -0,0 +1,155 @@
+"""
+로깅 구성 (settings.LOGGING_CONFIG = "livflow.log.configure")
+
+- LOGGING 설정을 dictConfig 로 적용한 뒤, 각 로거의 핸들러를 QueueHandler 하나로 바꾸고
+  실제 출력(포맷 + 쓰기)은 QueueListener 스레드에서 처리한다. → 요청 스레드는 큐에 넣기만 함
+- 요청 ID: RequestIDMiddleware 가 X-Request-ID 헤더(없으면 새로 생성)를 contextvar 에 저장하고,
+  큐에 넣을 때 record.request_id 로 붙인다. 응답 헤더에도 같은 값을 돌려준다.
+- JsonFormatter: 한 줄 JSON (time, level, logger, message, request_id, exc_info, extra 필드)
+"""
+import atexit
+import contextvars
+import copy
+import json
+import logging
+import logging.config
+import logging.handlers
+import os
+import queue
+import uuid
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+_request_id = contextvars.ContextVar("request_id", default="-")
+
+# LogRecord 기본 속성 (이 외의 속성은 logger.info(..., extra={...}) 로 넘긴 값)
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "request_id"}
+
+
+def get_request_id():
+    """ 현재 요청 ID (요청 밖에서는 "-") """
+    return _request_id.get()
+
+
+class RequestIDFilter(logging.Filter):
+    def filter(self, record):
+        record.request_id = _request_id.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        payload = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exc_info"] = record.exc_text
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                payload[key] = value
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """ 메시지 / 예외만 문자열로 만들어 넣고 포맷은 리스너 쪽 핸들러에 맡긴다 """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_listeners = []
+
+
+def _enqueue(logger, listeners_by_handlers):
+    handlers = tuple(logger.handlers)
+    if not handlers:
+        return
+
+    queue_handler = listeners_by_handlers.get(handlers)
+    if queue_handler is None:
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _listeners.append(listener)
+        queue_handler = listeners_by_handlers[handlers] = _QueueHandler(log_queue)
+        queue_handler.addFilter(RequestIDFilter())
+
+    logger.handlers = [queue_handler]
+
+
+def stop_listeners():
+    """ 남은 로그를 모두 쓰고 리스너 스레드 종료 """
+    while _listeners:
+        _listeners.pop().stop()
+
+
+def configure(logging_settings):
+    """ Django LOGGING_CONFIG 진입점 """
+    stop_listeners()
+    if not logging_settings:
+        return
+
+    logging.config.dictConfig(logging_settings)
+
+    listeners_by_handlers = {}
+    _enqueue(logging.getLogger(), listeners_by_handlers)
+    for name in logging_settings.get("loggers", {}):
+        _enqueue(logging.getLogger(name), listeners_by_handlers)
+
+
+def _restart_listeners_in_child():
+    """ fork 된 자식(ProcessPoolExecutor 워커, gunicorn --preload 등)에는 리스너 스레드가 없으므로 다시 띄운다 """
+    for listener in _listeners:
+        listener._thread = None
+        listener.start()
+
+
+atexit.register(stop_listeners)
+os.register_at_fork(after_in_child=_restart_listeners_in_child)
+
+
+class RequestIDMiddleware:
+    """ 요청 ID 를 로그 레코드와 응답 헤더(X-Request-ID)에 연결 (WSGI / ASGI 모두 지원) """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def _start(self, request):
+        request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+        return request_id, _request_id.set(request_id)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        request_id, token = self._start(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_id.reset(token)
+        response["X-Request-ID"] = request_id
+        return response
+
+    async def __acall__(self, request):
+        request_id, token = self._start(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_id.reset(token)
+        response["X-Request-ID"] = request_id
+        return response
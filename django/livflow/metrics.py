@@ -0,0 +1,142 @@
+"""
+요청별 성능 지표 (Prometheus)
+
+- MetricsMiddleware: 라우트(URL 패턴)별 응답 시간, DB 쿼리 수 / 시간, Redis 호출 수, 응답 크기 히스토그램
+- DB 쿼리는 모든 DB 연결에 execute_wrapper 를 걸어 세고, Redis 호출은 livflow.redis_client 가 알려준다.
+  요청별 집계는 contextvar 에 두므로 sync_to_async 스레드에서 실행된 쿼리도 같은 요청으로 잡힌다.
+- /metrics: Prometheus 텍스트 형식. PROMETHEUS_MULTIPROC_DIR 이 있으면 gunicorn 워커 전체를 합산한다.
+  (gunicorn.conf.py 가 디렉터리 설정 / 정리를 담당)
+"""
+import contextvars
+import os
+import time
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.http import HttpResponse
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Histogram, generate_latest, multiprocess
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "요청 처리 시간", ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+DB_QUERIES = Histogram(
+    "http_request_db_queries", "요청당 DB 쿼리 수", ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+DB_TIME = Histogram(
+    "http_request_db_seconds", "요청당 DB 쿼리 시간 합계", ["route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+REDIS_CALLS = Histogram(
+    "http_request_redis_calls", "요청당 Redis 왕복 수 (파이프라인은 1회)", ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20),
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes", "응답 본문 크기", ["route"],
+    buckets=(100, 1000, 10000, 100000, 1000000),
+)
+
+_request_stats = contextvars.ContextVar("request_stats", default=None)
+
+
+class _RequestStats:
+    __slots__ = ("queries", "db_seconds", "redis_calls")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.redis_calls = 0
+
+
+def record_redis_call():
+    """ Redis 왕복 1회 기록 (요청 밖에서는 무시) """
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.redis_calls += 1
+
+
+def _count_queries(execute, sql, params, many, context):
+    stats = _request_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.queries += 1
+        stats.db_seconds += time.perf_counter() - started
+
+
+@receiver(connection_created)
+def _install_query_counter(sender, connection, **kwargs):
+    if _count_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_count_queries)
+
+
+def _route(request):
+    match = getattr(request, "resolver_match", None)
+    return match.route if match is not None else "<unmatched>"
+
+
+class MetricsMiddleware:
+    """ 요청별 지표 기록 (WSGI / ASGI 모두 지원) """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        for connection in connections.all(initialized_only=True):  # 미들웨어 로드 전에 열린 연결
+            _install_query_counter(None, connection)
+
+    def _observe(self, request, response, stats, started):
+        route = _route(request)
+        REQUEST_LATENCY.labels(request.method, route, response.status_code).observe(time.perf_counter() - started)
+        DB_QUERIES.labels(route).observe(stats.queries)
+        DB_TIME.labels(route).observe(stats.db_seconds)
+        REDIS_CALLS.labels(route).observe(stats.redis_calls)
+        if not response.streaming:
+            RESPONSE_SIZE.labels(route).observe(len(response.content))
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        stats = _RequestStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_stats.reset(token)
+        self._observe(request, response, stats, started)
+        return response
+
+    async def __acall__(self, request):
+        stats = _RequestStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_stats.reset(token)
+        self._observe(request, response, stats, started)
+        return response
+
+
+def metrics_view(request):
+    """ Prometheus 수집 엔드포인트 (METRICS_TOKEN 이 설정되면 Bearer 토큰 필요) """
+    if settings.METRICS_TOKEN and request.headers.get("Authorization") != f"Bearer {settings.METRICS_TOKEN}":
+        return HttpResponse(status=403)
+
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
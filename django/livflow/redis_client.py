@@ -0,0 +1,73 @@
+"""
+공용 Redis 접근 계층
+
+- 연결 풀은 프로세스별로 처음 사용할 때 만든다. (임포트/워커 부팅 시 Redis 에 연결하지 않음)
+- fork 된 워커는 pid 가 바뀌므로 부모의 풀을 공유하지 않고 새 풀을 만든다.
+- 소켓 타임아웃과 헬스 체크로 Redis 장애 시 요청이 오래 묶이지 않게 한다.
+- 명령 / 파이프라인 실행마다 요청 지표(livflow.metrics)에 왕복 1회를 기록한다.
+"""
+import os
+import threading
+from contextlib import contextmanager
+import redis
+from django.conf import settings
+from livflow.metrics import record_redis_call
+
+class _CountingPipeline(redis.client.Pipeline):
+    def execute(self, raise_on_error=True):
+        if self.command_stack:
+            record_redis_call()
+        return super().execute(raise_on_error)
+
+
+class _CountingRedis(redis.Redis):
+    def execute_command(self, *args, **options):
+        record_redis_call()
+        return super().execute_command(*args, **options)
+
+    def pipeline(self, transaction=True, shard_hint=None):
+        return _CountingPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+
+_lock = threading.Lock()
+_client = None
+_client_pid = None
+
+
+def get_redis():
+    """ 현재 프로세스의 공용 Redis 클라이언트 (연결 풀 공유, 지연 생성) """
+    global _client, _client_pid
+
+    pid = os.getpid()
+    if _client is None or _client_pid != pid:
+        with _lock:
+            if _client is None or _client_pid != pid:
+                pool = redis.ConnectionPool(
+                    host=settings.REDIS_HOST,
+                    port=settings.REDIS_PORT,
+                    db=settings.REDIS_DB,
+                    decode_responses=True,
+                    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                    socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+                    health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+                    max_connections=settings.REDIS_MAX_CONNECTIONS,
+                )
+                _client = _CountingRedis(connection_pool=pool)
+                _client_pid = pid
+    return _client
+
+
+@contextmanager
+def pipeline(transaction=False):
+    """
+    여러 명령을 왕복 한 번으로 보내는 파이프라인.
+    with 블록이 정상 종료되면 남은 명령을 execute() 한다.
+    결과가 필요하면 블록 안에서 pipe.execute() 를 직접 호출한다.
+    """
+    pipe = get_redis().pipeline(transaction=transaction)
+    try:
+        yield pipe
+        if len(pipe):
+            pipe.execute()
+    finally:
+        pipe.reset()
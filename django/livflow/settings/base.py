@@ -40,12 +40,14 @@ CUSTOM_INSTALLED_APPS = [
     'ledger',
     'ingredients',
     'inventory',
-    'salesforcast', 
+    'salesforecast',
 ]
 
 INSTALLED_APPS = DEFAULT_DJANGO_APPS + CUSTOM_INSTALLED_APPS
 
 MIDDLEWARE = [
+    'livflow.log.RequestIDMiddleware',
+    'livflow.metrics.MetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -67,6 +69,46 @@ STATIC_ROOT = '/app/staticfiles'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
+# ✅ Redis (livflow.redis_client 에서 프로세스별 연결 풀로 사용)
+REDIS_HOST = os.getenv("REDIS_HOST", "redis")
+REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
+REDIS_DB = int(os.getenv("REDIS_DB", 0))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", 0.5))
+REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", 0.5))
+REDIS_HEALTH_CHECK_INTERVAL = 30
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))
+
+# ✅ 리프레시 토큰 저장소 (InMemoryTokenStore: 외부 서비스 없는 테스트 / 단일 서버용)
+TOKEN_STORE_BACKEND = os.getenv("TOKEN_STORE_BACKEND", "users.token_store.RedisTokenStore")
+
+# ✅ 인증 사용자 캐시 (users.authentication.CachedJWTAuthentication)
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", 30))  # 프로세스 내 캐시 (초)
+USER_CACHE_REDIS = os.getenv("USER_CACHE_REDIS", "False") == "True"  # 프로세스 간 공유 캐시 사용 여부
+USER_CACHE_REDIS_TTL = int(os.getenv("USER_CACHE_REDIS_TTL", 300))
+
+# ✅ 폐기 토큰 확인 (users.revocation, 프로세스별 Bloom 필터)
+REVOCATION_BLOOM_CAPACITY = int(os.getenv("REVOCATION_BLOOM_CAPACITY", 100000))  # 예상 최대 폐기 토큰 수
+REVOCATION_BLOOM_ERROR_RATE = 0.001  # 오탐률 (오탐 시에만 Redis 확인)
+REVOCATION_BLOOM_REFRESH = int(os.getenv("REVOCATION_BLOOM_REFRESH", 10))  # 필터 재생성 주기 (초) = 다른 워커에서 폐기한 토큰이 통과할 수 있는 최대 시간
+
+# ✅ 소셜 로그인 제공자 HTTP 호출 (users.oauth_client)
+OAUTH_CONNECT_TIMEOUT = float(os.getenv("OAUTH_CONNECT_TIMEOUT", 3))  # 연결 대기 (초)
+OAUTH_READ_TIMEOUT = float(os.getenv("OAUTH_READ_TIMEOUT", 5))  # 응답 대기 (초)
+OAUTH_CONNECT_RETRIES = 2  # 연결 실패 시에만 재시도
+OAUTH_POOL_SIZE = 10  # 제공자별 keep-alive 연결 수
+OAUTH_ENDPOINTS = {}  # {"kakao": {"token": "...", "userinfo": "..."}} 형태로 엔드포인트 덮어쓰기 (테스트용)
+
+# ✅ 요청 제한 (livflow.throttling, Redis 장애 시 제한 없이 통과)
+RATE_LIMIT_FAILOPEN_BACKOFF = 5  # Redis 실패 후 확인을 건너뛰는 시간 (초)
+
+# ✅ 성능 지표 (livflow.metrics, /metrics 엔드포인트)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")  # 설정 시 "Authorization: Bearer <토큰>" 필요
+
+# ✅ 매출 예측 모델 아티팩트 저장 경로
+SALESFORECAST_MODEL_DIR = os.getenv("SALESFORECAST_MODEL_DIR", os.path.join(BASE_DIR, "ml_models", "salesforecast"))
+SALESFORECAST_MODEL_CACHE_SIZE = int(os.getenv("SALESFORECAST_MODEL_CACHE_SIZE", 128))  # 워커별 LRU 모델 수
+SALESFORECAST_KEEP_VERSIONS = 3  # 상점별 보관할 모델 버전 수
+
 # ✅ JWT 인증 설정
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=int(os.getenv("ACCESS_TOKEN_LIFETIME_DAYS", 1))),
@@ -86,11 +128,45 @@ SIMPLE_JWT = {
 # ✅ REST Framework 설정
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_THROTTLE_CLASSES': [
+        'livflow.throttling.TokenBucketThrottle',
+    ],
+    'DEFAULT_THROTTLE_RATES': {  # 뷰의 throttle_scope 별 속도 (사용자 / IP 단위)
+        'oauth': os.getenv('RATE_LIMIT_OAUTH', '10/min'),
+        'token_refresh': os.getenv('RATE_LIMIT_TOKEN_REFRESH', '30/min'),
+        'test_token': os.getenv('RATE_LIMIT_TEST_TOKEN', '10/min'),
+        'ledger_write': os.getenv('RATE_LIMIT_LEDGER_WRITE', '120/min'),
+        'inventory_write': os.getenv('RATE_LIMIT_INVENTORY_WRITE', '120/min'),
+    },
+}
+
+# ✅ 로깅 (livflow.log: 출력은 QueueListener 스레드에서 처리, 요청 ID 포함)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG")
+LOG_LEVELS = dict(  # 모듈별 레벨, 예: LOG_LEVELS="ledger=INFO,users.oauth_client=DEBUG"
+    item.strip().split("=", 1) for item in os.getenv("LOG_LEVELS", "").split(",") if "=" in item
+)
+LOGGING_CONFIG = 'livflow.log.configure'
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'verbose': {'format': '{asctime} {levelname} {name} [{request_id}] {message}', 'style': '{'},
+        'json': {'()': 'livflow.log.JsonFormatter'},
+    },
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler', 'formatter': os.getenv("LOG_FORMAT", "verbose")},
+    },
+    'root': {'handlers': ['console'], 'level': LOG_LEVEL},
+    'loggers': {
+        'django': {'handlers': ['console'], 'level': 'INFO', 'propagate': False},
+        'django.db.backends': {'level': 'WARNING'},
+        **{name: {'level': level.upper()} for name, level in LOG_LEVELS.items()},
+    },
 }
 
 # ✅ Password Validation 설정
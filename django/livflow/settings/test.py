@@ -0,0 +1,30 @@
+"""
+테스트 설정: python manage.py test --settings=livflow.settings.test
+
+SQLite 메모리 DB에서 외부 서비스(Postgres / Redis / OAuth 제공자) 없이 실행한다.
+운영과 같은 앱 / 미들웨어 구성을 쓰기 위해 product 설정을 기반으로 한다.
+"""
+from .product import *
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+        'TEST': {'MIGRATE': False},  # 마이그레이션 대신 현재 모델로 테이블 생성
+    }
+}
+
+# Redis 는 닫힌 포트로 지정 → 연결이 즉시 거부되어 각 모듈의 장애 대체 경로로 동작
+REDIS_HOST = "127.0.0.1"
+REDIS_PORT = 1
+TOKEN_STORE_BACKEND = "users.token_store.InMemoryTokenStore"
+USER_CACHE_REDIS = False
+
+REST_FRAMEWORK = {**REST_FRAMEWORK, 'DEFAULT_THROTTLE_CLASSES': []}
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+SECURE_SSL_REDIRECT = False
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "ERROR")  # 장애 대체 경고 / 4xx 경고 출력 안 함
+LOGGING['root']['level'] = LOG_LEVEL
+LOGGING['loggers']['django']['level'] = LOG_LEVEL
@@ -0,0 +1,94 @@
+"""
+쿼리 수 예산 테스트 도구
+
+- seed_store(user, size): 재료 / 재고 / 레시피 / 거래 내역 / 재고 변동을 size 개씩 만든 상점
+- QueryBudgetTestCase.assertQueryBudget(budget, request_fn):
+  SIZES 의 각 크기로 데이터를 만들어 같은 요청을 보내고, 쿼리 수가 크기와 관계없이 같으며 budget 이하인지 확인한다.
+  → 목록 뷰에서 행마다 쿼리가 나가는(N+1) 회귀를 잡는다.
+
+실행: python manage.py test --settings=livflow.settings.test
+"""
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import localdate, make_aware
+from rest_framework.test import APIClient
+from costcalcul.models import Recipe, RecipeItem
+from ingredients.models import Ingredient
+from inventory.models import Inventory, InventoryMovement
+from ledger.models import Category, Transaction
+from store.models import Store
+from users.models import CustomUser
+
+
+def seed_store(user, size):
+    """
+    사용자에게 상점 size 개를 만들고, 첫 상점에 재료 / 재고 / 레시피 / 카테고리 / 거래 내역 / 재고 변동을 size 개씩 채운다.
+    - 재고는 절반이 재주문 기준 미만
+    - 첫 레시피는 모든 재료를 사용 (상세 조회 N+1 확인용)
+    - 거래 내역은 이번 달, 재고 변동은 어제 날짜
+    """
+    store = Store.objects.create(user=user, name="상점 0")
+    Store.objects.bulk_create([Store(user=user, name=f"상점 {i}") for i in range(1, size)])
+
+    ingredients = Ingredient.objects.bulk_create([
+        Ingredient(store=store, name=f"재료 {i}", purchase_price=Decimal("1000"), purchase_quantity=Decimal("100"), unit="g")
+        for i in range(size)
+    ])
+    inventories = Inventory.objects.bulk_create([
+        Inventory(ingredient=ingredient, remaining_stock=50, reorder_threshold=80 if i % 2 == 0 else 10)
+        for i, ingredient in enumerate(ingredients)
+    ])
+
+    recipes = Recipe.objects.bulk_create([
+        Recipe(store=store, name=f"레시피 {i}", sales_price_per_item=3000) for i in range(size)
+    ])
+    RecipeItem.objects.bulk_create(
+        [RecipeItem(recipe=recipes[0], ingredient=ingredient, quantity_used=Decimal("10"), unit="ml") for ingredient in ingredients]
+        + [RecipeItem(recipe=recipe, ingredient=ingredients[i], quantity_used=Decimal("5"), unit="ml") for i, recipe in enumerate(recipes[1:], 1)]
+    )
+
+    categories = Category.objects.bulk_create([Category(name=f"{user.pk}-카테고리 {i}") for i in range(size)])
+    today = localdate()
+    Transaction.objects.bulk_create([
+        Transaction(
+            user=user, store=store, category=categories[i], date=today,
+            amount=Decimal(1000 + i), transaction_type="income" if i % 2 == 0 else "expense",
+        )
+        for i in range(size)
+    ])
+
+    yesterday = make_aware(datetime.combine(today - timedelta(days=1), time(12)))
+    InventoryMovement.objects.bulk_create([
+        InventoryMovement(inventory=inventory, movement_type="consume", quantity=-5, created_at=yesterday)
+        for inventory in inventories
+    ])
+    return store
+
+
+class QueryBudgetTestCase(TestCase):
+    """ 엔드포인트별 쿼리 수 예산 테스트 기반 클래스 """
+    SIZES = (1, 10, 100)
+
+    def assertQueryBudget(self, budget, request_fn, status_code=200):
+        """
+        request_fn(client, store) 를 SIZES 의 각 크기로 호출해 쿼리 수를 센다.
+        크기마다 새 사용자 / 상점을 만들어 서로 섞이지 않게 한다.
+        """
+        counts = {}
+        for size in self.SIZES:
+            user = CustomUser.objects.create_user(email=f"budget-{size}@example.com")
+            store = seed_store(user, size)
+            client = APIClient()
+            client.force_authenticate(user)
+
+            with CaptureQueriesContext(connection) as ctx:
+                response = request_fn(client, store)
+            self.assertEqual(response.status_code, status_code, response.content[:500])
+            counts[size] = len(ctx.captured_queries)
+
+        queries = "\n".join(q["sql"] for q in ctx.captured_queries)
+        self.assertEqual(len(set(counts.values())), 1, f"데이터 크기에 따라 쿼리 수가 달라짐 {counts}\n{queries}")
+        self.assertLessEqual(counts[self.SIZES[-1]], budget, f"쿼리 예산 초과 {counts}\n{queries}")
@@ -0,0 +1,101 @@
+"""
+Redis 토큰 버킷 요청 제한 (DRF throttle)
+
+- 뷰의 throttle_scope 로 구간을 정하고, 속도는 REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"] 에서 읽는다.
+  예: "oauth": "10/min" → 버킷 크기 10, 분당 10개 충전 (순간 10회까지 허용 후 6초마다 1회)
+- 버킷은 사용자별(로그인) / IP별(비로그인)로 나뉜다. 키: "throttle_<scope>_<user id 또는 IP>"
+- 충전 계산과 차감은 Lua 스크립트 하나로 원자적으로 처리 → 요청당 Redis 왕복 한 번 (EVALSHA)
+- 조회(GET/HEAD/OPTIONS) 요청은 제한하지 않는다.
+- Redis 장애 시에는 제한 없이 통과시키고, RATE_LIMIT_FAILOPEN_BACKOFF 초 동안 Redis 호출을 건너뛴다.
+"""
+import logging
+import time
+import redis
+from django.conf import settings
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.throttling import ScopedRateThrottle
+from livflow.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] = 버킷 키, ARGV[1] = 버킷 크기, ARGV[2] = 초당 충전량
+# 반환: {허용 여부(1/0), 다음 토큰까지 대기 초(문자열)}
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    wait = (1 - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(wait)}
+"""
+
+_script = None
+_script_client = None
+_skip_until = 0.0  # Redis 장애 후 이 시각(monotonic)까지는 확인 없이 통과
+
+
+def _token_bucket():
+    """ 현재 Redis 클라이언트에 등록한 스크립트 (fork 후 클라이언트가 바뀌면 다시 등록) """
+    global _script, _script_client
+
+    client = get_redis()
+    if _script is None or _script_client is not client:
+        _script = client.register_script(TOKEN_BUCKET_SCRIPT)
+        _script_client = client
+    return _script
+
+
+class TokenBucketThrottle(ScopedRateThrottle):
+    """ throttle_scope 가 지정된 뷰의 쓰기 요청만 제한하는 토큰 버킷 """
+
+    def allow_request(self, request, view):
+        global _skip_until
+
+        if request.method in SAFE_METHODS:
+            return True
+
+        self.scope = getattr(view, self.scope_attr, None)
+        if not self.scope:
+            return True
+
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        if time.monotonic() < _skip_until:
+            return True
+
+        try:
+            allowed, wait = _token_bucket()(
+                keys=[self.key], args=[self.num_requests, self.num_requests / self.duration]
+            )
+        except redis.RedisError as e:
+            _skip_until = time.monotonic() + settings.RATE_LIMIT_FAILOPEN_BACKOFF
+            logger.warning("요청 제한 Redis 확인 실패, 제한 없이 통과: %s", e)
+            return True
+
+        self._wait = float(wait)
+        if not allowed:
+            logger.info("요청 제한 초과: %s (%.1f초 후 재시도)", self.key, self._wait)
+        return bool(allowed)
+
+    def wait(self):
+        return getattr(self, "_wait", None)
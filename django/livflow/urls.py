@@ -5,6 +5,7 @@ from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 from django.conf import settings
 from django.conf.urls.static import static
+from livflow.metrics import metrics_view
 
 
 # Swagger 설정
@@ -31,7 +32,8 @@ urlpatterns = [
    path('api/ledger/', include('ledger.urls')),  # 'ledger' 앱의 URL 패턴 추가
    path('api/ingredients/', include('ingredients.urls')),
    path('api/inventory/', include('inventory.urls')),  # ✅ 'inventory.urls'로 수정
-   # path('api/salesforecast/', include('salesforecast.urls')),
+   path('api/salesforecast/', include('salesforecast.urls')),
+   path('metrics', metrics_view, name='metrics'),  # Prometheus 수집
 
    
    
@@ -1,5 +1,23 @@
-from .data_preprocessing import load_sales_data
-from .train_model import build_sales_model
-from .predict import predict_sales
+# ✅ numpy / scikit-learn 은 실제로 사용할 때만 로드 (지연 임포트)
+import importlib
 
-__all__ = ["load_sales_data", "build_sales_model", "predict_sales"]
+_EXPORTS = {
+    "load_transaction_data": "data_preprocessing",
+    "to_daily_series": "data_preprocessing",
+    "load_daily_revenue": "data_preprocessing",
+    "build_features": "data_preprocessing",
+    "build_sales_model": "train_model",
+    "fit_sales_model": "train_model",
+    "predict_sales": "predict",
+    "predict_sales_batch": "predict",
+    "fit_state": "online",
+    "forecast_state": "online",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
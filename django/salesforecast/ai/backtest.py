@@ -0,0 +1,113 @@
+import time
+import numpy as np
+from datetime import date
+from .online import fit_state, forecast_state
+from .predict import predict_sales
+from .train_model import fit_sales_model
+
+SYNTHETIC_START = date(2022, 1, 1).toordinal()
+
+
+def synthetic_ledger(n_stores, n_days, seed=42):
+    """
+    시드 고정 합성 일별 매출 (추세 + 요일 패턴 + 연간 계절성 + 잡음, 가끔 휴무일 0).
+    같은 시드면 항상 같은 데이터. 반환값: (일자 ordinal 배열, [상점 수 × 일수] 매출 배열)
+    """
+    rng = np.random.default_rng(seed)
+    ordinals = np.arange(SYNTHETIC_START, SYNTHETIC_START + n_days, dtype=np.int64)
+    t = np.arange(n_days) / 365.25
+
+    base = rng.uniform(200_000, 1_500_000, size=(n_stores, 1))
+    trend = rng.normal(0.05, 0.1, size=(n_stores, 1))
+    weekly = rng.normal(0.0, 0.15, size=(n_stores, 7))
+    yearly = rng.uniform(0.0, 0.2, size=(n_stores, 1))
+    phase = rng.uniform(0, 2 * np.pi, size=(n_stores, 1))
+
+    revenue = base * (1 + trend * t) * (1 + weekly[:, ordinals % 7]) * (1 + yearly * np.sin(2 * np.pi * t + phase))
+    revenue *= rng.lognormal(0.0, 0.1, size=revenue.shape)
+    revenue[rng.random(revenue.shape) < 0.01] = 0.0  # 임시 휴무
+    return ordinals, np.round(revenue, -1)
+
+
+def _fit_ridge(days, revenue):
+    return fit_sales_model("backtest", days, revenue)
+
+
+def _predict_ridge(model, start_ordinal, horizon):
+    return predict_sales(model, start_ordinal, horizon)[1]
+
+
+def _fit_seasonal_naive(days, revenue):
+    return revenue[-7:].copy()
+
+
+def _predict_seasonal_naive(model, start_ordinal, horizon):
+    return np.resize(model, horizon)
+
+
+def _fit_moving_average(days, revenue):
+    return float(revenue[-28:].mean())
+
+
+def _predict_moving_average(model, start_ordinal, horizon):
+    return np.full(horizon, model)
+
+
+def _fit_holt_winters(days, revenue):
+    return fit_state(days, revenue)
+
+
+def _predict_holt_winters(model, start_ordinal, horizon):
+    return np.array(forecast_state(model, start_ordinal, horizon))
+
+
+# 모델 종류 → (학습 함수, 예측 함수)
+MODELS = {
+    "ridge": (_fit_ridge, _predict_ridge),
+    "seasonal_naive": (_fit_seasonal_naive, _predict_seasonal_naive),
+    "moving_average": (_fit_moving_average, _predict_moving_average),
+    "holt_winters": (_fit_holt_winters, _predict_holt_winters),
+}
+
+
+def rolling_origin_backtest(model_type, ordinals, revenue, initial=365, horizon=7, step=28):
+    """
+    rolling-origin 평가: 학습 구간을 step 일씩 늘려가며 다음 horizon 일을 예측해 실제값과 비교.
+    MAPE 는 실제 매출이 0인 날(휴무)을 제외하고 계산한다.
+    """
+    fit, predict = MODELS[model_type]
+    n_stores, n_days = revenue.shape
+
+    abs_errors = []
+    pct_errors = []
+    train_seconds = infer_seconds = 0.0
+    fits = 0
+
+    for origin in range(initial, n_days - horizon + 1, step):
+        for store in range(n_stores):
+            started = time.perf_counter()
+            model = fit(ordinals[:origin], revenue[store, :origin])
+            train_seconds += time.perf_counter() - started
+
+            started = time.perf_counter()
+            prediction = predict(model, int(ordinals[origin]), horizon)
+            infer_seconds += time.perf_counter() - started
+            fits += 1
+
+            actual = revenue[store, origin:origin + horizon]
+            abs_errors.append(np.abs(prediction - actual))
+            nonzero = actual > 0
+            pct_errors.append(np.abs(prediction[nonzero] - actual[nonzero]) / actual[nonzero])
+
+    abs_errors = np.concatenate(abs_errors)
+    pct_errors = np.concatenate(pct_errors)
+    return {
+        "model_type": model_type,
+        "folds": fits,
+        "mae": round(float(abs_errors.mean()), 2),
+        "mape": round(float(pct_errors.mean() * 100), 3),
+        "train_seconds": round(train_seconds, 4),
+        "infer_seconds": round(infer_seconds, 4),
+        "train_ms_per_fit": round(train_seconds * 1000 / fits, 4),
+        "infer_ms_per_call": round(infer_seconds * 1000 / fits, 4),
+    }
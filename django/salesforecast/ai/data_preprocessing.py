@@ -1,21 +1,111 @@
-# import pandas as pd
-# from ledger.models import Transaction
+import numpy as np
+from datetime import date
+from django.db.models import Sum
+from ledger.models import Transaction
 
-# def load_transaction_data():
-#     """
-#     거래 내역 데이터를 DataFrame으로 변환
-#     """
-#     transactions = Transaction.objects.all().values("date", "store__name", "category__name", "amount", "transaction_type")
+# ✅ 모든 상점이 같은 특성 구조를 갖도록 고정된 기준일 사용
+EPOCH = date(2020, 1, 1).toordinal()
+N_FEATURES = 12  # 추세 1 + 요일 7 + 연간 주기 4
+NO_CATEGORY = -1  # 카테고리 없는 거래 코드
 
-#     # Pandas DataFrame으로 변환
-#     df = pd.DataFrame(transactions)
 
-#     # 날짜 데이터를 DateTime 형식으로 변환
-#     df["date"] = pd.to_datetime(df["date"])
+def load_transaction_data(store_ids=None, transaction_type="income", chunk_size=10000):
+    """
+    거래 내역을 (상점, 날짜, 카테고리) 단위로 DB에서 일별 집계한 뒤,
+    values_list 를 iterator 로 스트리밍해 미리 할당한 numpy 열 배열에 바로 채운다.
+    (행을 dict 로 만들지 않으므로 메모리 사용량이 행당 20바이트로 고정)
 
-#     # 연도, 월, 일 컬럼 추가
-#     df["year"] = df["date"].dt.year
-#     df["month"] = df["date"].dt.month
-#     df["day"] = df["date"].dt.day
+    반환값 (dict):
+        store     int32  상점 코드 (store_ids 리스트의 인덱스)
+        day       int32  EPOCH 기준 일 인덱스
+        amount    int64  금액 (최소 화폐 단위, 소수 둘째 자리 × 100)
+        category  int32  카테고리 코드 (category_ids 리스트의 인덱스, 없으면 -1)
+        store_ids / category_ids  코드 → 실제 ID
+    """
+    queryset = Transaction.objects.filter(transaction_type=transaction_type)
+    if store_ids is not None:
+        queryset = queryset.filter(store_id__in=store_ids)
 
-#     return df
+    grouped = (
+        queryset.values("store_id", "date", "category_id")
+        .annotate(total=Sum("amount"))
+        .order_by()
+    )
+
+    n_rows = grouped.count()
+    store = np.empty(n_rows, dtype=np.int32)
+    day = np.empty(n_rows, dtype=np.int32)
+    amount = np.empty(n_rows, dtype=np.int64)
+    category = np.empty(n_rows, dtype=np.int32)  # Category 는 전역 테이블 → int16 이면 32767개 초과 시 넘침
+
+    store_codes = {}
+    category_codes = {}
+    i = 0
+    rows = grouped.values_list("store_id", "date", "category_id", "total").iterator(chunk_size=chunk_size)
+    for store_id, row_date, category_id, total in rows:
+        if i == n_rows:  # COUNT 이후 새로 들어온 행은 다음 학습에 반영
+            break
+        store[i] = store_codes.setdefault(store_id, len(store_codes))
+        day[i] = row_date.toordinal() - EPOCH
+        amount[i] = int(total.scaleb(2))
+        category[i] = NO_CATEGORY if category_id is None else category_codes.setdefault(category_id, len(category_codes))
+        i += 1
+
+    return {
+        "store": store[:i],
+        "day": day[:i],
+        "amount": amount[:i],
+        "category": category[:i],
+        "store_ids": list(store_codes),
+        "category_ids": list(category_codes),
+    }
+
+
+def to_daily_series(data, store_code, category_code=None):
+    """
+    열 배열에서 특정 상점(및 카테고리)의 연속된 일별 매출 시계열을 만든다.
+    거래가 없는 날은 0. 반환값: (일자 ordinal 배열, 일별 매출 배열)
+    """
+    mask = data["store"] == store_code
+    if category_code is not None:
+        mask &= data["category"] == category_code
+
+    days = data["day"][mask]
+    if len(days) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+
+    first = int(days.min())
+    revenue = np.bincount(days - first, weights=data["amount"][mask]) / 100.0
+    ordinals = np.arange(first, first + len(revenue), dtype=np.int64) + EPOCH
+    return ordinals, revenue
+
+
+def load_daily_revenue(store_id):
+    """
+    특정 상점의 일별 매출(수입) 합계를 numpy 배열로 반환. 거래가 없는 날은 0.
+    반환값: (일자 ordinal 배열, 일별 매출 배열)
+    """
+    data = load_transaction_data(store_ids=[store_id])
+    if not data["store_ids"]:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+    return to_daily_series(data, 0)
+
+
+def build_features(days):
+    """
+    일자 ordinal 배열 → 특성 행렬 [일수 × N_FEATURES]
+    (추세, 요일 원-핫, 연간 계절성 sin/cos 2차)
+    """
+    days = np.asarray(days, dtype=np.int64)
+    features = np.zeros((len(days), N_FEATURES))
+
+    features[:, 0] = (days - EPOCH) / 365.25  # 추세 (년 단위)
+    features[np.arange(len(days)), 1 + (days % 7)] = 1.0  # 요일 (ordinal % 7: 0=일요일)
+
+    year_phase = 2 * np.pi * (days - EPOCH) / 365.25
+    features[:, 8] = np.sin(year_phase)
+    features[:, 9] = np.cos(year_phase)
+    features[:, 10] = np.sin(2 * year_phase)
+    features[:, 11] = np.cos(2 * year_phase)
+
+    return features
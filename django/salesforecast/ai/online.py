@@ -0,0 +1,115 @@
+"""
+온라인 지수평활(가법 Holt-Winters, 주간 계절성) 상태
+
+상태는 level / trend / season[7] 과 현재 집계 중인 날(day, day_total)만 갖는 작은 dict 이다.
+거래가 들어오면 day_total 에 더하고, 날짜가 넘어갈 때 마감된 날만 평활식에 반영하므로
+거래 한 건당 갱신 비용은 O(1). (numpy 없이 순수 파이썬 → 거래 저장 경로에서 가볍게 실행)
+"""
+ALPHA = 0.2   # level 평활 계수
+BETA = 0.05   # trend 평활 계수
+GAMMA = 0.1   # 요일 계절성 평활 계수
+PHI = 0.98    # trend 감쇠 (장기 예측이 발산하지 않도록)
+SEASON = 7
+MAX_GAP_DAYS = 366  # 이보다 오래 거래가 없으면 빈 날을 하나씩 반영하지 않고 그대로 둔다
+
+
+def new_state(ordinal):
+    return {"level": 0.0, "trend": 0.0, "season": [0.0] * SEASON, "day": ordinal, "day_total": 0.0, "seen_days": 0}
+
+
+def _close_day(state, ordinal, revenue):
+    """ 하루 매출을 평활식에 반영 """
+    season = state["season"]
+    s = ordinal % SEASON
+
+    if state["seen_days"] == 0:
+        level = revenue
+        trend = 0.0
+    else:
+        level = ALPHA * (revenue - season[s]) + (1 - ALPHA) * (state["level"] + PHI * state["trend"])
+        trend = BETA * (level - state["level"]) + (1 - BETA) * PHI * state["trend"]
+        season[s] = GAMMA * (revenue - level) + (1 - GAMMA) * season[s]
+
+    state["level"] = level
+    state["trend"] = trend
+    state["seen_days"] += 1
+
+
+def advance_state(state, ordinal):
+    """
+    ordinal 날짜까지 상태를 진행. 집계 중이던 날과 그 사이 거래가 없던 날(매출 0)을 마감한다.
+    """
+    if ordinal <= state["day"]:
+        return state
+
+    _close_day(state, state["day"], state["day_total"])
+    gap_start = max(state["day"] + 1, ordinal - MAX_GAP_DAYS)
+    for day in range(gap_start, ordinal):
+        _close_day(state, day, 0.0)
+
+    state["day"] = ordinal
+    state["day_total"] = 0.0
+    return state
+
+
+def add_revenue(state, ordinal, amount, today_ordinal=None):
+    """
+    거래 한 건 반영. 집계 중인 날보다 과거 날짜의 거래는 이미 마감된 날이므로 무시하고
+    (야간 재학습 때 반영), 이후 날짜면 그 날까지 진행한 뒤 더한다.
+    today_ordinal 보다 뒤(미리 입력한 예정 거래)는 사이의 날을 매출 0으로 마감해 버리므로 반영하지 않는다.
+    (그 날이 지나면 야간 재학습이 반영)
+    반환값: 반영 여부
+    """
+    if ordinal < state["day"]:
+        return False
+    if today_ordinal is not None and ordinal > today_ordinal:
+        return False
+    advance_state(state, ordinal)
+    state["day_total"] += float(amount)
+    return True
+
+
+def fit_state(days, revenue, today_ordinal=None):
+    """
+    일별 매출 이력으로 상태를 처음부터 만든다. (야간 학습 시 상태 초기화용)
+    today_ordinal 당일은 아직 마감되지 않은 것으로 보고 day_total 로만 남기고, 그 이후 날짜는 무시한다.
+    반영할 날이 없으면 None.
+    """
+    days = [int(day) for day in days]
+    revenue = [float(value) for value in revenue]
+    if not days or (today_ordinal is not None and days[0] > today_ordinal):
+        return None  # 이력이 없거나 모두 미래 날짜 → 상태를 만들지 않음 (온라인 경로와 같은 기준)
+
+    state = new_state(days[0])
+    for day, value in zip(days, revenue):
+        if today_ordinal is not None and day > today_ordinal:
+            break
+        advance_state(state, day)
+        state["day_total"] += value
+    return state
+
+
+def _expected(state, ordinal, h=1):
+    damped = PHI * (1 - PHI ** h) / (1 - PHI)  # PHI + PHI² + ... + PHI^h
+    return state["level"] + damped * state["trend"] + state["season"][ordinal % SEASON]
+
+
+def forecast_state(state, start_ordinal, days):
+    """
+    start_ordinal 부터 days 일 예측 (감쇠 추세 + 요일 계절성, 음수는 0).
+    집계 중인 날(보통 오늘)은 지금까지의 매출이 하한이므로 max(예측, 누적 매출)로 보고
+    사본 상태에서 임시로 마감해, 오늘 들어온 매출이 이후 예측에 바로 반영되도록 한다.
+    """
+    state = advance_state({**state, "season": list(state["season"])}, start_ordinal)
+    today = state["day"]
+    today_value = max(_expected(state, today), state["day_total"]) if state["seen_days"] else state["day_total"]
+    _close_day(state, today, today_value)
+
+    forecast = []
+    for ordinal in range(start_ordinal, start_ordinal + days):
+        if ordinal == today:
+            value = today_value
+        else:
+            value = _expected(state, ordinal, h=max(ordinal - today, 1))
+        forecast.append(max(value, 0.0))
+    return forecast
@@ -1,14 +1,34 @@
-# import numpy as np
-# from .train_model import build_sales_model
+import numpy as np
+from .data_preprocessing import build_features
 
-# def predict_sales(future_date):
-#     """미래 특정 날짜의 매출 예측"""
-#     model, X, y = build_sales_model()
 
-#     # 데이터 준비 (날짜를 숫자로 변환)
-#     future_timestamp = pd.to_datetime(future_date).timestamp()
-#     future_data = np.array([[future_timestamp, 0]])  # amount는 더미 값
+def predict_sales(artifact, start_ordinal, days):
+    """
+    start_ordinal 부터 days 일 동안의 일별 매출 예측 (numpy 행렬곱만 수행).
+    음수 예측은 0으로 자른다.
+    """
+    target_days = np.arange(start_ordinal, start_ordinal + days, dtype=np.int64)
+    prediction = build_features(target_days) @ artifact["coef"] + artifact["intercept"]
+    return target_days, np.maximum(prediction, 0.0)
 
-#     # 모델 예측
-#     prediction = model.predict(future_data)
-#     return prediction[0][0]  # 예측된 매출 값 반환
+
+def predict_sales_batch(artifacts, start_ordinal, days):
+    """
+    여러 모델의 예측을 한 번에 계산. 특성 행렬은 한 번만 만들고,
+    계수 구조가 같은 모델끼리 [모델 수 × 특성 수] 행렬로 묶어 행렬곱 한 번으로 처리한다.
+    반환값: (일자 배열, [모델 수 × days] 예측 배열)
+    """
+    target_days = np.arange(start_ordinal, start_ordinal + days, dtype=np.int64)
+    features = build_features(target_days)
+    prediction = np.empty((len(artifacts), days))
+
+    groups = {}
+    for i, artifact in enumerate(artifacts):
+        groups.setdefault((artifact["model_type"], artifact["coef"].shape), []).append(i)
+
+    for indexes in groups.values():
+        coef = np.stack([artifacts[i]["coef"] for i in indexes])
+        intercept = np.array([artifacts[i]["intercept"] for i in indexes])
+        prediction[indexes] = coef @ features.T + intercept[:, None]
+
+    return target_days, np.maximum(prediction, 0.0)
@@ -1,28 +1,39 @@
-# import tensorflow as tf
-# from tensorflow import keras
-# from tensorflow.keras.models import Sequential
-# from tensorflow.keras.layers import Dense, LSTM
-# import numpy as np
-# from .data_preprocessing import load_sales_data
-
-# def build_sales_model():
-#     """매출 예측을 위한 LSTM 모델 생성"""
-#     df = load_sales_data()
-
-#     # 데이터 전처리 (예: 날짜를 숫자로 변환)
-#     df["timestamp"] = df["date"].astype(int) // 10**9
-
-#     X = df[["timestamp", "amount"]].values  # 입력 데이터
-#     y = df["amount"].values  # 예측할 값
-
-#     # LSTM 모델 생성
-#     model = Sequential([
-#         LSTM(50, return_sequences=True, input_shape=(X.shape[1], 1)),
-#         LSTM(50, return_sequences=False),
-#         Dense(25, activation="relu"),
-#         Dense(1)
-#     ])
-
-#     model.compile(optimizer="adam", loss="mse")
-
-#     return model, X, y
+import numpy as np
+from django.utils.timezone import now
+from sklearn.linear_model import Ridge
+from .data_preprocessing import load_daily_revenue, build_features
+
+MIN_HISTORY_DAYS = 28  # 최소 학습 일수 (4주)
+
+
+def build_sales_model(store_id):
+    """
+    상점의 일별 매출로 Ridge 회귀 모델을 학습 (오프라인 학습용).
+    이력이 부족하면 None 반환.
+    추론 시 scikit-learn 없이 numpy 행렬곱만 하도록 계수만 아티팩트로 저장한다.
+    """
+    days, revenue = load_daily_revenue(store_id)
+    return fit_sales_model(store_id, days, revenue)
+
+
+def fit_sales_model(store_id, days, revenue, category_id=None):
+    """
+    이미 만들어진 일별 매출 시계열로 모델을 학습. (배치 학습 워커에서 직접 사용)
+    category_id 를 주면 카테고리별 모델. 이력이 부족하면 None 반환.
+    """
+    if len(days) < MIN_HISTORY_DAYS:
+        return None
+
+    model = Ridge(alpha=1.0)
+    model.fit(build_features(days), revenue)
+
+    return {
+        "store_id": str(store_id),
+        "category_id": category_id,
+        "model_type": "ridge",
+        "coef": np.ascontiguousarray(model.coef_, dtype=np.float64),
+        "intercept": float(model.intercept_),
+        "last_date": int(days[-1]),
+        "trained_at": now().isoformat(),
+    }
+
@@ -0,0 +1,58 @@
+import json
+import platform
+import numpy as np
+import sklearn
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.timezone import now
+from salesforecast.ai.backtest import MODELS, rolling_origin_backtest, synthetic_ledger
+from salesforecast.ai.train_model import MIN_HISTORY_DAYS
+
+
+class Command(BaseCommand):
+    help = "시드 고정 합성 장부로 예측 모델을 rolling-origin 백테스트하고 정확도(MAPE/MAE)와 학습/추론 시간을 JSON으로 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--model", action="append", dest="models", choices=sorted(MODELS), help="평가할 모델 종류 (여러 번 지정 가능, 기본 전체)")
+        parser.add_argument("--stores", type=int, default=20, help="합성 상점 수 (기본 20)")
+        parser.add_argument("--days", type=int, default=730, help="합성 장부 일수 (기본 730)")
+        parser.add_argument("--seed", type=int, default=42, help="난수 시드 (기본 42)")
+        parser.add_argument("--initial", type=int, default=365, help="첫 학습 구간 일수 (기본 365)")
+        parser.add_argument("--horizon", type=int, default=7, help="예측 일수 (기본 7)")
+        parser.add_argument("--step", type=int, default=28, help="학습 구간을 늘리는 간격 (기본 28)")
+        parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: 표준 출력)")
+
+    def handle(self, *args, **options):
+        if options["initial"] < MIN_HISTORY_DAYS:
+            raise CommandError(f"--initial 은 최소 {MIN_HISTORY_DAYS}일이어야 합니다.")
+        if options["initial"] + options["horizon"] > options["days"]:
+            raise CommandError("--days 가 --initial + --horizon 보다 커야 합니다.")
+
+        ordinals, revenue = synthetic_ledger(options["stores"], options["days"], seed=options["seed"])
+
+        results = []
+        for model_type in options["models"] or sorted(MODELS):
+            result = rolling_origin_backtest(
+                model_type, ordinals, revenue,
+                initial=options["initial"], horizon=options["horizon"], step=options["step"],
+            )
+            results.append(result)
+            self.stderr.write(f"✅ {model_type}: MAPE {result['mape']}%, 학습 {result['train_ms_per_fit']}ms/회, 추론 {result['infer_ms_per_call']}ms/회")
+
+        report = {
+            "generated_at": now().isoformat(),
+            "config": {key: options[key] for key in ("stores", "days", "seed", "initial", "horizon", "step")},
+            "environment": {
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "scikit_learn": sklearn.__version__,
+            },
+            "results": results,
+        }
+
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output)
+            self.stderr.write(f"결과 저장: {options['output']}")
+        else:
+            self.stdout.write(output)
@@ -0,0 +1,190 @@
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from django.core.management.base import BaseCommand
+from django.db import connections, close_old_connections, transaction
+from django.db.models import Count, Max, Sum
+from django.utils.timezone import localdate, now
+from ledger.models import Transaction
+from salesforecast.ai.data_preprocessing import NO_CATEGORY, load_transaction_data, to_daily_series
+from salesforecast.ai.online import add_revenue, fit_state
+from salesforecast.ai.train_model import fit_sales_model
+from salesforecast.models import ForecastState
+from salesforecast.registry import load_manifest, save_manifest, save_model
+
+
+def _ledger_fingerprints(store_ids=None):
+    """
+    상점별 수입 장부 지문 (행 수, 합계, 마지막 생성 시각) 을 한 번의 GROUP BY 로 계산.
+    지문이 지난 학습 때와 같으면 장부가 바뀌지 않은 것으로 보고 재학습을 건너뛴다.
+    """
+    queryset = Transaction.objects.filter(transaction_type="income")
+    if store_ids:
+        queryset = queryset.filter(store_id__in=store_ids)
+
+    rows = (
+        queryset.values("store_id")
+        .annotate(rows=Count("id"), total=Sum("amount"), last_created=Max("created_at"))
+        .order_by()
+    )
+    return {
+        str(row["store_id"]): [row["rows"], str(row["total"]), row["last_created"].isoformat()]
+        for row in rows
+    }
+
+
+def _init_worker():
+    """ 워커 프로세스 초기화 (spawn/forkserver 방식이면 Django 설정부터 로드) """
+    from django.apps import apps
+
+    if not apps.ready:
+        import django
+        django.setup()
+
+
+def _save_state(store_id, state, loaded_at, today_ordinal):
+    """
+    전체 이력으로 만든 온라인 예측 상태 저장.
+    학습하는 동안(loaded_at 이후) 들어온 수입 거래는 스냅샷에 없지만 signals 가 이미 반영했으므로,
+    상태 행을 잠근 뒤 그 거래들을 다시 더해 저장한다. (덮어써서 잃어버리지 않도록)
+    """
+    with transaction.atomic():
+        forecast_state = ForecastState.objects.select_for_update().filter(store_id=store_id).first()
+        recent = (
+            Transaction.objects.filter(store_id=store_id, transaction_type="income", created_at__gt=loaded_at)
+            .order_by("date", "created_at")
+            .values_list("date", "amount")
+        )
+        for row_date, amount in recent:
+            add_revenue(state, row_date.toordinal(), amount, today_ordinal)
+
+        if forecast_state is None:
+            ForecastState.objects.update_or_create(store_id=store_id, defaults={"state": state})
+        else:
+            forecast_state.state = state
+            forecast_state.save(update_fields=["state", "updated_at"])
+
+
+def _train_chunk(store_ids, per_category):
+    """
+    상점 묶음 하나를 학습 (워커 프로세스에서 실행).
+    묶음 전체의 거래를 한 번에 읽고, 워커가 자신의 DB 연결을 열고 닫는다.
+    상점별 온라인 예측 상태(ForecastState)도 전체 이력으로 다시 만든다.
+    반환값: {store_id: (상점 모델 저장 여부, 저장한 카테고리 모델 수)}
+    """
+    close_old_connections()
+    try:
+        loaded_at = now()  # 스냅샷 기준 시각 (이후 생성된 거래는 저장 직전에 다시 반영)
+        data = load_transaction_data(store_ids=store_ids)
+    finally:
+        connections.close_all()  # 학습 중에는 DB를 쓰지 않으므로 바로 반납
+
+    today = localdate().toordinal()
+    results = {str(store_id): (False, 0) for store_id in store_ids}
+    states = {}
+    for store_code, store_id in enumerate(data["store_ids"]):
+        days, revenue = to_daily_series(data, store_code)
+        state = fit_state(days, revenue, today_ordinal=today)
+        if state is not None:  # 미래 날짜 거래만 있는 상점은 건너뜀
+            states[store_id] = state
+        artifact = fit_sales_model(store_id, days, revenue)
+        if artifact is None:
+            continue
+        save_model(artifact)
+
+        saved_categories = 0
+        if per_category:
+            store_categories = np.unique(data["category"][data["store"] == store_code])
+            for category_code in store_categories[store_categories != NO_CATEGORY]:
+                days, revenue = to_daily_series(data, store_code, int(category_code))
+                artifact = fit_sales_model(store_id, days, revenue, category_id=data["category_ids"][category_code])
+                if artifact is not None:
+                    save_model(artifact)
+                    saved_categories += 1
+
+        results[str(store_id)] = (True, saved_categories)
+
+    # ✅ 온라인 예측 상태를 전체 이력 기준으로 재설정 (이후 들어오는 거래는 signals 에서 O(1) 갱신)
+    try:
+        for store_id, state in states.items():
+            _save_state(store_id, state, loaded_at, today)
+    finally:
+        connections.close_all()
+
+    return results
+
+
+class Command(BaseCommand):
+    help = "매출 이력이 있는 상점별 매출 예측 모델을 여러 프로세스로 병렬 학습해 저장합니다. (야간 배치용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--store", action="append", dest="stores", help="특정 상점 ID만 학습 (여러 번 지정 가능)")
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="학습 프로세스 수 (기본: CPU 코어 수)")
+        parser.add_argument("--chunk-size", type=int, default=50, help="워커 작업 하나당 상점 수 (기본 50)")
+        parser.add_argument("--per-category", action="store_true", help="카테고리별 모델도 함께 학습")
+        parser.add_argument("--full", action="store_true", help="장부 변경 여부와 관계없이 전체 재학습")
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        fingerprints = _ledger_fingerprints(options["stores"])
+        manifest = load_manifest()
+
+        # ✅ 지난 학습 이후 장부가 바뀐 상점만 학습 (증분 학습)
+        if options["full"]:
+            targets = sorted(fingerprints)
+        else:
+            targets = sorted(store_id for store_id, fingerprint in fingerprints.items() if manifest.get(store_id) != fingerprint)
+
+        unchanged = len(fingerprints) - len(targets)
+        if not targets:
+            self.stdout.write(self.style.SUCCESS(f"✅ 변경된 장부가 없습니다. ({unchanged}개 상점 건너뜀)"))
+            return
+
+        chunk_size = max(options["chunk_size"], 1)
+        chunks = [targets[i:i + chunk_size] for i in range(0, len(targets), chunk_size)]
+        workers = max(1, min(options["workers"], len(chunks)))
+        self.stdout.write(f"🔥 {len(targets)}개 상점 학습 시작 (작업 {len(chunks)}개, 프로세스 {workers}개, 변경 없음 {unchanged}개)")
+
+        trained = skipped = categories = done = 0
+        failed = []
+
+        def collect(chunk, results):
+            nonlocal trained, skipped, categories, done
+            for store_id, (saved, saved_categories) in results.items():
+                trained += saved
+                skipped += not saved
+                categories += saved_categories
+                manifest[store_id] = fingerprints[store_id]
+            done += len(chunk)
+            self.stdout.write(f"[{done}/{len(targets)}] 학습 {trained}, 이력 부족 {skipped}")
+
+        if workers == 1:
+            for chunk in chunks:
+                collect(chunk, _train_chunk(chunk, options["per_category"]))
+        else:
+            # 🔥 fork 된 워커가 부모의 DB 소켓을 공유하지 않도록 풀 생성 전에 연결을 닫는다
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                futures = {executor.submit(_train_chunk, chunk, options["per_category"]): chunk for chunk in chunks}
+                for future in as_completed(futures):
+                    chunk = futures[future]
+                    try:
+                        collect(chunk, future.result())
+                    except Exception as e:
+                        failed.extend(chunk)
+                        done += len(chunk)
+                        self.stderr.write(f"[{done}/{len(targets)}] ❌ 작업 실패 ({len(chunk)}개 상점): {e}")
+
+        save_manifest(manifest)  # 실패한 상점은 지문을 갱신하지 않아 다음 실행에서 다시 학습
+
+        elapsed = time.monotonic() - started
+        summary = f"모델 학습 완료: {trained}개 저장, {skipped}개 이력 부족으로 건너뜀, 변경 없음 {unchanged}개"
+        if options["per_category"]:
+            summary += f", 카테고리 모델 {categories}개"
+        summary += f" ({elapsed:.1f}초)"
+
+        if failed:
+            self.stdout.write(self.style.WARNING(f"⚠️ {summary}, 실패 {len(failed)}개"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"✅ {summary}"))
@@ -1,3 +1,12 @@
 from django.db import models
+from store.models import Store
 
-# Create your models here.
+
+class ForecastState(models.Model):
+    """ 상점별 온라인 예측 상태 (수입 거래가 커밋될 때마다 O(1) 갱신, 야간 학습 때 전체 이력으로 재설정) """
+    store = models.OneToOneField(Store, on_delete=models.CASCADE, primary_key=True, related_name="forecast_state")
+    state = models.JSONField()  # level / trend / season[7] / day / day_total (salesforecast.ai.online 참고)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.store.name} 예측 상태"
@@ -0,0 +1,154 @@
+# salesforecast/registry.py
+"""
+매출 예측 모델 레지스트리
+
+디스크 구조:
+    <SALESFORECAST_MODEL_DIR>/<store_id>/<version>.joblib
+    <SALESFORECAST_MODEL_DIR>/<store_id>/LATEST   (최신 버전 이름)
+    <SALESFORECAST_MODEL_DIR>/<store_id>/categories/<category_id>/...  (카테고리별 모델, 구조 동일)
+    <SALESFORECAST_MODEL_DIR>/manifest.json      (상점별 마지막 학습 시점의 장부 지문)
+
+워커는 모델을 처음 사용할 때 joblib mmap_mode 로 로드하고, 크기가 제한된 LRU에만 보관한다.
+numpy / joblib 은 예측 경로에서만 임포트한다. (워커 부팅 시간과 비예측 API 메모리에 영향 없음)
+"""
+import json
+import os
+import threading
+from collections import OrderedDict
+from django.conf import settings
+from django.utils.timezone import now
+
+LATEST_FILE = "LATEST"
+MANIFEST_FILE = "manifest.json"
+
+_cache = OrderedDict()  # (store_id, version) → artifact
+_cache_lock = threading.Lock()
+
+
+def model_key(store_id, category_id=None):
+    """ 레지스트리 키 (상점 모델은 상점 ID, 카테고리 모델은 상점 하위 경로) """
+    if category_id is None:
+        return str(store_id)
+    return os.path.join(str(store_id), "categories", str(category_id))
+
+
+def _store_dir(store_id):
+    return os.path.join(settings.SALESFORECAST_MODEL_DIR, str(store_id))
+
+
+def _version_path(store_id, version):
+    return os.path.join(_store_dir(store_id), f"{version}.joblib")
+
+
+def _write_atomic(path, write):
+    """ 임시 파일에 쓴 뒤 rename (읽는 워커가 반쯤 쓰인 파일을 보지 않도록) """
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def save_model(artifact):
+    """
+    아티팩트를 새 버전으로 저장하고 LATEST 를 갱신한다.
+    mmap 로드를 위해 압축하지 않고 저장하며, 오래된 버전은 정리한다.
+    반환값: 저장된 버전 이름
+    """
+    import joblib
+
+    store_id = model_key(artifact["store_id"], artifact.get("category_id"))
+    version = now().strftime("%Y%m%d%H%M%S%f")
+    artifact["version"] = version
+
+    os.makedirs(_store_dir(store_id), exist_ok=True)
+    _write_atomic(_version_path(store_id, version), lambda path: joblib.dump(artifact, path))
+    _write_atomic(os.path.join(_store_dir(store_id), LATEST_FILE), lambda path: _write_text(path, version))
+
+    _prune_versions(store_id, keep=settings.SALESFORECAST_KEEP_VERSIONS)
+    return version
+
+
+def _write_text(path, text):
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def _prune_versions(store_id, keep):
+    versions = list_versions(store_id)
+    for version in versions[:-keep]:
+        try:
+            os.remove(_version_path(store_id, version))
+        except FileNotFoundError:
+            pass
+
+
+def list_versions(store_id):
+    """ 저장된 버전 목록 (오래된 순) """
+    try:
+        names = os.listdir(_store_dir(store_id))
+    except FileNotFoundError:
+        return []
+    return sorted(name[:-len(".joblib")] for name in names if name.endswith(".joblib"))
+
+
+def latest_version(store_id):
+    """ 상점의 최신 모델 버전 (없으면 None) """
+    try:
+        with open(os.path.join(_store_dir(store_id), LATEST_FILE)) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def load_model(store_id, version=None):
+    """
+    모델 아티팩트를 가져온다. (처음 사용할 때만 디스크에서 mmap 로드)
+    version 을 지정하지 않으면 최신 버전. 모델이 없으면 None.
+    """
+    version = version or latest_version(store_id)
+    if version is None:
+        return None
+
+    key = (str(store_id), version)
+    with _cache_lock:
+        artifact = _cache.get(key)
+        if artifact is not None:
+            _cache.move_to_end(key)
+            return artifact
+
+    import joblib
+
+    try:
+        artifact = joblib.load(_version_path(store_id, version), mmap_mode="r")
+    except FileNotFoundError:
+        return None
+
+    with _cache_lock:
+        _cache[key] = artifact
+        _cache.move_to_end(key)
+        while len(_cache) > settings.SALESFORECAST_MODEL_CACHE_SIZE:
+            _cache.popitem(last=False)
+
+    return artifact
+
+
+def clear_cache():
+    """ 워커 내 모델 캐시 비우기 """
+    with _cache_lock:
+        _cache.clear()
+
+
+def load_manifest():
+    """ 상점별 마지막 학습 시점의 장부 지문 {store_id: fingerprint} (증분 학습용) """
+    try:
+        with open(os.path.join(settings.SALESFORECAST_MODEL_DIR, MANIFEST_FILE)) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_manifest(manifest):
+    os.makedirs(settings.SALESFORECAST_MODEL_DIR, exist_ok=True)
+    _write_atomic(
+        os.path.join(settings.SALESFORECAST_MODEL_DIR, MANIFEST_FILE),
+        lambda path: _write_text(path, json.dumps(manifest, sort_keys=True)),
+    )
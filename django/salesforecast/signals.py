@@ -0,0 +1,15 @@
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from ledger.models import Transaction
+from .utils import apply_income
+
+
+@receiver(post_save, sender=Transaction)
+def update_forecast_state(sender, instance, created, **kwargs):
+    """ ✅ 새 수입 거래가 커밋되면 온라인 예측 상태 갱신 (롤백된 거래는 반영하지 않음) """
+    if not created or instance.transaction_type != "income":
+        return
+
+    store_id, ordinal, amount = instance.store_id, instance.date.toordinal(), instance.amount
+    transaction.on_commit(lambda: apply_income(store_id, ordinal, amount))
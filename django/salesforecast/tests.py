@@ -1,3 +1,68 @@
-from django.test import TestCase
+from datetime import timedelta
+from decimal import Decimal
+from django.test import SimpleTestCase, TestCase
+from django.utils.timezone import localdate, now
+from ledger.models import Transaction
+from salesforecast.management.commands.train_forecasts import _save_state
+from salesforecast.ai.online import add_revenue, fit_state, forecast_state
+from salesforecast.models import ForecastState
+from salesforecast.utils import apply_income
+from store.models import Store
+from users.models import CustomUser
 
-# Create your tests here.
+
+class OnlineStateTests(SimpleTestCase):
+    def test_future_dated_income_is_ignored(self):
+        today = localdate().toordinal()
+        days = list(range(today - 28, today + 1))
+        state = fit_state(days, [1000.0] * len(days), today_ordinal=today)
+        before = dict(state, season=list(state["season"]))
+
+        self.assertFalse(add_revenue(state, today + 30, 5000, today_ordinal=today))
+        self.assertEqual(state, before)
+
+        # 같은 날 매출은 계속 반영되고 예측도 유지된다
+        self.assertTrue(add_revenue(state, today, 100, today_ordinal=today))
+        self.assertTrue(all(value > 900 for value in forecast_state(state, today + 1, 3)))
+
+    def test_future_only_history_has_no_state(self):
+        today = localdate().toordinal()
+        self.assertIsNone(fit_state([today + 1, today + 2], [1000.0, 2000.0], today_ordinal=today))
+
+
+class ApplyIncomeTests(TestCase):
+    def setUp(self):
+        user = CustomUser.objects.create_user(email="forecast@example.com")
+        self.store = Store.objects.create(user=user, name="상점")
+
+    def test_future_dated_income_does_not_create_or_move_state(self):
+        today = localdate()
+        apply_income(self.store.id, (today + timedelta(days=10)).toordinal(), 5000)
+        self.assertFalse(ForecastState.objects.filter(store=self.store).exists())
+
+        apply_income(self.store.id, today.toordinal(), 1000)
+        apply_income(self.store.id, (today + timedelta(days=10)).toordinal(), 5000)
+        state = ForecastState.objects.get(store=self.store).state
+        self.assertEqual(state["day"], today.toordinal())
+        self.assertEqual(state["day_total"], 1000)
+
+
+class SaveTrainedStateTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email="train@example.com")
+        self.store = Store.objects.create(user=self.user, name="상점")
+
+    def test_income_committed_during_training_is_kept(self):
+        today = localdate()
+        days = [(today - timedelta(days=offset)).toordinal() for offset in range(14, 0, -1)]
+        state = fit_state(days, [1000.0] * len(days), today_ordinal=today.toordinal())  # 학습 시작 시 스냅샷
+        loaded_at = now()
+
+        # 학습 중에 커밋되어 온라인으로 반영된 거래
+        Transaction.objects.create(user=self.user, store=self.store, amount=Decimal("700"), transaction_type="income", date=today)
+        apply_income(self.store.id, today.toordinal(), Decimal("700"))
+
+        _save_state(self.store.id, state, loaded_at, today.toordinal())
+        saved = ForecastState.objects.get(store=self.store).state
+        self.assertEqual(saved["day"], today.toordinal())
+        self.assertEqual(saved["day_total"], 700)
@@ -1,6 +1,7 @@
-# from django.urls import path
-# from .views import SalesForecastView
+from django.urls import path
+from .views import SalesForecastView, SalesForecastBatchView
 
-# urlpatterns = [
-#     path("predict/", SalesForecastView.as_view(), name="sales_forecast"),
-# ]
+urlpatterns = [
+    path("", SalesForecastBatchView.as_view(), name="sales_forecast_batch"),
+    path("<uuid:store_id>/", SalesForecastView.as_view(), name="sales_forecast"),
+]
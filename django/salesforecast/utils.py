@@ -0,0 +1,29 @@
+# salesforecast/utils.py
+import logging
+from django.db import DatabaseError, transaction
+from django.utils.timezone import localdate
+from .ai.online import add_revenue, new_state
+from .models import ForecastState
+
+logger = logging.getLogger(__name__)
+
+
+def apply_income(store_id, ordinal, amount):
+    """
+    커밋된 수입 거래 한 건을 상점의 온라인 예측 상태에 반영 (행 잠금 후 O(1) 갱신).
+    상태가 없으면 새로 만들고, 실패해도 거래 저장에는 영향을 주지 않는다. (야간 학습이 상태를 재설정)
+    오늘 이후 날짜의 거래는 반영하지 않는다. (add_revenue 참고)
+    """
+    today_ordinal = localdate().toordinal()
+    if ordinal > today_ordinal:
+        return
+
+    try:
+        with transaction.atomic():
+            forecast_state, _ = ForecastState.objects.select_for_update().get_or_create(
+                store_id=store_id, defaults={"state": new_state(ordinal)}
+            )
+            if add_revenue(forecast_state.state, ordinal, amount, today_ordinal):
+                forecast_state.save(update_fields=["state", "updated_at"])
+    except DatabaseError as e:
+        logger.warning("예측 상태 갱신 실패 (store=%s): %s", store_id, e)
@@ -1,44 +1,168 @@
-# import numpy as np
-# import tensorflow as tf
-# import pandas as pd
-# from rest_framework.views import APIView
-# from rest_framework.response import Response
-# from rest_framework.permissions import IsAuthenticated
-# from salesforecast.ai.data_preprocessing import load_transaction_data
-
-# class SalesForecastView(APIView):
-#     permission_classes = [IsAuthenticated]
-
-#     def get(self, request):
-#         """
-#         특정 카테고리(업종)와 날짜를 입력하면 매출을 예측하는 API
-#         """
-#         category = request.GET.get("category")  # 예: '카페'
-#         year = int(request.GET.get("year", 2025))
-#         month = int(request.GET.get("month", 6))
-
-#         if not category:
-#             return Response({"error": "카테고리(category)를 입력해주세요."}, status=400)
-
-#         # 1️⃣ 저장된 모델 불러오기
-#         model = tf.keras.models.load_model("sales_forecast_model.h5")
-
-#         # 2️⃣ 데이터 로드 및 전처리
-#         df = load_transaction_data()
-#         df = df[["year", "month", "category__name"]]
-#         df = pd.get_dummies(df, columns=["category__name"])
-
-#         # 3️⃣ 입력 데이터 만들기
-#         input_data = pd.DataFrame({"year": [year], "month": [month], "category__name_" + category: [1]})
-#         input_data = input_data.reindex(columns=df.columns, fill_value=0)
-
-#         # 4️⃣ 예측 수행
-#         prediction = model.predict(input_data)
-#         predicted_sales = float(prediction[0][0])  # 예측 결과 변환
-
-#         return Response({
-#             "category": category,
-#             "year": year,
-#             "month": month,
-#             "predicted_sales": predicted_sales
-#         }, status=200)
+from datetime import date
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from django.core.cache import cache
+from django.shortcuts import get_object_or_404
+from django.utils.timezone import localdate
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+from store.models import Store
+from salesforecast.models import ForecastState
+from salesforecast.registry import latest_version, load_model
+
+MAX_FORECAST_DAYS = 365
+BATCH_HORIZONS = (7, 30, 90)  # 여러 상점 예측에서 허용하는 기간
+BATCH_CACHE_TIMEOUT = 60 * 60 * 24  # 키에 날짜와 모델 버전이 들어가므로 만료는 넉넉히
+
+
+class SalesForecastView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_summary="특정 상점의 일별 매출 예측",
+        manual_parameters=[
+            openapi.Parameter("days", openapi.IN_QUERY, description="예측 일수 (기본 7일)", type=openapi.TYPE_INTEGER, required=False),
+            openapi.Parameter("model", openapi.IN_QUERY, description="ridge(야간 학습 모델, 기본) 또는 online(거래마다 갱신되는 지수평활 상태)", type=openapi.TYPE_STRING, required=False),
+        ],
+        responses={200: "일별 예측 매출 반환", 404: "상점 또는 학습된 모델을 찾을 수 없음"}
+    )
+
+    def get(self, request, store_id):
+        """
+        오늘부터 days 일 동안의 일별 매출 예측 (추론만 수행, 학습은 train_forecasts 명령으로 오프라인 실행)
+        """
+        store = get_object_or_404(Store, id=store_id, user=request.user)
+
+        try:
+            days = int(request.GET.get("days", 7))
+        except ValueError:
+            return Response({"error": "days는 숫자여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not 1 <= days <= MAX_FORECAST_DAYS:
+            return Response({"error": f"days는 1 ~ {MAX_FORECAST_DAYS} 사이여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        model = request.GET.get("model", "ridge")
+        start_ordinal = localdate().toordinal()
+
+        if model == "online":
+            # ✅ 오늘 들어온 매출까지 반영된 온라인 상태로 예측 (재학습 불필요)
+            from salesforecast.ai.online import forecast_state
+
+            forecast_state_obj = ForecastState.objects.filter(store=store).first()
+            if forecast_state_obj is None:
+                return Response({"error": "온라인 예측 상태가 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+            prediction = forecast_state(forecast_state_obj.state, start_ordinal, days)
+            target_days = range(start_ordinal, start_ordinal + days)
+            model_version = "online"
+            trained_at = forecast_state_obj.updated_at.isoformat()
+        elif model == "ridge":
+            artifact = load_model(store.id)
+            if artifact is None:
+                return Response({"error": "학습된 예측 모델이 없습니다."}, status=status.HTTP_404_NOT_FOUND)
+
+            from salesforecast.ai.predict import predict_sales  # 🔥 numpy는 예측 요청 시에만 로드 (지연 임포트)
+
+            target_days, prediction = predict_sales(artifact, start_ordinal, days)
+            model_version = artifact["version"]
+            trained_at = artifact["trained_at"]
+        else:
+            return Response({"error": "model은 ridge 또는 online이어야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            "store_id": str(store.id),
+            "model": model,
+            "model_version": model_version,
+            "trained_at": trained_at,
+            "days": days,
+            "total": round(float(sum(prediction)), 2),
+            "forecast": [
+                {"date": date.fromordinal(int(day)).isoformat(), "predicted_sales": round(float(value), 2)}
+                for day, value in zip(target_days, prediction)
+            ],
+        }, status=status.HTTP_200_OK)
+
+
+def _batch_cache_key(store_id, version, start_ordinal):
+    return f"salesforecast:{store_id}:{version}:{start_ordinal}"
+
+
+class SalesForecastBatchView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_summary="내 모든 상점의 매출 예측 (7/30/90일)",
+        manual_parameters=[
+            openapi.Parameter("horizons", openapi.IN_QUERY, description="예측 기간 목록 (쉼표 구분, 7/30/90 중 선택, 기본 전체)", type=openapi.TYPE_STRING, required=False),
+        ],
+        responses={200: "상점별 기간 합계와 일별 예측 반환", 400: "잘못된 예측 기간"}
+    )
+
+    def get(self, request):
+        """
+        사용자의 모든 상점 예측을 한 번에 반환 (상점별 호출 대체).
+        캐시는 (상점, 모델 버전, 날짜) 단위이고, 캐시에 없는 상점만 모아 행렬곱 한 번으로 계산한다.
+        """
+        try:
+            horizons = sorted({int(value) for value in request.GET.get("horizons", "7,30,90").split(",") if value.strip()})
+        except ValueError:
+            return Response({"error": "horizons는 숫자 목록이어야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not horizons or any(horizon not in BATCH_HORIZONS for horizon in horizons):
+            return Response({"error": f"horizons는 {', '.join(map(str, BATCH_HORIZONS))} 중에서 선택해야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        start_ordinal = localdate().toordinal()
+        days = horizons[-1]
+
+        stores = list(Store.objects.filter(user=request.user).only("id", "name").order_by("name"))
+        versions = {store.id: latest_version(store.id) for store in stores}
+        keys = {
+            store.id: _batch_cache_key(store.id, versions[store.id], start_ordinal)
+            for store in stores if versions[store.id] is not None
+        }
+
+        # ✅ 최대 기간(90일) 예측을 캐시해 두고 요청한 기간만큼 잘라 쓴다
+        cached = cache.get_many(keys.values())
+        results = {store_id: cached[key] for store_id, key in keys.items() if key in cached}
+
+        pending = [(store_id, load_model(store_id, versions[store_id])) for store_id in keys if store_id not in results]
+        pending = [(store_id, artifact) for store_id, artifact in pending if artifact is not None]
+        if pending:
+            from salesforecast.ai.predict import predict_sales_batch  # 🔥 numpy는 예측 요청 시에만 로드 (지연 임포트)
+
+            _, prediction = predict_sales_batch([artifact for _, artifact in pending], start_ordinal, max(BATCH_HORIZONS))
+            computed = {
+                store_id: {
+                    "model_version": artifact["version"],
+                    "trained_at": artifact["trained_at"],
+                    "daily": [round(float(value), 2) for value in row],
+                }
+                for (store_id, artifact), row in zip(pending, prediction)
+            }
+            cache.set_many({keys[store_id]: value for store_id, value in computed.items()}, BATCH_CACHE_TIMEOUT)
+            results.update(computed)
+
+        forecasts = []
+        missing = []
+        for store in stores:
+            result = results.get(store.id)
+            if result is None:
+                missing.append(str(store.id))
+                continue
+            forecasts.append({
+                "store_id": str(store.id),
+                "store_name": store.name,
+                "model_version": result["model_version"],
+                "trained_at": result["trained_at"],
+                "totals": {str(horizon): round(sum(result["daily"][:horizon]), 2) for horizon in horizons},
+                "daily": result["daily"][:days],
+            })
+
+        return Response({
+            "start_date": date.fromordinal(start_ordinal).isoformat(),
+            "horizons": horizons,
+            "stores": forecasts,
+            "missing": missing,  # 학습된 모델이 없는 상점
+        }, status=status.HTTP_200_OK)
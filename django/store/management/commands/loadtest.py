@@ -0,0 +1,111 @@
+import asyncio
+import json
+import os
+import platform
+import httpx
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.timezone import now
+from rest_framework_simplejwt.tokens import AccessToken
+from livflow.loadtest import DEFAULT_MIX, run_load
+from store.models import Store
+
+
+def parse_mix(value):
+    """ "dashboard=50,calendar=30" → {"dashboard": 50, "calendar": 30} """
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise CommandError(f"알 수 없는 시나리오: {name} (가능: {', '.join(DEFAULT_MIX)})")
+        try:
+            mix[name] = float(weight)
+        except ValueError:
+            raise CommandError(f"시나리오 가중치는 숫자여야 합니다: {part}")
+    return mix
+
+
+class Command(BaseCommand):
+    help = (
+        "실행 중인 서버에 카페 사용 패턴(대시보드 / 달력 / 재고 사용 / 거래 등록 / 레시피 수정)으로 부하를 주고 "
+        "엔드포인트별 처리량과 p50/p95/p99 지연시간을 JSON으로 출력합니다. "
+        "쓰기 요청이 포함되므로 시드된 벤치마크 DB(seed_bench)에서만 실행하세요. "
+        "대상 서버는 RATE_LIMIT_LEDGER_WRITE / RATE_LIMIT_INVENTORY_WRITE 를 크게 올려서 띄우세요 "
+        "(예: 1000000/min, 기본 120/min 이면 쓰기 요청 대부분이 429). "
+        "429 응답은 throttled 로 따로 세고 처리량 / 지연시간 / 오류 집계에서 제외합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://localhost:8000", help="대상 서버 주소 (기본 http://localhost:8000)")
+        parser.add_argument("--concurrency", type=int, default=20, help="가상 사용자 수 (기본 20)")
+        parser.add_argument("--duration", type=float, default=60, help="측정 시간 초 (기본 60)")
+        parser.add_argument("--warmup", type=float, default=5, help="집계하지 않는 워밍업 시간 초 (기본 5)")
+        parser.add_argument("--think-time", type=float, default=0, help="시나리오 사이 평균 대기 초 (기본 0: 최대 처리량)")
+        parser.add_argument("--stores", type=int, default=20, help="요청에 사용할 상점 수 (기본 20, 레시피와 재료가 있는 상점)")
+        parser.add_argument("--mix", type=parse_mix, help=f"시나리오 가중치 (예: dashboard=50,calendar=50 / 기본 {DEFAULT_MIX})")
+        parser.add_argument("--seed", type=int, default=42, help="난수 시드 (기본 42)")
+        parser.add_argument("--timeout", type=float, default=10, help="요청 타임아웃 초 (기본 10)")
+        parser.add_argument("--label", default="", help="결과 구분용 이름 (예: gunicorn-sync-4w)")
+        parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: 표준 출력)")
+
+    def handle(self, *args, **options):
+        stores = list(
+            Store.objects.filter(recipes__isnull=False, ingredients__isnull=False)
+            .distinct().select_related("user").order_by("created_at")[:options["stores"]]
+        )
+        if not stores:
+            raise CommandError("레시피와 재료가 있는 상점이 없습니다. 먼저 seed_bench 로 데이터를 만드세요.")
+
+        targets = [
+            {
+                "token": str(AccessToken.for_user(store.user)),
+                "store_id": str(store.id),
+                "recipe_ids": [str(pk) for pk in store.recipes.values_list("id", flat=True)[:50]],
+                "ingredient_ids": [str(pk) for pk in store.ingredients.values_list("id", flat=True)[:50]],
+            }
+            for store in stores
+        ]
+
+        self.stderr.write(
+            f"🚀 {options['base_url']} — 가상 사용자 {options['concurrency']}명, 상점 {len(targets)}개, "
+            f"워밍업 {options['warmup']}초 + 측정 {options['duration']}초"
+        )
+        result = asyncio.run(run_load(
+            options["base_url"], targets,
+            concurrency=options["concurrency"], duration=options["duration"], warmup=options["warmup"],
+            think_time=options["think_time"], mix=options["mix"], seed=options["seed"], timeout=options["timeout"],
+        ))
+
+        total = result["total"]
+        self.stderr.write(
+            f"✅ {total['requests']}건, {total['throughput_rps']} req/s, 오류 {total['errors']}건, "
+            f"p50 {total['latency_ms']['p50']}ms / p95 {total['latency_ms']['p95']}ms / p99 {total['latency_ms']['p99']}ms"
+        )
+        if total["throttled"]:
+            self.stderr.write(self.style.WARNING(
+                f"⚠️ 속도 제한(429) {total['throttled']}건은 집계에서 제외했습니다. "
+                "서버의 RATE_LIMIT_LEDGER_WRITE / RATE_LIMIT_INVENTORY_WRITE 를 올려서 다시 실행하세요."
+            ))
+
+        report = {
+            "generated_at": now().isoformat(),
+            "label": options["label"],
+            "config": {
+                key: options[key]
+                for key in ("base_url", "concurrency", "duration", "warmup", "think_time", "seed", "timeout")
+            } | {"stores": len(targets), "mix": options["mix"] or DEFAULT_MIX},
+            "environment": {
+                "python": platform.python_version(),
+                "httpx": httpx.__version__,
+                "client_cpus": os.cpu_count(),
+            },
+            **result,
+        }
+
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output)
+            self.stderr.write(f"결과 저장: {options['output']}")
+        else:
+            self.stdout.write(output)
@@ -0,0 +1,206 @@
+import random
+import time
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+from itertools import islice
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.timezone import localdate
+from costcalcul.models import Recipe, RecipeItem
+from ingredients.models import Ingredient
+from inventory.models import Inventory
+from ledger.models import Category, Transaction
+from salesforecast.ai.backtest import synthetic_ledger
+from store.models import Store
+from users.models import CustomUser
+
+EMAIL_DOMAIN = "bench.livflow.local"
+
+INGREDIENTS = [
+    ("원두", "g"), ("우유", "ml"), ("오트밀크", "ml"), ("바닐라 시럽", "ml"), ("카라멜 소스", "ml"),
+    ("초코 파우더", "g"), ("녹차 파우더", "g"), ("생크림", "ml"), ("설탕", "g"), ("밀가루", "g"),
+    ("버터", "g"), ("달걀", "ea"), ("딸기", "g"), ("컵", "ea"), ("뚜껑", "ea"), ("빨대", "ea"),
+]
+RECIPE_ITEM_UNITS = {"g": "mg", "ml": "ml", "ea": "ea"}  # RecipeItem.unit 선택지에 맞춤
+MENUS = ["아메리카노", "카페라떼", "바닐라라떼", "카라멜 마키아또", "카페모카", "녹차라떼", "딸기라떼", "스콘", "마들렌", "크로플"]
+
+INCOME_CATEGORIES = [("매출", 0.8), ("배달 매출", 0.17), ("단체 주문", 0.03)]  # (이름, 매출 비중)
+INCOME_NAMES = [name for name, _ in INCOME_CATEGORIES]
+INCOME_SHARES = [share for _, share in INCOME_CATEGORIES]
+SUPPLY_CATEGORIES = ["원두", "우유", "포장재"]
+MONTHLY_EXPENSES = [("임대료", 1, 0.15), ("공과금", 10, 0.04), ("인건비", 25, 0.25)]  # (이름, 지출일, 월 매출 대비 비율)
+
+
+def _uuid(rng):
+    """ 시드 고정 UUID (UUID PK 모델은 같은 시드면 같은 PK → 실행 간 결과 비교 가능) """
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _bulk_create(model, objs, chunk_size):
+    """ 이터러블을 chunk_size 개씩 끊어 bulk_create (전체를 메모리에 올리지 않음) """
+    objs = iter(objs)
+    created = 0
+    while batch := list(islice(objs, chunk_size)):
+        model.objects.bulk_create(batch, batch_size=chunk_size)
+        created += len(batch)
+    return created
+
+
+class Command(BaseCommand):
+    help = (
+        "벤치마크용 대용량 합성 데이터를 생성합니다. "
+        "사용자 / 상점 / 재료 / 재고 / 레시피(RecipeItem 구성) / 수년 치 가계부 거래 내역(추세 + 요일 + 계절성). "
+        "같은 시드면 항상 같은 데이터가 만들어집니다. "
+        "PK 도 UUID 를 쓰는 상점 / 재료 / 레시피 / 거래 내역은 같고, 정수 자동 증가 PK(재고 / RecipeItem)는 DB 가 정합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=10, help="사용자 수 (기본 10)")
+        parser.add_argument("--stores-per-user", type=int, default=2, help="사용자당 상점 수 (기본 2)")
+        parser.add_argument("--ingredients", type=int, default=40, help="상점당 재료 수 (기본 40)")
+        parser.add_argument("--recipes", type=int, default=30, help="상점당 레시피 수 (기본 30)")
+        parser.add_argument("--items-per-recipe", type=int, default=6, help="레시피당 최대 재료 수 (기본 6)")
+        parser.add_argument("--days", type=int, default=730, help="거래 내역 일수, 오늘까지 (기본 730)")
+        parser.add_argument("--sales-per-day", type=int, default=8, help="하루 평균 수입 거래 건수 (기본 8)")
+        parser.add_argument("--seed", type=int, default=42, help="난수 시드 (기본 42)")
+        parser.add_argument("--chunk-size", type=int, default=5000, help="bulk_create 한 번에 넣을 행 수 (기본 5000)")
+        parser.add_argument("--clear", action="store_true", help=f"기존 벤치 사용자(*@{EMAIL_DOMAIN})와 데이터를 먼저 삭제")
+
+    def handle(self, *args, **options):
+        bench_users = CustomUser.objects.filter(email__endswith=f"@{EMAIL_DOMAIN}")
+        if options["clear"]:
+            deleted, _ = bench_users.delete()
+            self.stderr.write(f"🧹 기존 벤치 데이터 {deleted}행 삭제")
+        elif bench_users.exists():
+            raise CommandError(f"이미 벤치 사용자(*@{EMAIL_DOMAIN})가 있습니다. --clear 로 먼저 삭제하세요.")
+
+        rng = random.Random(options["seed"])
+        chunk_size = options["chunk_size"]
+        n_stores = options["users"] * options["stores_per_user"]
+        started = time.perf_counter()
+
+        categories = {
+            name: Category.objects.get_or_create(name=name)[0]
+            for name in INCOME_NAMES + SUPPLY_CATEGORIES + [name for name, _, _ in MONTHLY_EXPENSES]
+        }
+
+        # ✅ 상점별 일 매출 [상점 수 × 일수] (salesforecast 백테스트와 같은 합성 모델)
+        _, revenue = synthetic_ledger(n_stores, options["days"], seed=options["seed"])
+        first_day = localdate() - timedelta(days=options["days"] - 1)
+
+        password = make_password(None)  # 로그인 불가 (토큰은 loadtest 가 직접 발급)
+        users = [
+            CustomUser(email=f"bench-{i:05d}@{EMAIL_DOMAIN}", password=password, first_name="벤치", last_name=f"{i:05d}")
+            for i in range(options["users"])
+        ]
+        stores = [
+            Store(id=_uuid(rng), user=user, name=f"벤치 카페 {i:05d}-{j}")
+            for i, user in enumerate(users) for j in range(options["stores_per_user"])
+        ]
+
+        counts = {}
+        with transaction.atomic():
+            counts["users"] = _bulk_create(CustomUser, users, chunk_size)
+            users = {user.email: user for user in CustomUser.objects.filter(email__endswith=f"@{EMAIL_DOMAIN}")}  # PK 확보
+            for store in stores:
+                store.user = users[store.user.email]
+            counts["stores"] = _bulk_create(Store, stores, chunk_size)
+
+            ingredients = self._ingredients(rng, stores, options["ingredients"])
+            counts["ingredients"] = _bulk_create(Ingredient, (ing for store_ings in ingredients.values() for ing in store_ings), chunk_size)
+            counts["inventories"] = _bulk_create(Inventory, self._inventories(rng, ingredients), chunk_size)
+
+            recipes, items = self._recipes(rng, ingredients, options["recipes"], options["items_per_recipe"])
+            counts["recipes"] = _bulk_create(Recipe, recipes, chunk_size)
+            counts["recipe_items"] = _bulk_create(RecipeItem, items, chunk_size)
+
+        self.stderr.write(f"✅ 기본 데이터 {counts} ({time.perf_counter() - started:.1f}초)")
+
+        # ✅ 거래 내역은 상점 단위로 커밋 (중간에 끊겨도 진행분은 남음)
+        counts["transactions"] = 0
+        for index, store in enumerate(stores):
+            with transaction.atomic():
+                counts["transactions"] += _bulk_create(
+                    Transaction,
+                    self._transactions(rng, store, revenue[index], first_day, options["sales_per_day"], categories),
+                    chunk_size,
+                )
+            if (index + 1) % 10 == 0 or index + 1 == len(stores):
+                self.stderr.write(f"  거래 내역 {index + 1}/{len(stores)} 상점, {counts['transactions']}행 ({time.perf_counter() - started:.1f}초)")
+
+        self.stdout.write(self.style.SUCCESS(f"✅ 벤치 데이터 생성 완료 {counts} ({time.perf_counter() - started:.1f}초)"))
+
+    def _ingredients(self, rng, stores, per_store):
+        """ 상점 → 재료 목록 """
+        result = {}
+        for store in stores:
+            result[store.id] = []
+            for i in range(per_store):
+                name, unit = INGREDIENTS[i % len(INGREDIENTS)]
+                quantity = {"g": 1000, "ml": 1000, "ea": 100}[unit] * rng.choice([1, 2, 5])
+                result[store.id].append(Ingredient(
+                    id=_uuid(rng), store=store, name=f"{name} {i // len(INGREDIENTS) + 1}", unit=unit,
+                    purchase_price=Decimal(rng.randrange(3000, 60000, 100)), purchase_quantity=Decimal(quantity),
+                    vendor=rng.choice(["도매상 A", "도매상 B", None]),
+                ))
+        return result
+
+    def _inventories(self, rng, ingredients):
+        for store_ingredients in ingredients.values():
+            for ingredient in store_ingredients:
+                quantity = float(ingredient.purchase_quantity)
+                yield Inventory(
+                    ingredient=ingredient,
+                    remaining_stock=round(rng.uniform(0, 2) * quantity, 2),
+                    reorder_threshold=round(quantity * 0.3, 2),
+                )
+
+    def _recipes(self, rng, ingredients, per_store, max_items):
+        """ 레시피와 RecipeItem (재료 구성), 원가는 구성 재료 단가로 계산해 함께 저장 """
+        recipes, items = [], []
+        for store_id, store_ingredients in ingredients.items():
+            for i in range(per_store):
+                recipe = Recipe(
+                    id=_uuid(rng), store_id=store_id, name=f"{MENUS[i % len(MENUS)]} {i // len(MENUS) + 1}",
+                    sales_price_per_item=rng.randrange(3000, 7500, 500), is_favorites=rng.random() < 0.1,
+                )
+                total_cost = Decimal(0)
+                for ingredient in rng.sample(store_ingredients, min(len(store_ingredients), rng.randint(2, max(2, max_items)))):
+                    quantity = Decimal(rng.randint(5, 50))
+                    total_cost += ingredient.unit_cost * quantity
+                    items.append(RecipeItem(recipe=recipe, ingredient=ingredient, quantity_used=quantity, unit=RECIPE_ITEM_UNITS[ingredient.unit]))
+                recipe.total_ingredient_cost = recipe.production_cost = round(total_cost, 2)
+                recipes.append(recipe)
+        return recipes, items
+
+    def _transactions(self, rng, store, daily_revenue, first_day, sales_per_day, categories):
+        """ 일 매출을 여러 건의 수입으로 나누고, 재료 구매(수시) / 고정비(월별) 지출을 붙인다 """
+        monthly_revenue = daily_revenue.mean() * 30
+        for offset, revenue in enumerate(daily_revenue):
+            day = first_day + timedelta(days=offset)
+            if revenue > 0:
+                count = max(1, round(rng.gauss(sales_per_day, sales_per_day / 4)))
+                weights = [rng.random() for _ in range(count)]
+                weight_total = sum(weights)
+                for weight in weights:
+                    name = rng.choices(INCOME_NAMES, INCOME_SHARES)[0]
+                    yield Transaction(
+                        id=_uuid(rng), user_id=store.user_id, store=store, category=categories[name], transaction_type="income",
+                        amount=Decimal(int(round(revenue * weight / weight_total, -1))), date=day,
+                    )
+
+            if rng.random() < 0.3:  # 재료 구매
+                name = rng.choice(SUPPLY_CATEGORIES)
+                yield Transaction(
+                    id=_uuid(rng), user_id=store.user_id, store=store, category=categories[name], transaction_type="expense",
+                    amount=Decimal(int(round(monthly_revenue * rng.uniform(0.01, 0.04), -2))), date=day, description=f"{name} 구매",
+                )
+
+            for name, pay_day, ratio in MONTHLY_EXPENSES:
+                if day.day == pay_day:
+                    yield Transaction(
+                        id=_uuid(rng), user_id=store.user_id, store=store, category=categories[name], transaction_type="expense",
+                        amount=Decimal(int(round(monthly_revenue * ratio * rng.uniform(0.9, 1.1), -2))), date=day,
+                    )
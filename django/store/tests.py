@@ -1,3 +1,9 @@
-from django.test import TestCase
+from livflow.testing import QueryBudgetTestCase
 
-# Create your tests here.
+
+class StoreQueryBudgetTests(QueryBudgetTestCase):
+    def test_store_list(self):
+        self.assertQueryBudget(2, lambda client, store: client.get("/api/stores/"))
+
+    def test_store_detail(self):
+        self.assertQueryBudget(1, lambda client, store: client.get(f"/api/stores/{store.id}/"))
@@ -12,6 +12,7 @@ from .serializers import StoreSerializer
 from rest_framework_simplejwt.tokens import RefreshToken
 from datetime import datetime
 from django.db.models import Sum
+from collections import defaultdict
 
 class StoreListView(APIView):
     permission_classes = [IsAuthenticated]
@@ -32,25 +33,23 @@ class StoreListView(APIView):
         target_year = now.year
         target_month = now.month
 
-        for store in stores:
-            # 🔹 수입(income) 상위 3개 카테고리
-            income_transactions = Transaction.objects.filter(
-                store=store, transaction_type="income",
-                date__year=target_year, date__month=target_month
-            ).values("transaction_type", "category__name").annotate(
-                total=Sum("amount")
-            ).order_by("-total")[:5]
-
-            # 🔹 지출(expense) 상위 3개 카테고리
-            expense_transactions = Transaction.objects.filter(
-                store=store, transaction_type="expense",
-                date__year=target_year, date__month=target_month
-            ).values("transaction_type", "category__name").annotate(
-                total=Sum("amount")
-            ).order_by("-total")[:5]
+        # ✅ 모든 가게의 카테고리별 합계를 GROUP BY 한 번으로 조회 (가게마다 쿼리 X)
+        totals = Transaction.objects.filter(
+            store__user=request.user, date__year=target_year, date__month=target_month
+        ).values("store_id", "transaction_type", "category__name").annotate(
+            total=Sum("amount")
+        ).order_by("-total")
+
+        # 🔹 가게별 수입 / 지출 상위 5개 카테고리
+        top_categories = defaultdict(lambda: {"income": [], "expense": []})
+        for t in totals:
+            bucket = top_categories[t["store_id"]][t["transaction_type"]]
+            if len(bucket) < 5:
+                bucket.append(t)
 
+        for store in stores:
             # 🔹 수입/지출 합쳐서 chart 데이터 생성
-            transactions = list(income_transactions) + list(expense_transactions)
+            transactions = top_categories[store.id]["income"] + top_categories[store.id]["expense"]
 
             chart_data = [
                 {
@@ -0,0 +1,147 @@
+"""
+JWT 인증 시 사용자 조회 캐시
+
+simplejwt 의 JWTAuthentication 은 요청마다 CustomUser 를 PK 로 조회한다.
+여기서는 프로세스 내 짧은 TTL 캐시(기본 30초) → (선택) Redis → DB 순으로 사용자를 찾아
+대부분의 API 요청에서 사용자 조회 쿼리를 없앤다.
+CustomUser 가 저장/삭제되면 signals 에서 invalidate_user() 로 캐시를 비운다.
+(다른 프로세스의 로컬 캐시는 TTL 이 지나면 갱신된다)
+"""
+import copy
+import json
+import logging
+import threading
+import time
+import redis
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+from livflow.redis_client import get_redis
+from .revocation import is_revoked
+
+logger = logging.getLogger(__name__)
+
+MAX_LOCAL_USERS = 10000  # 로컬 캐시 최대 사용자 수 (넘으면 비움)
+REDIS_USER_FIELDS = ("id", "email", "first_name", "last_name", "is_active", "is_staff", "is_superuser")
+PASSWORD_DIGEST_KEY = "password_digest"
+
+_local = {}  # user_id → (user, 만료 시각 monotonic)
+_local_lock = threading.Lock()
+
+
+def user_cache_key(user_id):
+    return f"auth_user:{user_id}"
+
+
+def _serialize_user(user):
+    """ Redis 에는 인증에 필요한 필드만 저장 (password 해시 제외) """
+    values = {name: getattr(user, name) for name in REDIS_USER_FIELDS}
+    if api_settings.CHECK_REVOKE_TOKEN:
+        values[PASSWORD_DIGEST_KEY] = get_md5_hash_password(user.password)  # 토큰 클레임과 같은 값
+    return json.dumps(values, cls=DjangoJSONEncoder)
+
+
+def _deserialize_user(raw):
+    """ 저장하지 않은 필드(password 등)는 지연 로딩 필드로 둔다 → save() 해도 덮어쓰지 않음 """
+    user_model = get_user_model()
+    values = json.loads(raw)
+    fields = [field for field in user_model._meta.concrete_fields if field.attname in values]
+    user = user_model.from_db("default", [field.attname for field in fields], [field.to_python(values[field.attname]) for field in fields])
+    user._password_digest = values.get(PASSWORD_DIGEST_KEY)
+    return user
+
+
+def get_cached_user(user_id):
+    """ 캐시된 사용자 (없으면 None). 요청 간 상태가 섞이지 않도록 사본을 반환한다. """
+    key = str(user_id)
+    with _local_lock:
+        item = _local.get(key)
+    if item is not None and item[1] > time.monotonic():
+        return copy.copy(item[0])
+
+    if not settings.USER_CACHE_REDIS:
+        return None
+
+    try:
+        raw = get_redis().get(user_cache_key(key))
+    except redis.RedisError as e:
+        logger.warning("사용자 캐시 Redis 조회 실패: %s", e)
+        return None
+    if raw is None:
+        return None
+
+    user = _deserialize_user(raw)
+    _store_local(key, user)
+    return copy.copy(user)
+
+
+def cache_user(user):
+    key = str(user.pk)
+    _store_local(key, copy.copy(user))
+
+    if settings.USER_CACHE_REDIS:
+        try:
+            get_redis().setex(user_cache_key(key), settings.USER_CACHE_REDIS_TTL, _serialize_user(user))
+        except redis.RedisError as e:
+            logger.warning("사용자 캐시 Redis 저장 실패: %s", e)
+
+
+def _store_local(key, user):
+    with _local_lock:
+        if len(_local) >= MAX_LOCAL_USERS:
+            _local.clear()
+        _local[key] = (user, time.monotonic() + settings.USER_CACHE_TTL)
+
+
+def invalidate_user(user_id):
+    """ 사용자 정보 변경/비활성화/삭제 시 캐시 제거 """
+    key = str(user_id)
+    with _local_lock:
+        _local.pop(key, None)
+
+    if settings.USER_CACHE_REDIS:
+        try:
+            get_redis().delete(user_cache_key(key))
+        except redis.RedisError as e:
+            logger.warning("사용자 캐시 Redis 삭제 실패: %s", e)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    사용자 조회를 캐시하는 JWTAuthentication (활성/비밀번호 변경 검사는 그대로 수행)
+    로그아웃으로 폐기된 토큰도 거부한다. (users.revocation)
+    """
+
+    def get_validated_token(self, raw_token):
+        validated_token = super().get_validated_token(raw_token)
+        jti = validated_token.get(api_settings.JTI_CLAIM)
+        if jti and is_revoked(jti):
+            raise InvalidToken("Token is revoked")
+        return validated_token
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken("Token contained no recognizable user identification") from e
+
+        user = get_cached_user(user_id)
+        if user is None:
+            user = super().get_user(validated_token)  # DB 조회 + 검사
+            cache_user(user)
+            return user
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            digest = getattr(user, "_password_digest", None) or get_md5_hash_password(user.password)
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != digest:
+                raise AuthenticationFailed("The user's password has been changed.", code="password_changed")
+
+        return user
@@ -0,0 +1,60 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max, Min
+from django.utils.timezone import now
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+
+class Command(BaseCommand):
+    help = (
+        "만료된 OutstandingToken / BlacklistedToken 을 PK 구간 단위로 나눠 삭제합니다. "
+        "(배치마다 짧은 트랜잭션이라 인증 테이블을 오래 잠그지 않음, cron 등으로 주기 실행)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000, help="한 트랜잭션에서 처리할 PK 구간 크기 (기본 5000)")
+        parser.add_argument("--sleep", type=float, default=0.0, help="배치 사이 대기 시간 (초, 기본 0)")
+        parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상 수만 출력")
+
+    def handle(self, *args, **options):
+        cutoff = now()
+        batch_size = max(options["batch_size"], 1)
+        expired = OutstandingToken.objects.filter(expires_at__lte=cutoff)
+
+        bounds = expired.aggregate(first=Min("id"), last=Max("id"))
+        if bounds["first"] is None:
+            self.stdout.write(self.style.SUCCESS("✅ 만료된 토큰이 없습니다."))
+            return
+
+        if options["dry_run"]:
+            self.stdout.write(f"삭제 대상: OutstandingToken {expired.count()}건, BlacklistedToken {BlacklistedToken.objects.filter(token__expires_at__lte=cutoff).count()}건")
+            return
+
+        started = time.monotonic()
+        deleted_outstanding = deleted_blacklisted = 0
+        for start in range(bounds["first"], bounds["last"] + 1, batch_size):
+            end = start + batch_size
+            with transaction.atomic():
+                # 🔥 같은 구간의 블랙리스트를 먼저 지웠으므로 OutstandingToken 은 _raw_delete 로 바로 DELETE
+                #    (.delete() 는 Collector 가 배치마다 BlacklistedToken CASCADE 조회를 다시 실행)
+                blacklisted, _ = BlacklistedToken.objects.filter(
+                    token_id__gte=start, token_id__lt=end, token__expires_at__lte=cutoff
+                ).delete()
+                outstanding = expired.filter(id__gte=start, id__lt=end)._raw_delete(expired.db)
+
+            deleted_blacklisted += blacklisted
+            deleted_outstanding += outstanding
+            if outstanding:
+                elapsed = time.monotonic() - started
+                rate = (deleted_outstanding + deleted_blacklisted) / elapsed if elapsed else 0
+                self.stdout.write(f"[id {start}~{end - 1}] 누적 {deleted_outstanding + deleted_blacklisted}건 ({rate:.0f}건/초)")
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        elapsed = time.monotonic() - started
+        total = deleted_outstanding + deleted_blacklisted
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 만료 토큰 정리 완료: OutstandingToken {deleted_outstanding}건, BlacklistedToken {deleted_blacklisted}건 "
+            f"({elapsed:.1f}초, {total / elapsed if elapsed else 0:.0f}건/초)"
+        ))
@@ -0,0 +1,230 @@
+"""
+소셜 로그인(OAuth) 제공자 HTTP 클라이언트
+
+- 제공자별 keep-alive requests.Session (프로세스별 지연 생성) → TLS 연결 재사용
+- 연결/응답 타임아웃 → 느린 제공자가 워커를 붙잡지 않음
+- 재시도는 연결 실패에만 (요청이 전송되지 않았으므로 POST 도 안전), 응답 지연/5xx 는 재시도하지 않음
+- 제공자/엔드포인트별 호출 수, 실패 수, 지연 시간 집계 (get_metrics)
+- ASGI 용 비동기 호출 (async_request): httpx.AsyncClient 를 이벤트 루프 · 제공자별로 재사용
+- 제공자별 토큰 교환 요청 / 사용자 정보 파싱 (token_request, parse_user_info): 동기 · 비동기 로그인 뷰 공용
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+import weakref
+import httpx
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+ENDPOINTS = {
+    "kakao": {
+        "token": "https://kauth.kakao.com/oauth/token",
+        "userinfo": "https://kapi.kakao.com/v2/user/me",
+    },
+    "google": {
+        "token": "https://oauth2.googleapis.com/token",
+        "userinfo": "https://www.googleapis.com/oauth2/v3/userinfo",
+    },
+    "naver": {
+        "token": "https://nid.naver.com/oauth2.0/token",
+        "userinfo": "https://openapi.naver.com/v1/nid/me",
+    },
+}
+
+REQUIRED_FIELDS = {
+    "kakao": ("code",),
+    "google": ("code",),
+    "naver": ("code", "state"),
+}
+
+_sessions = {}
+_sessions_pid = None
+_sessions_lock = threading.Lock()
+
+_async_clients = weakref.WeakKeyDictionary()  # 이벤트 루프 → {provider: httpx.AsyncClient}
+
+_metrics = {}  # (provider, endpoint) → {"count", "errors", "total_ms", "max_ms"}
+_metrics_lock = threading.Lock()
+
+
+def get_endpoint(provider, endpoint):
+    """ 엔드포인트 URL (settings.OAUTH_ENDPOINTS 로 덮어쓸 수 있음, 테스트용 스텁 서버 등) """
+    overrides = settings.OAUTH_ENDPOINTS.get(provider, {})
+    return overrides.get(endpoint) or ENDPOINTS[provider][endpoint]
+
+
+def token_request(provider, payload):
+    """ 인가 코드 → 토큰 교환 요청 (data, headers). payload 는 콜백 요청 본문 """
+    prefix = provider.upper()
+    data = {
+        "grant_type": "authorization_code",
+        "client_id": os.getenv(f"{prefix}_CLIENT_ID"),
+        "client_secret": os.getenv(f"{prefix}_CLIENT_SECRET"),
+        "code": payload.get("code"),
+    }
+    if provider == "naver":
+        data["state"] = payload.get("state")
+    else:
+        data["redirect_uri"] = os.getenv(f"{prefix}_REDIRECT_URI")
+
+    headers = {"Accept": "application/x-www-form-urlencoded"} if provider == "google" else None
+    return data, headers
+
+
+def _parse_kakao(user_info):
+    kakao_account = user_info.get("kakao_account", {})
+    if not kakao_account:
+        return None, None, "Invalid Kakao response, kakao_account missing"
+
+    # ✅ 이메일 제공 동의 여부 체크
+    if kakao_account.get("email_needs_agreement", False):
+        return None, None, "User did not agree to share email"
+
+    email = kakao_account.get("email")
+    if not email:
+        return None, None, "Email not found in user info"
+    return email, "", None
+
+
+def _parse_google(user_info):
+    email = user_info.get("email")
+    if not email:
+        return None, None, "Email not found in user info"
+    return email, user_info.get("name", "").strip(), None
+
+
+def _parse_naver(user_info):
+    return _parse_google(user_info.get("response", {}))  # 네이버는 response 안에 같은 형식
+
+
+_USER_INFO_PARSERS = {"kakao": _parse_kakao, "google": _parse_google, "naver": _parse_naver}
+
+
+def parse_user_info(provider, user_info):
+    """ 제공자 사용자 정보 응답 → (email, full_name, 오류 메시지) """
+    return _USER_INFO_PARSERS[provider](user_info)
+
+
+def _new_session():
+    retry = Retry(
+        total=settings.OAUTH_CONNECT_RETRIES,
+        connect=settings.OAUTH_CONNECT_RETRIES,
+        read=False,  # 응답 지연은 재시도하지 않고 ReadTimeout 그대로 전달
+        status=0,
+        other=0,
+        backoff_factor=0.1,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=settings.OAUTH_POOL_SIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session(provider):
+    """ 제공자별 공용 세션 (fork 된 워커는 새로 만든다) """
+    global _sessions_pid
+
+    pid = os.getpid()
+    with _sessions_lock:
+        if _sessions_pid != pid:
+            _sessions.clear()
+            _sessions_pid = pid
+        session = _sessions.get(provider)
+        if session is None:
+            session = _sessions[provider] = _new_session()
+    return session
+
+
+def _record(provider, endpoint, elapsed_ms, failed):
+    with _metrics_lock:
+        stats = _metrics.setdefault((provider, endpoint), {"count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0})
+        stats["count"] += 1
+        stats["errors"] += failed
+        stats["total_ms"] += elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+
+def request(provider, method, endpoint, **kwargs):
+    """
+    제공자 엔드포인트 호출. 타임아웃은 (연결, 응답) 설정값을 기본으로 사용한다.
+    실패 시 requests.exceptions.RequestException 을 그대로 올린다.
+    """
+    kwargs.setdefault("timeout", (settings.OAUTH_CONNECT_TIMEOUT, settings.OAUTH_READ_TIMEOUT))
+    started = time.perf_counter()
+    failed = True
+    try:
+        response = get_session(provider).request(method, get_endpoint(provider, endpoint), **kwargs)
+        failed = response.status_code >= 500
+        return response
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        _record(provider, endpoint, elapsed_ms, failed)
+        logger.debug("OAuth %s %s %.1fms%s", provider, endpoint, elapsed_ms, " (실패)" if failed else "")
+
+
+def post(provider, endpoint, **kwargs):
+    return request(provider, "POST", endpoint, **kwargs)
+
+
+def get(provider, endpoint, **kwargs):
+    return request(provider, "GET", endpoint, **kwargs)
+
+
+def get_async_client(provider):
+    """
+    현재 이벤트 루프의 제공자별 AsyncClient (ASGI 워커는 루프가 하나라 프로세스당 하나).
+    httpx 의 transport 재시도는 연결 실패에만 적용된다.
+    """
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(provider)
+    if client is None:
+        client = clients[provider] = httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.OAUTH_READ_TIMEOUT, connect=settings.OAUTH_CONNECT_TIMEOUT),
+            limits=httpx.Limits(max_connections=settings.OAUTH_POOL_SIZE, max_keepalive_connections=settings.OAUTH_POOL_SIZE),
+            transport=httpx.AsyncHTTPTransport(retries=settings.OAUTH_CONNECT_RETRIES),
+        )
+    return client
+
+
+async def async_request(provider, method, endpoint, **kwargs):
+    """ request() 의 비동기 버전. 실패 시 httpx.HTTPError 를 그대로 올린다. """
+    started = time.perf_counter()
+    failed = True
+    try:
+        response = await get_async_client(provider).request(method, get_endpoint(provider, endpoint), **kwargs)
+        failed = response.status_code >= 500
+        return response
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        _record(provider, endpoint, elapsed_ms, failed)
+        logger.debug("OAuth %s %s %.1fms%s", provider, endpoint, elapsed_ms, " (실패)" if failed else "")
+
+
+async def async_post(provider, endpoint, **kwargs):
+    return await async_request(provider, "POST", endpoint, **kwargs)
+
+
+async def async_get(provider, endpoint, **kwargs):
+    return await async_request(provider, "GET", endpoint, **kwargs)
+
+
+def get_metrics():
+    """ 제공자/엔드포인트별 호출 통계 사본 (평균 지연 포함) """
+    with _metrics_lock:
+        return {
+            f"{provider}.{endpoint}": {**stats, "avg_ms": stats["total_ms"] / stats["count"]}
+            for (provider, endpoint), stats in _metrics.items()
+        }
+
+
+def reset_metrics():
+    with _metrics_lock:
+        _metrics.clear()
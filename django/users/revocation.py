@@ -0,0 +1,159 @@
+"""
+폐기(로그아웃)된 액세스 토큰 확인
+
+- 폐기된 jti 는 Redis 에 "revoked_token:<jti>" (TTL = 토큰 남은 만료 시간) 와
+  Sorted Set "revoked_jtis" (score = 만료 시각) 로 기록한다. DB 블랙리스트는 그대로 원본으로 둔다.
+- 각 프로세스는 Sorted Set + DB 블랙리스트(만료 전)로 Bloom 필터를 만들어 두고 REVOCATION_BLOOM_REFRESH 초마다 다시 만든다.
+  Redis 장애 중에 폐기되어 DB 에만 있는 jti 는 갱신 때 Redis 에 다시 기록한다.
+- 요청마다 Bloom 필터만 확인하고, "있을 수도 있음" 인 경우에만 Redis 로 확정한다.
+  → 폐기되지 않은 토큰은 네트워크 / DB 접근 없이 판정
+- Redis 에 연결할 수 없으면(단일 서버 InMemory 구성 등) DB 블랙리스트로 필터를 만들고,
+  양성 판정도 DB 로 확정한다. 갱신은 주기마다 한 번만 시도한다.
+- 다른 워커(프로세스)에서 폐기한 토큰은 그 워커의 필터가 다시 만들어질 때까지,
+  즉 최대 REVOCATION_BLOOM_REFRESH 초 동안 유효하게 통과할 수 있다.
+"""
+import hashlib
+import logging
+import math
+import threading
+import time
+import redis
+from django.conf import settings
+from django.db import DatabaseError
+from livflow.redis_client import get_redis, pipeline
+
+logger = logging.getLogger(__name__)
+
+REVOKED_SET_KEY = "revoked_jtis"
+
+
+def revoked_token_key(jti):
+    return f"revoked_token:{jti}"
+
+
+class BloomFilter:
+    """ 고정 크기 Bloom 필터 (blake2b 이중 해싱) """
+
+    def __init__(self, capacity, error_rate):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+_bloom = None  # 마지막으로 만든 필터 (None 이면 아직 만들지 못함)
+_bloom_from_db = False  # True 면 Redis 장애로 DB 블랙리스트에서 만든 필터 → 양성도 DB 로 확정
+_bloom_loaded_at = 0.0
+_refresh_lock = threading.Lock()
+
+
+def _revoked_jtis_from_redis():
+    now = time.time()
+    with pipeline() as pipe:
+        pipe.zremrangebyscore(REVOKED_SET_KEY, "-inf", now)
+        pipe.zrangebyscore(REVOKED_SET_KEY, now, "+inf")
+        _, jtis = pipe.execute()
+    return jtis
+
+
+def _revoked_jtis_from_db():
+    """ 만료되지 않은 DB 블랙리스트 {jti: 만료 시각 epoch 초} """
+    from django.utils.timezone import now
+    from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+    rows = BlacklistedToken.objects.filter(token__expires_at__gt=now()).values_list("token__jti", "token__expires_at")
+    return {jti: expires_at.timestamp() for jti, expires_at in rows}
+
+
+def _resync_to_redis(revoked):
+    """ Redis 장애 중 폐기되어 DB 에만 있는 jti 를 Redis 에 다시 기록 """
+    with pipeline(transaction=True) as pipe:
+        for jti, exp in revoked.items():
+            ttl = int(exp - time.time())
+            if ttl > 0:
+                pipe.setex(revoked_token_key(jti), ttl, 1)
+                pipe.zadd(REVOKED_SET_KEY, {jti: exp})
+
+
+def _refresh_bloom():
+    """
+    만료되지 않은 폐기 jti(Redis + DB 블랙리스트)로 필터를 새로 만들어 교체 (한 스레드만 갱신).
+    Redis 장애 시 DB 블랙리스트만으로 만들고, DB 조회가 실패하면 기존 필터 유지.
+    """
+    global _bloom, _bloom_from_db, _bloom_loaded_at
+
+    if not _refresh_lock.acquire(blocking=False):
+        return
+    try:
+        revoked = _revoked_jtis_from_db()
+        try:
+            jtis = set(_revoked_jtis_from_redis())
+            missing = {jti: exp for jti, exp in revoked.items() if jti not in jtis}
+            if missing:
+                _resync_to_redis(missing)
+                logger.info("DB 에만 있던 폐기 토큰 %d개 Redis 에 다시 기록", len(missing))
+            from_db = False
+        except redis.RedisError as e:
+            logger.warning("폐기 토큰 Redis 조회 실패, DB 블랙리스트로 필터 생성: %s", e)
+            jtis, from_db = set(), True
+        jtis.update(revoked)
+
+        bloom = BloomFilter(max(settings.REVOCATION_BLOOM_CAPACITY, len(jtis) * 2), settings.REVOCATION_BLOOM_ERROR_RATE)
+        for jti in jtis:
+            bloom.add(jti)
+        _bloom, _bloom_from_db = bloom, from_db
+    except DatabaseError as e:
+        logger.warning("폐기 토큰 Bloom 필터 갱신 실패: %s", e)
+    finally:
+        _bloom_loaded_at = time.monotonic()  # 실패해도 다음 주기까지 재시도하지 않음
+        _refresh_lock.release()
+
+
+def revoke_token(jti, exp):
+    """ 토큰 폐기 기록 (exp: 토큰 만료 시각 epoch 초). 현재 프로세스 필터에는 바로 반영 """
+    ttl = int(exp - time.time())
+    if ttl <= 0:
+        return
+
+    try:
+        with pipeline(transaction=True) as pipe:
+            pipe.setex(revoked_token_key(jti), ttl, 1)
+            pipe.zadd(REVOKED_SET_KEY, {jti: exp})
+    except redis.RedisError as e:
+        logger.warning("폐기 토큰 Redis 기록 실패: %s", e)
+
+    if _bloom is not None:
+        _bloom.add(jti)
+
+
+def is_revoked(jti):
+    """ 폐기된 토큰인지 확인 (대부분 메모리 내 Bloom 필터만으로 판정) """
+    if time.monotonic() - _bloom_loaded_at > settings.REVOCATION_BLOOM_REFRESH:
+        _refresh_bloom()
+
+    bloom = _bloom
+    if bloom is not None and jti not in bloom:
+        return False
+
+    # Bloom 필터 양성(또는 필터 없음) → Redis 로 확정, Redis 장애 시 DB 블랙리스트 확인
+    if not _bloom_from_db:
+        try:
+            return bool(get_redis().exists(revoked_token_key(jti)))
+        except redis.RedisError as e:
+            logger.warning("폐기 토큰 Redis 확인 실패, DB로 대체: %s", e)
+
+    from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+    return BlacklistedToken.objects.filter(token__jti=jti).exists()
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .authentication import invalidate_user
+from .models import CustomUser
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """ ✅ 사용자 저장(비활성화 포함)/삭제 시 인증 캐시 제거 """
+    invalidate_user(instance.pk)
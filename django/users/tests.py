@@ -1,3 +1,353 @@
-from django.test import TestCase
+import json
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from unittest import mock
+import requests
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from users import authentication, oauth_client, revocation
+from users.models import CustomUser
+from users.token_store import BaseTokenStore, InMemoryTokenStore, RedisTokenStore, get_token_store
+from users.views.async_auth_view import AsyncSocialLoginView
 
-# Create your tests here.
+
+class StubProviderHandler(BaseHTTPRequestHandler):
+    """ 로컬 스텁 OAuth 제공자 (/token, /userinfo, /slow) """
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, payload, status=200):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.server.connections.add(self.client_address)
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path == "/token":
+            self._send_json({"access_token": "stub-access-token"})
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        if self.path == "/userinfo":
+            self._send_json({"kakao_account": {"email": "stub@example.com", "email_needs_agreement": False}})
+        elif self.path == "/slow":
+            time.sleep(0.5)
+            self._send_json({})
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+
+class StubProviderMixin:
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubProviderHandler)
+        cls.server.connections = set()
+        cls.server.handle_error = lambda request, client_address: None  # 타임아웃 테스트에서 끊긴 연결 무시
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        super().setUp()
+        self.server.connections.clear()
+        oauth_client.reset_metrics()
+        oauth_client._sessions.clear()
+
+    def endpoints(self, **paths):
+        return {"kakao": {name: f"{self.base_url}{path}" for name, path in paths.items()}}
+
+
+def closed_port():
+    """ 아무도 듣고 있지 않은 로컬 포트 """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class OAuthClientTests(StubProviderMixin, SimpleTestCase):
+    def test_session_reuses_connection(self):
+        with override_settings(OAUTH_ENDPOINTS=self.endpoints(token="/token", userinfo="/userinfo")):
+            oauth_client.post("kakao", "token", data={"code": "x"})
+            oauth_client.get("kakao", "userinfo")
+            oauth_client.get("kakao", "userinfo")
+
+        self.assertEqual(len(self.server.connections), 1)
+
+    @override_settings(OAUTH_READ_TIMEOUT=0.1)
+    def test_read_timeout_is_not_retried(self):
+        with override_settings(OAUTH_ENDPOINTS=self.endpoints(userinfo="/slow")):
+            started = time.perf_counter()
+            with self.assertRaises(requests.exceptions.Timeout):
+                oauth_client.get("kakao", "userinfo")
+
+        self.assertLess(time.perf_counter() - started, 0.4)
+        self.assertEqual(oauth_client.get_metrics()["kakao.userinfo"]["errors"], 1)
+
+    @override_settings(OAUTH_CONNECT_RETRIES=2)
+    def test_connect_error_is_retried_then_raised(self):
+        endpoints = {"kakao": {"token": f"http://127.0.0.1:{closed_port()}/token"}}
+        with override_settings(OAUTH_ENDPOINTS=endpoints):
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                oauth_client.post("kakao", "token", data={"code": "x"})
+
+        self.assertEqual(oauth_client.get_metrics()["kakao.token"]["count"], 1)
+
+    def test_metrics_record_latency(self):
+        with override_settings(OAUTH_ENDPOINTS=self.endpoints(token="/token")):
+            for _ in range(3):
+                oauth_client.post("kakao", "token", data={"code": "x"})
+
+        stats = oauth_client.get_metrics()["kakao.token"]
+        self.assertEqual(stats["count"], 3)
+        self.assertEqual(stats["errors"], 0)
+        self.assertGreater(stats["max_ms"], 0)
+        self.assertLessEqual(stats["avg_ms"], stats["max_ms"])
+
+
+class OAuthProviderFormatTests(SimpleTestCase):
+    """ 동기 · 비동기 로그인 뷰가 함께 쓰는 제공자별 요청 / 응답 형식 """
+
+    def test_token_request(self):
+        data, headers = oauth_client.token_request("naver", {"code": "c", "state": "s"})
+        self.assertEqual((data["code"], data["state"], headers), ("c", "s", None))
+        self.assertNotIn("redirect_uri", data)
+
+        data, headers = oauth_client.token_request("google", {"code": "c"})
+        self.assertIn("redirect_uri", data)
+        self.assertEqual(headers, {"Accept": "application/x-www-form-urlencoded"})
+
+    def test_parse_user_info(self):
+        cases = [
+            ("kakao", {"kakao_account": {"email": "k@example.com"}}, ("k@example.com", "", None)),
+            ("kakao", {"kakao_account": {"email": "k@example.com", "email_needs_agreement": True}}, (None, None, "User did not agree to share email")),
+            ("kakao", {}, (None, None, "Invalid Kakao response, kakao_account missing")),
+            ("google", {"email": "g@example.com", "name": " 구글 "}, ("g@example.com", "구글", None)),
+            ("naver", {"response": {"email": "n@example.com", "name": "네이버"}}, ("n@example.com", "네이버", None)),
+            ("naver", {"response": {}}, (None, None, "Email not found in user info")),
+        ]
+        for provider, user_info, expected in cases:
+            self.assertEqual(oauth_client.parse_user_info(provider, user_info), expected, provider)
+
+    def test_async_base_view_is_abstract(self):
+        with self.assertRaises(TypeError):
+            AsyncSocialLoginView()
+
+
+@override_settings(TOKEN_STORE_BACKEND="users.token_store.InMemoryTokenStore")
+class KakaoLoginTests(StubProviderMixin, TestCase):
+    def test_login_against_stub_provider(self):
+        with override_settings(OAUTH_ENDPOINTS=self.endpoints(token="/token", userinfo="/userinfo")):
+            response = self.client.post("/api/users/kakao/login/callback/", {"code": "stub-code"}, content_type="application/json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("access", response.json())
+        self.assertEqual(len(self.server.connections), 1)
+
+    async def test_async_login_against_stub_provider(self):
+        with override_settings(OAUTH_ENDPOINTS=self.endpoints(token="/token", userinfo="/userinfo")):
+            response = await self.async_client.post("/api/users/async/kakao/login/callback/", {"code": "stub-code"}, content_type="application/json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("refresh", response.json())
+
+    async def test_async_login_rejects_non_object_json(self):
+        for body in ("[]", '"x"'):
+            response = await self.async_client.post("/api/users/async/kakao/login/callback/", body, content_type="application/json")
+            self.assertEqual(response.status_code, 400)
+
+    async def test_async_provider_error_hides_exception_text(self):
+        endpoints = {"kakao": {"token": f"http://127.0.0.1:{closed_port()}/token"}}
+        with override_settings(OAUTH_ENDPOINTS=endpoints, OAUTH_CONNECT_RETRIES=0):
+            response = await self.async_client.post("/api/users/async/kakao/login/callback/", {"code": "stub-code"}, content_type="application/json")
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json(), {"error": "kakao OAuth Request Failed"})
+
+    def test_provider_error_returns_500(self):
+        with override_settings(OAUTH_ENDPOINTS=self.endpoints(token="/missing")):
+            response = self.client.post("/api/users/kakao/login/callback/", {"code": "stub-code"}, content_type="application/json")
+
+        self.assertEqual(response.status_code, 500)
+
+
+class RevocationWithoutRedisTests(TestCase):
+    """ 테스트 설정의 Redis 는 닫힌 포트 → DB 블랙리스트로 만든 필터 사용 """
+
+    def setUp(self):
+        revocation._bloom = None
+        revocation._bloom_from_db = False
+        revocation._bloom_loaded_at = 0.0
+        user = CustomUser.objects.create_user(email="revoke@example.com")
+        token = OutstandingToken.objects.create(user=user, jti="revoked-jti", token="x", expires_at=now() + timedelta(hours=1))
+        BlacklistedToken.objects.create(token=token)
+
+    def test_filter_is_built_from_db_once(self):
+        self.assertTrue(revocation.is_revoked("revoked-jti"))
+        with self.assertNumQueries(0):
+            for _ in range(3):
+                self.assertFalse(revocation.is_revoked("valid-jti"))
+
+
+class FakeRedis:
+    """ 폐기 목록에 쓰는 명령만 흉내 내는 메모리 Redis (파이프라인은 즉시 실행) """
+
+    def __init__(self):
+        self.keys = {}
+        self.zset = {}
+
+    def setex(self, key, ttl, value):
+        self.keys[key] = value
+
+    def exists(self, key):
+        return int(key in self.keys)
+
+    def zadd(self, key, mapping):
+        self.zset.update(mapping)
+
+    def zremrangebyscore(self, key, low, high):
+        self.zset = {member: score for member, score in self.zset.items() if score > high}
+
+    def zrangebyscore(self, key, low, high):
+        return [member for member, score in self.zset.items() if score >= low]
+
+    def execute(self):
+        return [None, self.zrangebyscore(revocation.REVOKED_SET_KEY, time.time(), "+inf")]
+
+    @contextmanager
+    def pipeline(self, transaction=False):
+        yield self
+
+
+class RevocationRedisRecoveryTests(TestCase):
+    """ Redis 장애 중 폐기 → Redis 복구 → 필터 갱신 후에도 거부 """
+
+    def setUp(self):
+        revocation._bloom = None
+        revocation._bloom_from_db = False
+        revocation._bloom_loaded_at = 0.0
+        self.user = CustomUser.objects.create_user(email="recover@example.com")
+
+    def test_token_revoked_during_outage_stays_revoked(self):
+        exp = now() + timedelta(hours=1)
+        token = OutstandingToken.objects.create(user=self.user, jti="outage-jti", token="x", expires_at=exp)
+        BlacklistedToken.objects.create(token=token)
+        revocation.revoke_token("outage-jti", exp.timestamp())  # Redis 닫힌 포트 → DB 에만 기록
+
+        fake = FakeRedis()
+        with mock.patch.object(revocation, "get_redis", return_value=fake), \
+                mock.patch.object(revocation, "pipeline", fake.pipeline):
+            revocation._bloom_loaded_at = 0.0  # 다음 확인에서 필터 갱신 (다른 워커와 같은 상황)
+            self.assertTrue(revocation.is_revoked("outage-jti"))
+            self.assertFalse(revocation._bloom_from_db)
+            self.assertEqual(fake.exists(revocation.revoked_token_key("outage-jti")), 1)  # Redis 에 다시 기록됨
+            self.assertFalse(revocation.is_revoked("valid-jti"))
+
+
+class UserCacheSerializationTests(TestCase):
+    def test_password_hash_is_not_serialized(self):
+        user = CustomUser.objects.create_user(email="cache@example.com", password="secret-pass")
+        raw = authentication._serialize_user(user)
+        self.assertNotIn("password", json.loads(raw))
+        self.assertNotIn(user.password, raw)
+
+        cached = authentication._deserialize_user(raw)
+        self.assertEqual((cached.pk, cached.email, cached.is_active), (user.pk, user.email, True))
+        self.assertIn("password", cached.get_deferred_fields())
+
+        cached.first_name = "변경"
+        cached.save()  # 지연 로딩 필드는 저장하지 않음
+        user.refresh_from_db()
+        self.assertTrue(user.check_password("secret-pass"))
+
+
+class InMemoryTokenStoreTests(SimpleTestCase):
+    def setUp(self):
+        self.store = InMemoryTokenStore()
+
+    def test_set_get_delete(self):
+        self.assertIsNone(self.store.get("refresh_token:1"))
+        self.store.set("refresh_token:1", "hashed", 60)
+        self.assertEqual(self.store.get("refresh_token:1"), "hashed")
+
+        self.store.delete("refresh_token:1")
+        self.store.delete("refresh_token:1")  # 없는 키 삭제는 무시
+        self.assertIsNone(self.store.get("refresh_token:1"))
+
+    def test_ttl_expiry(self):
+        with mock.patch("users.token_store.time.monotonic", return_value=1000.0):
+            self.store.set("refresh_token:1", "hashed", 60)
+        with mock.patch("users.token_store.time.monotonic", return_value=1059.0):
+            self.assertEqual(self.store.get("refresh_token:1"), "hashed")
+        with mock.patch("users.token_store.time.monotonic", return_value=1060.0):
+            self.assertIsNone(self.store.get("refresh_token:1"))
+        self.assertNotIn("refresh_token:1", self.store._data)
+
+    def test_expired_keys_are_purged_on_write(self):
+        self.store.PURGE_EVERY = 3
+        with mock.patch("users.token_store.time.monotonic", return_value=1000.0):
+            self.store.set("old", "x", 1)
+        with mock.patch("users.token_store.time.monotonic", return_value=2000.0):
+            self.store.set("a", "x", 60)
+            self.store.set("b", "x", 60)
+        self.assertEqual(set(self.store._data), {"a", "b"})
+
+    def test_backend_is_selected_by_settings(self):
+        with override_settings(TOKEN_STORE_BACKEND="users.token_store.InMemoryTokenStore"):
+            store = get_token_store()
+            self.assertIsInstance(store, InMemoryTokenStore)
+            self.assertIs(get_token_store(), store)  # 프로세스당 하나
+        with override_settings(TOKEN_STORE_BACKEND="users.token_store.RedisTokenStore"):
+            self.assertIsInstance(get_token_store(), RedisTokenStore)
+
+    def test_base_store_is_abstract(self):
+        with self.assertRaises(TypeError):
+            BaseTokenStore()
+
+
+class PruneTokensTests(TestCase):
+    def test_deletes_only_expired_tokens_and_their_blacklist_rows(self):
+        user = CustomUser.objects.create_user(email="prune@example.com")
+        expired = [
+            OutstandingToken.objects.create(user=user, jti=f"old-{i}", token="x", expires_at=now() - timedelta(days=1))
+            for i in range(5)
+        ]
+        live = OutstandingToken.objects.create(user=user, jti="live", token="x", expires_at=now() + timedelta(days=1))
+        BlacklistedToken.objects.create(token=expired[0])
+        BlacklistedToken.objects.create(token=live)
+
+        with CaptureQueriesContext(connection) as ctx:
+            call_command("prune_tokens", batch_size=2, stdout=StringIO())
+        outstanding_deletes = [q["sql"] for q in ctx.captured_queries if 'DELETE FROM "token_blacklist_outstandingtoken"' in q["sql"]]
+        self.assertEqual(len(outstanding_deletes), 3)  # 배치마다 DELETE 한 번, CASCADE 조회 없음
+        # Collector 가 만드는 행 조회(SELECT ... outstandingtoken) / CASCADE 삭제(... token_id IN) 가 없어야 한다
+        self.assertFalse(any(
+            q["sql"].startswith('SELECT "token_blacklist_outstandingtoken"."id", ')
+            or '"token_blacklist_blacklistedtoken"."token_id" IN (' in q["sql"]
+            for q in ctx.captured_queries
+        ))
+
+        self.assertEqual(list(OutstandingToken.objects.values_list("jti", flat=True)), ["live"])
+        self.assertEqual(list(BlacklistedToken.objects.values_list("token__jti", flat=True)), ["live"])
@@ -0,0 +1,110 @@
+"""
+리프레시 토큰 저장소 백엔드
+
+settings.TOKEN_STORE_BACKEND 로 선택한다.
+- users.token_store.RedisTokenStore     : 공용 Redis (기본, 다중 서버 배포)
+- users.token_store.InMemoryTokenStore  : 프로세스 내 dict (테스트 / 단일 서버 / 벤치마크용, 외부 서비스 불필요)
+"""
+import threading
+import time
+from abc import ABC, abstractmethod
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+from livflow.redis_client import get_redis
+
+
+class BaseTokenStore(ABC):
+    """ 토큰 저장소 인터페이스 (값은 문자열) """
+
+    @abstractmethod
+    def set(self, key, value, ttl):
+        """ ttl 초 뒤 만료되는 값 저장 """
+
+    @abstractmethod
+    def get(self, key):
+        """ 값 조회 (없거나 만료되면 None) """
+
+    @abstractmethod
+    def delete(self, key):
+        """ 값 삭제 (없으면 무시) """
+
+
+class RedisTokenStore(BaseTokenStore):
+    def set(self, key, value, ttl):
+        get_redis().setex(key, int(ttl), value)
+
+    def get(self, key):
+        return get_redis().get(key)
+
+    def delete(self, key):
+        get_redis().delete(key)
+
+
+class InMemoryTokenStore(BaseTokenStore):
+    """
+    Redis 대신 쓰는 프로세스 내 저장소 (스레드 안전, TTL 지원).
+    만료된 키는 조회 시 지우고, 쓰기가 PURGE_EVERY 번 쌓일 때마다 한 번에 정리한다.
+    """
+    PURGE_EVERY = 1000
+
+    def __init__(self):
+        self._data = {}  # key → (value, 만료 시각 monotonic)
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def set(self, key, value, ttl):
+        expires_at = time.monotonic() + int(ttl)
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._writes += 1
+            if self._writes >= self.PURGE_EVERY:
+                self._purge(time.monotonic())
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def _purge(self, now):
+        self._data = {key: item for key, item in self._data.items() if item[1] > now}
+        self._writes = 0
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_token_store():
+    """ 설정된 토큰 저장소 (프로세스당 인스턴스 하나) """
+    global _store
+
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = import_string(settings.TOKEN_STORE_BACKEND)()
+    return _store
+
+
+@receiver(setting_changed)
+def _reset_token_store(setting, **kwargs):
+    """ 테스트에서 override_settings(TOKEN_STORE_BACKEND=...) 를 쓰면 저장소를 다시 만든다 """
+    global _store
+
+    if setting == "TOKEN_STORE_BACKEND":
+        _store = None
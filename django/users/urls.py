@@ -1,5 +1,10 @@
 from django.urls import path
 
+from .views.async_auth_view import (
+    AsyncGoogleExchangeCodeForToken,
+    AsyncKakaoExchangeCodeForToken,
+    AsyncNaverExchangeCodeForToken,
+)
 from .views.google_auth_view import GoogleExchangeCodeForToken
 from .views.kakao_auth_view import KakaoExchangeCodeForToken
 from .views.naver_auth_view import NaverExchangeCodeForToken
@@ -15,6 +20,10 @@ urlpatterns = [
     path("google/login/callback/", GoogleExchangeCodeForToken.as_view(), name="google_callback"),
     path("naver/login/callback/", NaverExchangeCodeForToken.as_view(), name="naver_callback"),
     path("kakao/login/callback/", KakaoExchangeCodeForToken.as_view(), name="kakao_callback"),
+    # social login endpoint (비동기, ASGI 서버용)
+    path("async/google/login/callback/", AsyncGoogleExchangeCodeForToken.as_view(), name="async_google_callback"),
+    path("async/naver/login/callback/", AsyncNaverExchangeCodeForToken.as_view(), name="async_naver_callback"),
+    path("async/kakao/login/callback/", AsyncKakaoExchangeCodeForToken.as_view(), name="async_kakao_callback"),
     path("logout/", SocialLogout.as_view(), name="logout"),
     # user_auth
     path("token/verify/", UserTokenVerifyView.as_view(), name="token-verify"),
@@ -1,14 +1,7 @@
-import redis
 import hashlib
-from django.conf import settings
-
-# Redis 클라이언트 설정
-redis_client = redis.StrictRedis(
-    host=settings.REDIS_HOST,
-    port=settings.REDIS_PORT,
-    db=settings.REDIS_DB,
-    decode_responses=True
-)
+from datetime import datetime
+from rest_framework_simplejwt.tokens import RefreshToken
+from .token_store import get_token_store
 
 # ✅ 토큰 해싱 함수 (SHA-256)
 def hash_token(token):
@@ -16,23 +9,50 @@ def hash_token(token):
 
 # ✅ 리프레시 토큰 저장 (해싱 후 저장)
 def store_refresh_token(user_id, refresh_token, expires_in):
-    """Redis에 해시된 리프레시 토큰 저장"""
+    """토큰 저장소(기본 Redis)에 해시된 리프레시 토큰 저장"""
     hashed_token = hash_token(refresh_token)
-    redis_client.setex(f"refresh_token:{user_id}", int(expires_in), hashed_token)  
+    get_token_store().set(f"refresh_token:{user_id}", hashed_token, expires_in)  
 
 
 # ✅ 리프레시 토큰 조회 (해시된 토큰 반환)
 def get_refresh_token(user_id):
-    """Redis에서 해시된 리프레시 토큰 조회"""
-    return redis_client.get(f"refresh_token:{user_id}")
+    """토큰 저장소에서 해시된 리프레시 토큰 조회"""
+    return get_token_store().get(f"refresh_token:{user_id}")
 
 # ✅ 리프레시 토큰 삭제
 def delete_refresh_token(user_id):
-    """Redis에서 리프레시 토큰 삭제 (로그아웃 시)"""
-    redis_client.delete(f"refresh_token:{user_id}")
+    """토큰 저장소에서 리프레시 토큰 삭제 (로그아웃 시)"""
+    get_token_store().delete(f"refresh_token:{user_id}")
 
 # ✅ 리프레시 토큰 검증 함수
 def verify_refresh_token(user_id, provided_token):
-    """Redis에 저장된 해시와 비교하여 검증"""
+    """저장된 해시와 비교하여 검증"""
     stored_hashed_token = get_refresh_token(user_id)
     return stored_hashed_token == hash_token(provided_token)
+
+# ✅ 소셜 로그인 성공 시 토큰 발급
+def issue_login_tokens(user):
+    """JWT 발급 후 리프레시 토큰 저장, 액세스 토큰을 OutstandingToken 에 등록 (블랙리스트용)"""
+    from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+    refresh = RefreshToken.for_user(user)
+    access_token_obj = refresh.access_token
+    access_token = str(access_token_obj)
+    refresh_token = str(refresh)
+
+    expires_in = int(access_token_obj['exp'])
+    store_refresh_token(user.id, refresh_token, expires_in)
+
+    OutstandingToken.objects.get_or_create(
+        jti=access_token_obj['jti'],
+        defaults={
+            'user': user,
+            'token': access_token,
+            'expires_at': datetime.fromtimestamp(expires_in),
+        }
+    )
+
+    return {
+        "access": access_token,
+        "refresh": refresh_token,
+    }
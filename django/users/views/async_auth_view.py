@@ -0,0 +1,131 @@
+import json
+import logging
+import math
+from abc import ABC, abstractmethod
+import httpx
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from allauth.socialaccount.models import SocialAccount
+from livflow.throttling import TokenBucketThrottle
+from users import oauth_client
+from users.utils import issue_login_tokens
+
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncSocialLoginView(ABC, View):
+    """
+    소셜 로그인 콜백 비동기 버전 (ASGI 서버에서 사용).
+    제공자 호출(토큰 교환, 사용자 정보)은 httpx 로 await 하므로 응답을 기다리는 동안 워커가 다른 요청을 처리하고,
+    사용자 생성 / 토큰 저장만 sync_to_async 로 실행한다.
+    요청 / 응답 형식은 동기 뷰와 같은 oauth_client.token_request / parse_user_info 를 사용한다.
+    """
+    throttle_scope = "oauth"  # DRF 뷰와 같은 버킷 사용
+
+    @property
+    @abstractmethod
+    def provider(self):
+        """ 제공자 이름 (oauth_client.ENDPOINTS 의 키), 하위 클래스에서 클래스 속성으로 지정 """
+
+    def save_user(self, email, full_name, user_info):
+        user, created = User.objects.get_or_create(email=email, defaults={"first_name": full_name})
+        logger.info("✅ 사용자 %s (신규: %s)", user.pk, created)
+        return user
+
+    def login(self, email, full_name, user_info):
+        user = self.save_user(email, full_name, user_info)
+        return issue_login_tokens(user)
+
+    async def post(self, request, *args, **kwargs):
+        logger.debug("🔍 %s OAuth 비동기 요청 시작", self.provider)
+
+        throttle = TokenBucketThrottle()
+        if not await sync_to_async(throttle.allow_request)(request, self):
+            response = JsonResponse({"error": "Request was throttled."}, status=429)
+            response["Retry-After"] = str(math.ceil(throttle.wait()))
+            return response
+
+        try:
+            payload = json.loads(request.body or b"{}") if request.content_type == "application/json" else request.POST
+        except ValueError:
+            return JsonResponse({"error": "Invalid JSON body"}, status=400)
+        if not isinstance(payload, dict):  # 배열 / 문자열 등 객체가 아닌 JSON (QueryDict 는 dict 하위 클래스)
+            return JsonResponse({"error": "JSON body must be an object"}, status=400)
+
+        required_fields = oauth_client.REQUIRED_FIELDS[self.provider]
+        if any(not payload.get(field) for field in required_fields):
+            logger.error("❌ 필수 값이 없습니다: %s", required_fields)
+            return JsonResponse({"error": f"{' or '.join(required_fields)} is missing"}, status=400)
+
+        data, headers = oauth_client.token_request(self.provider, payload)
+
+        try:
+            response = await oauth_client.async_post(self.provider, "token", data=data, headers=headers)
+            logger.info("📌 %s OAuth 응답 상태 코드: %s", self.provider, response.status_code)
+            response.raise_for_status()
+
+            access_token = response.json().get("access_token")
+            if not access_token:
+                logger.error("❌ %s에서 Access Token을 가져오지 못했습니다.", self.provider)
+                return JsonResponse({"error": "Failed to obtain access token"}, status=400)
+
+            user_info_response = await oauth_client.async_get(
+                self.provider, "userinfo", headers={"Authorization": f"Bearer {access_token}"}
+            )
+            user_info_response.raise_for_status()
+            user_info = user_info_response.json()
+
+            email, full_name, error = oauth_client.parse_user_info(self.provider, user_info)
+            if error:
+                logger.error("❌ %s 사용자 정보 오류: %s", self.provider, error)
+                return JsonResponse({"error": error}, status=400)
+
+            # ✅ DB / 토큰 저장소 작업만 스레드에서 실행
+            tokens = await sync_to_async(self.login)(email, full_name, user_info)
+            return JsonResponse(tokens)
+
+        except httpx.HTTPError as e:
+            logger.error("❌ %s OAuth 요청 실패: %s", self.provider, e)
+            return JsonResponse({"error": f"{self.provider} OAuth Request Failed"}, status=500)
+
+        except Exception:
+            logger.exception("❌ %s 로그인 내부 서버 오류", self.provider)
+            return JsonResponse({"error": "Internal Server Error"}, status=500)
+
+
+class AsyncKakaoExchangeCodeForToken(AsyncSocialLoginView):
+    provider = "kakao"
+
+    def save_user(self, email, full_name, user_info):
+        user, created = User.objects.get_or_create(email=email)
+        logger.info("✅ 사용자 %s (신규: %s)", user.pk, created)
+        return user
+
+
+class AsyncGoogleExchangeCodeForToken(AsyncSocialLoginView):
+    provider = "google"
+
+    def save_user(self, email, full_name, user_info):
+        # ✅ 트랜잭션을 사용하여 User 및 SocialAccount 저장
+        with transaction.atomic():
+            user = super().save_user(email, full_name, user_info)
+            SocialAccount.objects.get_or_create(
+                user=user,
+                provider="google",
+                defaults={"uid": email, "extra_data": user_info}
+            )
+        return user
+
+
+class AsyncNaverExchangeCodeForToken(AsyncSocialLoginView):
+    provider = "naver"
@@ -12,6 +12,10 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.tokens import UntypedToken
 from rest_framework_simplejwt.tokens import AccessToken, TokenError
 
+import logging
+
+from users.authentication import CachedJWTAuthentication
+from users.revocation import revoke_token
 from users.utils import (
     store_refresh_token,
     get_refresh_token,
@@ -19,8 +23,10 @@ from users.utils import (
     verify_refresh_token
 )
 
-# ✅ 쿠키 기반 JWT 인증
-class CookieJWTAuthentication(JWTAuthentication):
+logger = logging.getLogger(__name__)
+
+# ✅ 쿠키 기반 JWT 인증 (사용자 조회 캐시 사용)
+class CookieJWTAuthentication(CachedJWTAuthentication):
     def authenticate(self, request):
         # 쿠키에서 액세스 토큰 가져오기
         raw_token = request.COOKIES.get(settings.SIMPLE_JWT["AUTH_COOKIE"])
@@ -35,7 +41,7 @@ class CookieJWTAuthentication(JWTAuthentication):
 
 
 class UserTokenVerifyView(APIView):
-    authentication_classes = [CookieJWTAuthentication, JWTAuthentication]
+    authentication_classes = [CookieJWTAuthentication, CachedJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request, *args, **kwargs):
@@ -91,6 +97,7 @@ class UserTokenVerifyView(APIView):
 # ✅ 액세스 토큰 재발급
 class RefreshAccessTokenView(APIView):
     permission_classes = [AllowAny]
+    throttle_scope = "token_refresh"
 
     def post(self, request, *args, **kwargs):
         refresh_token = request.data.get("refresh_token")
@@ -127,7 +134,7 @@ class RefreshAccessTokenView(APIView):
 from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
 
 class SocialLogout(APIView):
-    authentication_classes = [CookieJWTAuthentication, JWTAuthentication]
+    authentication_classes = [CookieJWTAuthentication, CachedJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
@@ -152,11 +159,12 @@ class SocialLogout(APIView):
             try:
                 token = AccessToken(raw_token)
                 jti = token['jti']
+                revoke_token(jti, token['exp'])  # ✅ 요청마다 확인하는 폐기 목록 (Redis + Bloom 필터)
                 outstanding_token = OutstandingToken.objects.get(jti=jti)
                 BlacklistedToken.objects.get_or_create(token=outstanding_token)
-                print("✅ 액세스 토큰 블랙리스트에 등록 완료")
+                logger.info("✅ 액세스 토큰 블랙리스트에 등록 완료: %s", jti)
             except Exception as e:
-                print(f"❌ 블랙리스트 추가 실패: {e}")
+                logger.warning("❌ 블랙리스트 추가 실패: %s", e)
 
         response = Response({"message": "Successfully logged out"}, status=status.HTTP_200_OK)
 
@@ -177,6 +185,7 @@ User = get_user_model()
 
 class TestTokenView(APIView):
     permission_classes = [AllowAny]  # ✅ 로그인 없이 접근 가능 (테스트용)
+    throttle_scope = "test_token"
 
     def post(self, request):
         """테스트용 JWT 토큰 생성"""